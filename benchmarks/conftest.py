@@ -0,0 +1,87 @@
+"""Benchmark fixtures: result collection and baseline comparison.
+
+Run with ``pytest benchmarks``. Results are written to
+``benchmarks/results.json``; pass ``--update-baseline`` to store them as
+``benchmarks/baseline.json``, which later runs are compared against.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+BENCH_DIR = Path(__file__).parent
+RESULTS_FILE = BENCH_DIR / "results.json"
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+
+# Metrics where a larger value is a regression; everything else is reported only
+GATED_METRICS = ("wall_time_s", "per_entity_us", "peak_memory_kib", "executor_jobs")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("terra benchmarks")
+    group.addoption(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run's results as the benchmark baseline.",
+    )
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative regression against the baseline (default 0.5).",
+    )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations for all benchmarks."""
+    yield
+
+
+class BenchmarkRecorder:
+    """Collect benchmark metrics and compare them against the baseline."""
+
+    def __init__(self, baseline: dict[str, Any], tolerance: float) -> None:
+        self.results: dict[str, dict[str, float]] = {}
+        self._baseline = baseline
+        self._tolerance = tolerance
+
+    def record(self, name: str, **metrics: float) -> None:
+        """Store the metrics of one benchmark case and check for regressions."""
+        self.results[name] = metrics
+        baseline = self._baseline.get("cases", {}).get(name, {})
+        regressions = [
+            f"{metric}: {metrics[metric]:.4g} > {baseline[metric]:.4g}"
+            for metric in GATED_METRICS
+            if metric in metrics
+            and baseline.get(metric)
+            and metrics[metric] > baseline[metric] * (1 + self._tolerance)
+        ]
+        assert not regressions, f"{name} regressed: " + ", ".join(regressions)
+
+
+@pytest.fixture(scope="session")
+def bench(request: pytest.FixtureRequest):
+    """Session-wide benchmark recorder."""
+    update = request.config.getoption("--update-baseline")
+    baseline: dict[str, Any] = {}
+    if BASELINE_FILE.exists() and not update:
+        baseline = json.loads(BASELINE_FILE.read_text())
+    recorder = BenchmarkRecorder(
+        baseline, request.config.getoption("--bench-tolerance")
+    )
+    yield recorder
+
+    output = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": recorder.results,
+    }
+    RESULTS_FILE.write_text(json.dumps(output, indent=2, sort_keys=True) + "\n")
+    if update:
+        BASELINE_FILE.write_text(json.dumps(output, indent=2, sort_keys=True) + "\n")
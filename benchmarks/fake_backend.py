@@ -0,0 +1,152 @@
+"""Simulated Terra Listens backend for benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from collections import Counter
+from typing import Any
+
+import aiohttp
+
+from custom_components.terra_listens.const import (
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND,
+)
+from custom_components.terra_listens.transport import TerraTransport, TokenBucket
+
+SPECIES = [
+    ("Oak Titmouse", "Baeolophus inornatus", "OATI"),
+    ("Acorn Woodpecker", "Melanerpes formicivorus", "ACWO"),
+    ("California Towhee", "Melozone crissalis", "CALT"),
+    ("Wrentit", "Chamaea fasciata", "WREN"),
+    ("Steller's Jay", "Cyanocitta stelleri", "STJA"),
+    ("Dark-eyed Junco", "Junco hyemalis", "DEJU"),
+]
+
+# API resource of each client method, for per-endpoint call counts
+RESOURCES = {
+    "signIn": "login",
+    "getDevices": "get_devices",
+    "getCurrentStats": "get_stats",
+    "birdIDLatest": "get_latest_birds",
+    "yardList": "get_yard_list",
+}
+
+
+class FakeTerraBackend(TerraTransport):
+    """Transport that answers from a simulated backend instead of the network.
+
+    Only ``post`` is replaced: requests still go through the client, the
+    integration-wide rate limiter and each account's concurrency limit, and
+    responses are JSON in the API's format, so they are decoded and parsed as
+    in production. Every request sleeps for ``latency`` ± ``jitter`` seconds
+    and fails with an error response with probability ``failure_rate``.
+    """
+
+    def __init__(
+        self,
+        stations: int = 1,
+        *,
+        latency: float = 0.05,
+        jitter: float = 0.02,
+        failure_rate: float = 0.0,
+        yard_list_size: int = 150,
+        seed: int = 0,
+    ) -> None:
+        # No session: nothing is sent over the network
+        super().__init__(
+            None,  # type: ignore[arg-type]
+            TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST),
+        )
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.calls: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._epoch = 1770534600
+        self._stations = [
+            {
+                "station_id": f"STATION{i:03}",
+                "alias": f"Station {i}",
+                "last_heard": "2026-02-08 01:00:00",
+                "streaming": "1",
+                "lat": "37.93",
+                "lon": "-120.27",
+                "version": "3.18",
+            }
+            for i in range(stations)
+        ]
+        # The detected species come first, under the same names and codes
+        names = [(common, alpha) for common, _, alpha in SPECIES]
+        names += [
+            (f"Species {n}", f"S{n:03}") for n in range(len(names), yard_list_size)
+        ]
+        self._yard_list = [
+            {
+                "commonName": common,
+                "speciesCode": code,
+                "sighting_count": str(n),
+                "first_seen_after_cutoff": "2025-06-01",
+                "Image_url": f"https://example.com/{code}.jpg",
+                "epoch": 1748736000 + n,
+            }
+            for n, (common, code) in enumerate(names[:yard_list_size])
+        ]
+
+    def advance(self, detections: int = 1) -> None:
+        """Make ``detections`` new birds appear at every station."""
+        self._epoch += detections
+
+    async def post(self, body: dict[str, Any], timeout: aiohttp.ClientTimeout) -> bytes:
+        resource = body["resource"]
+        self.calls[RESOURCES.get(resource, resource)] += 1
+        delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        await asyncio.sleep(max(delay, 0))
+        if self._random.random() < self.failure_rate:
+            data: Any = {"result": "error", "message": "simulated failure"}
+        else:
+            data = self._respond(resource, body)
+        return json.dumps(data).encode()
+
+    def _respond(self, resource: str, body: dict[str, Any]) -> Any:
+        if resource == "signIn":
+            return {"result": "success", "token": "bench-token"}
+        if resource == "getDevices":
+            return self._stations
+        if resource == "getCurrentStats":
+            return {
+                "uniqueSpecies": "12",
+                "callCount": str(self._epoch % 1000),
+                "topBird": "Oak Titmouse",
+                "topBirdCount": "42",
+                "topTime": "08:00",
+                "topTimeCount": "15",
+            }
+        if resource == "birdIDLatest":
+            return [
+                self._bird(body["deviceGUID"], self._epoch - n)
+                for n in range(body["recordCount"])
+            ]
+        if resource == "yardList":
+            return self._yard_list
+        return {"result": "error", "message": f"Unknown resource {resource}"}
+
+    @staticmethod
+    def _bird(device_id: str, epoch: int) -> dict[str, str]:
+        common, scientific, alpha = SPECIES[epoch % len(SPECIES)]
+        return {
+            "id": f"{device_id}-{epoch}",
+            "commonName": common,
+            "scientificName": scientific,
+            "alphacode": alpha,
+            "speciesConfidence": "0.9",
+            "stamp": "2026-02-08 07:30:00",
+            "epoch": str(epoch),
+            "audioURL": "https://example.com/audio.flac",
+            "Image_url": f"https://example.com/{alpha}.jpg",
+            "notPredicted": "0",
+            "complete": "1",
+            "anthro": "0",
+        }
@@ -0,0 +1,183 @@
+"""Benchmarks for coordinator refresh and entity update cost.
+
+API calls go through the real client, the shared rate limiter and each
+account's concurrency limit to a simulated backend (see fake_backend.py), so
+wall times include the time spent waiting for the limiter, as in production.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import tracemalloc
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.const import (
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from custom_components.terra_listens.api import TerraAsyncClient
+from custom_components.terra_listens.const import DOMAIN
+from custom_components.terra_listens.coordinator import (
+    TerraAccountCoordinator,
+    TerraStationCoordinator,
+)
+
+from .fake_backend import FakeTerraBackend
+
+STATION_COUNTS = (1, 10, 50, 100)
+REFRESH_ROUNDS = 3
+
+# Yard list images are prefetched from the network; keep that out of the numbers
+NO_MEDIA = patch(
+    "custom_components.terra_listens.coordinator.async_get_media_cache",
+    return_value=MagicMock(async_prefetch=AsyncMock()),
+)
+
+
+def _make_client(backend: FakeTerraBackend) -> TerraAsyncClient:
+    return TerraAsyncClient(backend, "bench@example.com", "bench", token="bench-token")
+
+
+def _make_entry(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="bench@example.com",
+        data={
+            CONF_EMAIL: "bench@example.com",
+            CONF_PASSWORD: "bench",
+            CONF_TOKEN: "bench-token",
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.mark.parametrize("failure_rate", [0.0, 0.1])
+@pytest.mark.parametrize("stations", STATION_COUNTS)
+async def test_full_refresh(
+    hass: HomeAssistant, bench, stations: int, failure_rate: float
+) -> None:
+    """Wall time, executor use and peak memory of a refresh of every endpoint."""
+    entry = _make_entry(hass)
+    api_calls = 0
+    executor_jobs = 0
+    original_add_executor_job = hass.async_add_executor_job
+
+    def _count_executor_job(*args, **kwargs):
+        nonlocal executor_jobs
+        executor_jobs += 1
+        return original_add_executor_job(*args, **kwargs)
+
+    wall_times: list[float] = []
+    failed = 0
+    threads_before = threading.active_count()
+    tracemalloc.start()
+    with NO_MEDIA, patch.object(hass, "async_add_executor_job", _count_executor_job):
+        for _ in range(REFRESH_ROUNDS):
+            # A cold start: fresh coordinators have every endpoint due, and a
+            # fresh backend has a full rate limiter bucket
+            backend = FakeTerraBackend(
+                stations, latency=0.05, failure_rate=failure_rate
+            )
+            account = TerraAccountCoordinator(hass, entry, _make_client(backend))
+            start = time.perf_counter()
+            try:
+                devices = await account._async_update_data()
+            except UpdateFailed:
+                failed += 1
+            else:
+                await asyncio.gather(
+                    *(
+                        TerraStationCoordinator(
+                            hass, account, device
+                        )._async_update_data()
+                        for device in devices.values()
+                    )
+                )
+                wall_times.append(time.perf_counter() - start)
+            api_calls += backend.calls.total()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    bench.record(
+        f"full_refresh[stations={stations},failure_rate={failure_rate}]",
+        wall_time_s=min(wall_times) if wall_times else 0.0,
+        round_trips=min(wall_times) / backend.latency if wall_times else 0.0,
+        api_calls=api_calls / REFRESH_ROUNDS,
+        executor_jobs=executor_jobs / REFRESH_ROUNDS,
+        threads_started=threading.active_count() - threads_before,
+        peak_memory_kib=peak / 1024,
+        failed_refreshes=failed,
+    )
+
+
+@pytest.mark.parametrize("stations", STATION_COUNTS)
+async def test_entity_updates(hass: HomeAssistant, bench, stations: int) -> None:
+    """Cost of pushing one refresh to every entity, with and without changes."""
+    backend = FakeTerraBackend(stations, latency=0)
+    entry = _make_entry(hass)
+    with (
+        NO_MEDIA,
+        patch(
+            "custom_components.terra_listens.async_get_transport",
+            return_value=backend,
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    account: TerraAccountCoordinator = hass.data[DOMAIN][entry.entry_id]
+    stations_by_id = account.stations
+    entities = len(hass.states.async_all())
+
+    # Unchanged data: a new TerraStationData with equal content
+    unchanged = {
+        station_id: replace(station.data)
+        for station_id, station in stations_by_id.items()
+    }
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    start = time.perf_counter()
+    for station_id, station in stations_by_id.items():
+        station.async_set_updated_data(unchanged[station_id])
+    unchanged_time = time.perf_counter() - start
+    unchanged_writes = len(events)
+
+    # Changed data: a new last bird at every station
+    backend.advance()
+    changed = {
+        station_id: replace(
+            station.data,
+            latest_birds=await account.client.get_latest_birds(station_id, count=5),
+        )
+        for station_id, station in stations_by_id.items()
+    }
+    events.clear()
+    start = time.perf_counter()
+    for station_id, station in stations_by_id.items():
+        station.async_set_updated_data(changed[station_id])
+    changed_time = time.perf_counter() - start
+    changed_writes = len(events)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    bench.record(
+        f"entity_updates[stations={stations}]",
+        entities=entities,
+        wall_time_s=changed_time,
+        per_entity_us=changed_time / entities * 1e6,
+        state_writes=changed_writes,
+        unchanged_wall_time_s=unchanged_time,
+        unchanged_state_writes=unchanged_writes,
+    )
@@ -0,0 +1,172 @@
+"""Benchmarks for integration import time and config entry setup cost."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.terra_listens.binary_sensor import TerraStreamingBinarySensor
+from custom_components.terra_listens.const import DOMAIN
+from custom_components.terra_listens.coordinator import TerraAccountCoordinator
+from custom_components.terra_listens.image import TerraLastBirdImage
+from custom_components.terra_listens.sensor import SENSOR_DESCRIPTIONS, TerraSensor
+
+from .fake_backend import FakeTerraBackend
+from .test_refresh import NO_MEDIA, STATION_COUNTS, _make_entry
+
+IMPORT_ROUNDS = 3
+
+# What a running Home Assistant has imported before it loads the integration
+HA_MODULES = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.storage",
+    "homeassistant.components.sensor",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.image",
+    "homeassistant.components.diagnostics",
+)
+
+# Everything Home Assistant imports for a configured entry
+INTEGRATION_MODULES = tuple(
+    f"custom_components.{DOMAIN}{suffix}"
+    for suffix in (
+        "",
+        ".config_flow",
+        ".sensor",
+        ".binary_sensor",
+        ".image",
+        ".diagnostics",
+    )
+)
+
+# Run in a fresh interpreter; prints the phase timings as JSON on stdout and
+# marks the start of the integration's imports in the -X importtime output
+_IMPORT_SCRIPT = """
+import importlib, json, sys, time
+ha_modules, integration_modules = json.loads(sys.argv[1])
+start = time.perf_counter()
+for name in ha_modules:
+    importlib.import_module(name)
+ha = time.perf_counter() - start
+sys.stderr.write("--- integration\\n")
+start = time.perf_counter()
+for name in integration_modules:
+    importlib.import_module(name)
+integration = time.perf_counter() - start
+print(json.dumps({
+    "ha": ha,
+    "integration": integration,
+    "recorder": "homeassistant.components.recorder" in sys.modules,
+}))
+"""
+
+
+def _measure_imports() -> dict[str, float]:
+    """Import Home Assistant, then the integration, in a fresh interpreter."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _IMPORT_SCRIPT,
+            json.dumps([HA_MODULES, INTEGRATION_MODULES]),
+        ],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+    timings = json.loads(result.stdout)
+    # Self time of every module imported after the marker, by origin
+    own = sdk = other = 0
+    _, _, log = result.stderr.partition("--- integration\n")
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[12:].split("|"))
+        if not self_us.isdigit():
+            continue
+        if name.startswith(f"custom_components.{DOMAIN}"):
+            own += int(self_us)
+        elif name.split(".")[0] == "terra_sdk":
+            sdk += int(self_us)
+        else:
+            other += int(self_us)
+    return {
+        "ha_import_s": timings["ha"],
+        "wall_time_s": timings["integration"],
+        "own_modules_s": own / 1e6,
+        "terra_sdk_s": sdk / 1e6,
+        "dependencies_s": other / 1e6,
+        "recorder_imported": float(timings["recorder"]),
+    }
+
+
+def test_import_time(bench) -> None:
+    """Import time of the integration on top of Home Assistant's own modules."""
+    runs = [_measure_imports() for _ in range(IMPORT_ROUNDS)]
+    fastest = min(runs, key=lambda run: run["wall_time_s"])
+    bench.record(
+        "import",
+        **fastest,
+        import_share=fastest["wall_time_s"]
+        / (fastest["ha_import_s"] + fastest["wall_time_s"]),
+    )
+
+
+@pytest.mark.parametrize("stations", STATION_COUNTS)
+async def test_setup_time(hass: HomeAssistant, bench, stations: int) -> None:
+    """Wall time of setting up an entry until every station's entities exist.
+
+    Requests go through the rate limiter, so this includes waiting for it.
+    """
+    backend = FakeTerraBackend(stations, latency=0)
+    entry = _make_entry(hass)
+    with (
+        NO_MEDIA,
+        patch(
+            "custom_components.terra_listens.async_get_transport",
+            return_value=backend,
+        ),
+    ):
+        start = time.perf_counter()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        setup_time = time.perf_counter() - start
+    account: TerraAccountCoordinator = hass.data[DOMAIN][entry.entry_id]
+    entities = len(hass.states.async_all())
+    assert len(account.stations) == stations
+
+    # Building the entity objects alone, as the platforms do for new stations
+    start = time.perf_counter()
+    built = [
+        entity
+        for station in account.stations.values()
+        for entity in (
+            *(TerraSensor(station, d) for d in SENSOR_DESCRIPTIONS),
+            TerraStreamingBinarySensor(station),
+            TerraLastBirdImage(station),
+        )
+    ]
+    construct_time = time.perf_counter() - start
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    bench.record(
+        f"setup[stations={stations}]",
+        entities=entities,
+        setup_time_s=setup_time,
+        per_station_ms=setup_time / stations * 1e3,
+        per_entity_us=construct_time / len(built) * 1e6,
+    )
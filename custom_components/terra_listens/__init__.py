@@ -3,46 +3,118 @@
 from __future__ import annotations
 
 import logging
+import secrets
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_WEBHOOK_ID,
+    Platform,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.typing import ConfigType
+
+from .api import TerraAsyncClient
+from .const import CONF_PUSH, DOMAIN
+from .coordinator import TerraAccountCoordinator, async_remove_persisted_data
+from .media import TerraMediaView, async_get_media_cache
+from .services import async_setup_services
+from .transport import async_get_transport
 
-from terra_sdk import TerraClient
+_LOGGER = logging.getLogger(__name__)
 
-from .const import DOMAIN
-from .coordinator import TerraDataUpdateCoordinator
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.IMAGE]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-_LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Terra Listens services and media view."""
+    async_setup_services(hass)
+    hass.http.register_view(TerraMediaView(async_get_media_cache(hass)))
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Terra Listens from a config entry."""
-    client = TerraClient(
+
+    @callback
+    def _async_save_token(token: str) -> None:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_TOKEN: token}
+        )
+
+    # The stored token is reused; the client only logs in again when the API
+    # rejects it, and a failed re-login surfaces as ConfigEntryAuthFailed.
+    client = TerraAsyncClient(
+        async_get_transport(hass),
         email=entry.data[CONF_EMAIL],
         password=entry.data[CONF_PASSWORD],
+        token=entry.data.get(CONF_TOKEN, ""),
+        on_token_refresh=_async_save_token,
     )
 
-    # Login synchronously in executor
-    await hass.async_add_executor_job(client.login)
+    if CONF_WEBHOOK_ID not in entry.data:
+        # Generated up front so the options flow can show the push URL
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: secrets.token_hex(32)}
+        )
 
-    coordinator = TerraDataUpdateCoordinator(hass, client)
-    await coordinator.async_config_entry_first_refresh()
+    account = TerraAccountCoordinator(hass, entry, client)
+
+    if await account.async_restore():
+        # Entities start from the last snapshot; go live in the background
+        entry.async_create_background_task(
+            hass, account.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+    else:
+        await account.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = account
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Station coordinators are started (and their entities added) once the
+    # platforms listen for new stations, and again after every station list
+    # refresh; the listener also keeps the account coordinator polling.
+    entry.async_on_unload(account.async_add_listener(account.async_sync_stations))
+    account.async_sync_stations()
+    entry.async_on_unload(account.statistics.async_start())
+    entry.async_create_background_task(
+        hass, account.backfill.async_resume(), f"{DOMAIN} backfill resume"
+    )
+    if entry.options.get(CONF_PUSH, False):
+        # Most setups poll only; load the push handler just when it is enabled
+        push = await async_import_module(hass, f"{__package__}.webhook")
+        if remove_webhook := await push.async_setup_webhook(hass, entry, account):
+            entry.async_on_unload(remove_webhook)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change (not on token updates)."""
+    account: TerraAccountCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if entry.options != account.options:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        coordinator: TerraDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
-        coordinator.client.close()
+        account: TerraAccountCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        for station in account.stations.values():
+            await station.async_shutdown()
+        await account.history.async_close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when a config entry is deleted."""
+    await async_remove_persisted_data(hass, entry.entry_id)
@@ -0,0 +1,324 @@
+"""Asyncio client for the Terra Listens API."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import aiohttp
+
+from terra_sdk.client import DEFAULT_TIMEOUT
+from terra_sdk.exceptions import TerraAPIError, TerraAuthError
+from terra_sdk.models import (
+    BirdDetection,
+    GraphStatsEntry,
+    Station,
+    StationStats,
+    YardListEntry,
+)
+
+from .metrics import TerraMetrics
+
+if TYPE_CHECKING:
+    from .transport import TerraTransport
+
+# Error messages from the API that mean the session token is no longer valid,
+# compared whole (case-insensitive). Other errors that merely mention
+# authorization or sessions concern one call and must not force a new login.
+_TOKEN_ERRORS = frozenset(
+    {
+        "invalid token",
+        "token expired",
+        "expired token",
+        "session expired",
+        "invalid session",
+        "not logged in",
+    }
+)
+
+# HTTP statuses worth retrying
+_TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+_T = TypeVar("_T")
+
+
+class TerraConnectionError(TerraAPIError):
+    """Transient failure (network error, timeout, overload) worth retrying."""
+
+
+def _parse_list(
+    validate: Callable[[Any], _T], skip: int = 0
+) -> Callable[[Any], list[_T]]:
+    """Return a parser for a JSON list of records, without the first ``skip``."""
+
+    def parse(data: Any) -> list[_T]:
+        return [validate(d) for d in islice(data, skip, None)]
+
+    return parse
+
+
+def _parse_graph_stats(data: Any) -> list[GraphStatsEntry]:
+    entries = data.get("calls5m", []) if isinstance(data, dict) else data
+    return [GraphStatsEntry.model_validate(d) for d in entries]
+
+
+class TerraAsyncClient:
+    """Non-blocking counterpart of ``terra_sdk.TerraClient``.
+
+    Talks to the same endpoint through the integration's shared
+    ``TerraTransport``, so requests run on the event loop, reuse pooled
+    keep-alive connections and respect the global rate limit instead of
+    occupying executor threads. Responses are parsed into the SDK
+    models and failures are raised as SDK exceptions.
+
+    A stored token is used as-is. Only when a call is rejected as unauthorized
+    does the client log in again (once, however many calls are waiting) and
+    report the new token through ``on_token_refresh``.
+
+    Most polls return exactly what the previous one did. The API is a single
+    POST endpoint without ETags or ``Last-Modified``, so instead the digest of
+    each station's last response per resource is kept, and an identical
+    response returns the models parsed last time without decoding it again.
+    Callers can compare results by identity to skip their own work, and must
+    not mutate them.
+    """
+
+    def __init__(
+        self,
+        transport: TerraTransport,
+        email: str = "",
+        password: str = "",
+        *,
+        token: str = "",
+        timeout: float = DEFAULT_TIMEOUT,
+        on_token_refresh: Callable[[str], None] | None = None,
+        metrics: TerraMetrics | None = None,
+    ) -> None:
+        self._transport = transport
+        self._email = email
+        self._password = password
+        self._token = token
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._on_token_refresh = on_token_refresh
+        self._login_lock = asyncio.Lock()
+        # (resource, device ID) -> digest of the last response, parsed result
+        self._parsed: dict[tuple[str, str | None], tuple[bytes, Any]] = {}
+        # Request timing is only taken while metrics are being collected
+        self.metrics = metrics
+
+    @property
+    def token(self) -> str:
+        """Return the current auth token (empty until logged in)."""
+        return self._token
+
+    async def login(self) -> str:
+        """Authenticate and store the session token."""
+        if not self._email or not self._password:
+            raise TerraAuthError("Email and password are required to login")
+        data = await self._raw_call(
+            "signIn", email=self._email, password=self._password
+        )
+        if isinstance(data, dict) and data.get("result") == "success":
+            self._token = data["token"]
+            if self._on_token_refresh is not None:
+                self._on_token_refresh(self._token)
+            return self._token
+        msg = (
+            data.get("message", "Unknown login error")
+            if isinstance(data, dict)
+            else str(data)
+        )
+        raise TerraAuthError(msg)
+
+    async def _raw_call(
+        self,
+        resource: str,
+        parse: Callable[[Any], Any] | None = None,
+        *,
+        reuse: bool = True,
+        **params: Any,
+    ) -> Any:
+        """POST to the single API endpoint with the given resource and params.
+
+        With ``parse``, a successful response is returned parsed, reusing the
+        previous result if the response has not changed (unless ``reuse`` is
+        False).
+        """
+        body: dict[str, Any] = {"resource": resource, **params}
+        await self._transport.throttle()
+        device_id = params.get("deviceGUID")
+        if self.metrics is None:
+            raw = await self._post(resource, body)
+            return self._parse(resource, device_id, raw, parse, reuse)
+
+        start = time.perf_counter()
+        raw = b""
+        error = True
+        try:
+            raw = await self._post(resource, body)
+            data = self._parse(resource, device_id, raw, parse, reuse)
+            error = isinstance(data, dict) and data.get("result") == "error"
+            return data
+        finally:
+            self.metrics.record(
+                resource,
+                device_id,
+                time.perf_counter() - start,
+                error=error,
+                payload_bytes=len(raw),
+            )
+
+    async def _post(self, resource: str, body: dict[str, Any]) -> bytes:
+        """Send the request and return the raw response body."""
+        try:
+            return await self._transport.post(body, self._timeout)
+        except aiohttp.ClientResponseError as err:
+            if err.status in (401, 403):
+                raise TerraAuthError(f"[{resource}] {err.message}") from err
+            if err.status in _TRANSIENT_STATUSES:
+                raise TerraConnectionError(
+                    err.message or str(err.status), resource
+                ) from err
+            raise TerraAPIError(err.message or str(err.status), resource) from err
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise TerraConnectionError(
+                str(err) or type(err).__name__, resource
+            ) from err
+
+    def _parse(
+        self,
+        resource: str,
+        device_id: str | None,
+        raw: bytes,
+        parse: Callable[[Any], Any] | None,
+        reuse: bool = True,
+    ) -> Any:
+        """Decode and parse a response, or return it as parsed last time."""
+        if parse is None:
+            return self._decode(resource, raw)
+        key = (resource, device_id)
+        digest: bytes | None = None
+        if reuse:
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            previous = self._parsed.get(key)
+            if previous is not None and previous[0] == digest:
+                return previous[1]
+        data = self._decode(resource, raw)
+        if isinstance(data, dict) and data.get("result") == "error":
+            return data
+        parsed = parse(data)
+        if digest is not None:
+            self._parsed[key] = (digest, parsed)
+        return parsed
+
+    @staticmethod
+    def _decode(resource: str, raw: bytes) -> Any:
+        try:
+            return json.loads(raw)
+        except ValueError as err:
+            raise TerraAPIError(f"Invalid response: {err}", resource) from err
+
+    async def _call(
+        self,
+        resource: str,
+        parse: Callable[[Any], _T],
+        *,
+        reuse: bool = True,
+        **params: Any,
+    ) -> _T:
+        """Authenticated API call, logging in again if the token was rejected."""
+        token = self._token or await self._async_relogin(None)
+        try:
+            return await self._authed_call(
+                resource, token, parse, reuse=reuse, **params
+            )
+        except TerraAuthError:
+            token = await self._async_relogin(token)
+            return await self._authed_call(
+                resource, token, parse, reuse=reuse, **params
+            )
+
+    async def _authed_call(
+        self,
+        resource: str,
+        token: str,
+        parse: Callable[[Any], _T],
+        *,
+        reuse: bool = True,
+        **params: Any,
+    ) -> _T:
+        """Call with the given token. Raises TerraAPIError on error responses."""
+        data = await self._raw_call(resource, parse, reuse=reuse, token=token, **params)
+        if isinstance(data, dict) and data.get("result") == "error":
+            message = data.get("message", "Unknown error")
+            if message.strip().rstrip(".").lower() in _TOKEN_ERRORS:
+                raise TerraAuthError(f"[{resource}] {message}")
+            raise TerraAPIError(message, resource)
+        return data
+
+    async def _async_relogin(self, rejected_token: str | None) -> str:
+        """Log in unless another caller already replaced the rejected token."""
+        async with self._login_lock:
+            if self._token and self._token != rejected_token:
+                return self._token
+            return await self.login()
+
+    async def get_devices(self) -> list[Station]:
+        """List all Terra stations on the account."""
+        return await self._call("getDevices", _parse_list(Station.model_validate))
+
+    async def get_latest_birds(
+        self, device_id: str, count: int = 20
+    ) -> list[BirdDetection]:
+        """Get the most recent bird detections of a station."""
+        return await self._call(
+            "birdIDLatest",
+            _parse_list(BirdDetection.model_validate),
+            deviceGUID=device_id,
+            recordCount=count,
+        )
+
+    async def get_bird_history(
+        self, device_id: str, count: int, skip: int = 0
+    ) -> list[BirdDetection]:
+        """Get a station's latest ``count`` detections, without the first ``skip``.
+
+        The API cannot page, so older detections are reached by asking for
+        more of the latest ones. Only the records after ``skip`` are parsed,
+        and the response is not kept for reuse.
+        """
+        return await self._call(
+            "birdIDLatest",
+            _parse_list(BirdDetection.model_validate, skip),
+            reuse=False,
+            deviceGUID=device_id,
+            recordCount=count,
+        )
+
+    async def get_stats(self, device_id: str) -> StationStats:
+        """Get current station statistics."""
+        return await self._call(
+            "getCurrentStats", StationStats.model_validate, deviceGUID=device_id
+        )
+
+    async def get_graph_stats(self, device_id: str) -> list[GraphStatsEntry]:
+        """Get the recent call activity of a station in 5-minute buckets."""
+        return await self._call(
+            "getGraphStatsCalls", _parse_graph_stats, deviceGUID=device_id
+        )
+
+    async def get_yard_list(
+        self, device_id: str, timeframe: str = "all"
+    ) -> list[YardListEntry]:
+        """Get the yard life-list of a station."""
+        return await self._call(
+            "yardList",
+            _parse_list(YardListEntry.model_validate),
+            deviceGUID=device_id,
+            timeframe=timeframe,
+        )
@@ -0,0 +1,153 @@
+"""Backfill of past detections into the local history for Terra Listens."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from terra_sdk.exceptions import TerraError
+from terra_sdk.models import BirdDetection
+
+from .const import (
+    BACKFILL_MAX_RECORDS,
+    BACKFILL_PAGE_DELAY,
+    BACKFILL_PAGE_SIZE,
+    DOMAIN,
+    HISTORY_RETENTION,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import TerraAccountCoordinator, TerraStationCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_iter_pages(
+    fetch: Callable[[int, int], Awaitable[list[BirdDetection]]],
+    start: int,
+    since: int,
+    page_size: int,
+    max_records: int,
+) -> AsyncIterator[tuple[int, list[BirdDetection]]]:
+    """Yield a station's detections page by page, newest first.
+
+    ``fetch(count, skip)`` returns the latest ``count`` detections without
+    the first ``skip``. Paging starts ``start`` records back and ends at the
+    oldest detection, at the first page reaching back before ``since``, or
+    after ``max_records``. Each page is yielded with the number of records
+    paged through so far.
+    """
+    fetched = start
+    while fetched < max_records:
+        count = min(fetched + page_size, max_records)
+        page = await fetch(count, fetched)
+        fetched += len(page)
+        yield fetched, page
+        if fetched < count or min((d.epoch for d in page), default=0) < since:
+            return
+
+
+class TerraBackfill:
+    """Load the past detections of an account's stations into the history.
+
+    A backfill pages back through a station's detections and stores each
+    page together with a checkpoint as it arrives, so memory does not grow
+    with the length of the history and an interrupted backfill resumes
+    where it stopped. The API cannot page, so every request returns the
+    newer records again; only the new ones are parsed. Paging stops at
+    ``HISTORY_RETENTION``, beyond which the history would prune them.
+
+    Each page waits for a poll of the station in progress, and the job
+    pauses between pages, so live data is not held up.
+    """
+
+    def __init__(self, hass: HomeAssistant, account: TerraAccountCoordinator) -> None:
+        self._hass = hass
+        self._account = account
+        self._jobs: dict[str, asyncio.Task[None]] = {}
+
+    @callback
+    def async_start(
+        self, station: TerraStationCoordinator, start: int | None = None
+    ) -> bool:
+        """Start backfilling a station; return False if it already is.
+
+        Without ``start``, an unfinished backfill of the station is resumed.
+        """
+        if station.station_id in self._jobs:
+            return False
+        self._jobs[station.station_id] = (
+            station.config_entry.async_create_background_task(
+                self._hass,
+                self._async_run(station, start),
+                f"{DOMAIN} {station.station_id} backfill",
+            )
+        )
+        return True
+
+    @callback
+    def async_cancel(self, station_id: str) -> None:
+        """Stop backfilling a station; its checkpoint is kept."""
+        if (job := self._jobs.pop(station_id, None)) is not None:
+            job.cancel()
+
+    async def async_resume(self) -> None:
+        """Resume the backfills that were interrupted, e.g. by a restart."""
+        try:
+            backfills = await self._account.history.async_backfills()
+        except sqlite3.Error as err:
+            _LOGGER.warning("Failed to read the backfill checkpoints: %s", err)
+            return
+        for station_id, fetched in backfills.items():
+            if (station := self._account.stations.get(station_id)) is not None:
+                self.async_start(station, fetched)
+
+    async def _async_run(
+        self, station: TerraStationCoordinator, start: int | None
+    ) -> None:
+        history = self._account.history
+        station_id = station.station_id
+        stored = 0
+
+        async def _async_fetch(count: int, skip: int) -> list[BirdDetection]:
+            await station.async_wait_idle()
+            return await self._account.async_call(
+                self._account.client.get_bird_history, station_id, count, skip=skip
+            )
+
+        try:
+            if start is None:
+                start = (await history.async_backfills()).get(station_id, 0)
+            since = int((dt_util.utcnow() - HISTORY_RETENTION).timestamp())
+            pages = async_iter_pages(
+                _async_fetch, start, since, BACKFILL_PAGE_SIZE, BACKFILL_MAX_RECORDS
+            )
+            async with aclosing(pages):
+                async for fetched, page in pages:
+                    stored += await history.async_add_backfill(
+                        station_id, [d for d in page if d.epoch >= since], fetched
+                    )
+                    await asyncio.sleep(BACKFILL_PAGE_DELAY.total_seconds())
+            await history.async_end_backfill(station_id)
+        except (TerraError, sqlite3.Error) as err:
+            _LOGGER.warning(
+                "Backfill of %s stopped after %d new detections, "
+                "it resumes when started again: %s",
+                station.station.alias,
+                stored,
+                err,
+            )
+            return
+        finally:
+            if self._jobs.get(station_id) is asyncio.current_task():
+                del self._jobs[station_id]
+        _LOGGER.info(
+            "Backfilled %d new detections of %s", stored, station.station.alias
+        )
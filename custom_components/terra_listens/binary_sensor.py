@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
@@ -10,9 +12,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .coordinator import TerraDataUpdateCoordinator
-from .entity import TerraEntity
+from .const import ENDPOINT_DEVICES
+from .coordinator import TerraStationCoordinator
+from .entity import TerraEntity, async_setup_station_entities
 
 
 class TerraStreamingBinarySensor(TerraEntity, BinarySensorEntity):
@@ -21,21 +23,21 @@ class TerraStreamingBinarySensor(TerraEntity, BinarySensorEntity):
     _attr_translation_key = "streaming"
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_icon = "mdi:broadcast"
+    _endpoint = ENDPOINT_DEVICES
 
-    def __init__(
-        self,
-        coordinator: TerraDataUpdateCoordinator,
-        station_id: str,
-    ) -> None:
-        super().__init__(coordinator, station_id)
-        self._attr_unique_id = f"{station_id}_streaming"
+    def __init__(self, coordinator: TerraStationCoordinator) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.station_id}_streaming"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if the station is streaming."""
-        if self._station_data is None:
+        if (view := self._view) is None:
             return None
-        return self._station_data.station.streaming
+        return view.streaming
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self.is_on,)
 
 
 async def async_setup_entry(
@@ -44,10 +46,9 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Terra Listens binary sensor entities."""
-    coordinator: TerraDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    entities = [
-        TerraStreamingBinarySensor(coordinator, station_id)
-        for station_id in coordinator.data.stations
-    ]
-    async_add_entities(entities)
+    async_setup_station_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda station: [TerraStreamingBinarySensor(station)],
+    )
@@ -0,0 +1,87 @@
+"""Circuit breaker for Terra Listens endpoints."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from .const import BREAKER_COOLDOWN, BREAKER_FAILURE_THRESHOLD, BREAKER_MAX_COOLDOWN
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling an endpoint that keeps failing until a cooldown ends.
+
+    After ``threshold`` consecutive failures the breaker opens and calls are
+    skipped for ``cooldown``. The next call is a trial: success closes the
+    breaker, failure opens it again for twice as long (up to ``max_cooldown``).
+    Times are ``time.monotonic()`` seconds supplied by the caller.
+    """
+
+    __slots__ = (
+        "failures",
+        "last_error",
+        "open_until",
+        "_cooldown",
+        "_base_cooldown",
+        "_max_cooldown",
+        "_threshold",
+    )
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown: timedelta = BREAKER_COOLDOWN,
+        max_cooldown: timedelta = BREAKER_MAX_COOLDOWN,
+    ) -> None:
+        self.failures = 0
+        self.last_error: str | None = None
+        self.open_until = 0.0
+        self._base_cooldown = cooldown.total_seconds()
+        self._cooldown = self._base_cooldown
+        self._max_cooldown = max_cooldown.total_seconds()
+        self._threshold = threshold
+
+    def state(self, now: float) -> str:
+        """Return the breaker state at the given time."""
+        if self.failures < self._threshold:
+            return STATE_CLOSED
+        return STATE_OPEN if now < self.open_until else STATE_HALF_OPEN
+
+    def allow(self, now: float) -> bool:
+        """Return True if a call may be made."""
+        return self.state(now) != STATE_OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.last_error = None
+        self.open_until = 0.0
+        self._cooldown = self._base_cooldown
+
+    def record_failure(self, now: float, error: str | None = None) -> bool:
+        """Count a failure; return True if this opened the breaker."""
+        self.failures += 1
+        self.last_error = error
+        if self.failures < self._threshold:
+            return False
+        if self.failures > self._threshold:
+            # The trial call after a cooldown failed
+            self._cooldown = min(self._cooldown * 2, self._max_cooldown)
+        self.open_until = now + self._cooldown
+        return True
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Summarize for diagnostics."""
+        state = self.state(now)
+        return {
+            "state": state,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "retry_in_s": (
+                round(self.open_until - now, 1) if state == STATE_OPEN else None
+            ),
+        }
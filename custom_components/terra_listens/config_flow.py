@@ -3,16 +3,37 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_TOKEN, CONF_WEBHOOK_ID
+from homeassistant.core import callback
 
-from terra_sdk import TerraClient
 from terra_sdk.exceptions import TerraAuthError, TerraError
 
-from .const import DOMAIN
+from .api import TerraAsyncClient
+from .const import (
+    CONF_DIAGNOSTIC_METRICS,
+    CONF_MAX_CONCURRENCY,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_PUSH,
+    CONF_SPECIES_SENSORS,
+    CONF_STALE_MAX_AGE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_STALE_MAX_AGE,
+    DOMAIN,
+)
+from .transport import async_get_transport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,12 +44,40 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_REAUTH_DATA_SCHEMA = vol.Schema({vol.Required(CONF_PASSWORD): str})
+
 
 class TerraListensConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Terra Listens."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow handler."""
+        return TerraListensOptionsFlow()
+
+    async def _async_login(
+        self, email: str, password: str, errors: dict[str, str]
+    ) -> str | None:
+        """Validate credentials; return the session token or record an error."""
+        try:
+            client = TerraAsyncClient(
+                async_get_transport(self.hass),
+                email=email,
+                password=password,
+            )
+            return await client.login()
+        except TerraAuthError:
+            errors["base"] = "invalid_auth"
+        except TerraError:
+            errors["base"] = "cannot_connect"
+        except Exception:
+            _LOGGER.exception("Unexpected error during login")
+            errors["base"] = "unknown"
+        return None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -36,25 +85,15 @@ class TerraListensConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            try:
-                client = TerraClient(
-                    email=user_input[CONF_EMAIL],
-                    password=user_input[CONF_PASSWORD],
-                )
-                token = await self.hass.async_add_executor_job(client.login)
-            except TerraAuthError:
-                errors["base"] = "invalid_auth"
-            except TerraError:
-                errors["base"] = "cannot_connect"
-            except Exception:
-                _LOGGER.exception("Unexpected error during login")
-                errors["base"] = "unknown"
-            else:
+            token = await self._async_login(
+                user_input[CONF_EMAIL], user_input[CONF_PASSWORD], errors
+            )
+            if token is not None:
                 await self.async_set_unique_id(user_input[CONF_EMAIL])
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(
                     title=f"Terra Listens ({user_input[CONF_EMAIL]})",
-                    data=user_input,
+                    data={**user_input, CONF_TOKEN: token},
                 )
 
         return self.async_show_form(
@@ -62,3 +101,100 @@ class TerraListensConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+    async def async_step_reauth(
+        self, entry_data: Mapping[str, Any]
+    ) -> ConfigFlowResult:
+        """Start reauthentication after the stored credentials were rejected."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Ask for the password of the account again."""
+        errors: dict[str, str] = {}
+        reauth_entry = self._get_reauth_entry()
+        email = reauth_entry.data[CONF_EMAIL]
+
+        if user_input is not None:
+            token = await self._async_login(email, user_input[CONF_PASSWORD], errors)
+            if token is not None:
+                return self.async_update_reload_and_abort(
+                    reauth_entry,
+                    data_updates={
+                        CONF_PASSWORD: user_input[CONF_PASSWORD],
+                        CONF_TOKEN: token,
+                    },
+                )
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
+            description_placeholders={"email": email},
+            errors=errors,
+        )
+
+
+class TerraListensOptionsFlow(OptionsFlow):
+    """Handle Terra Listens options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage polling, concurrency, stale data, push, species and metrics."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if user_input[CONF_MIN_POLL_INTERVAL] > user_input[CONF_MAX_POLL_INTERVAL]:
+                errors["base"] = "invalid_poll_bounds"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        webhook_id = self.config_entry.data.get(CONF_WEBHOOK_ID, "")
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MIN_POLL_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                    vol.Required(
+                        CONF_MAX_POLL_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                    vol.Required(
+                        CONF_STALE_MAX_AGE,
+                        default=options.get(CONF_STALE_MAX_AGE, DEFAULT_STALE_MAX_AGE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=1440)),
+                    vol.Required(
+                        CONF_MAX_CONCURRENCY,
+                        default=options.get(
+                            CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+                    vol.Required(
+                        CONF_PUSH, default=options.get(CONF_PUSH, False)
+                    ): bool,
+                    vol.Required(
+                        CONF_SPECIES_SENSORS,
+                        default=options.get(CONF_SPECIES_SENSORS, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_DIAGNOSTIC_METRICS,
+                        default=options.get(CONF_DIAGNOSTIC_METRICS, False),
+                    ): bool,
+                }
+            ),
+            description_placeholders={
+                # Built here rather than by the webhook integration, which
+                # is only loaded once push is enabled
+                "webhook_path": f"/api/webhook/{webhook_id}"
+            },
+            errors=errors,
+        )
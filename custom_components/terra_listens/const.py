@@ -1,10 +1,85 @@
 """Constants for the Terra Listens integration."""
 
+from datetime import timedelta
+
 DOMAIN = "terra_listens"
-SCAN_INTERVAL_SECONDS = 300  # 5 minutes
+DEFAULT_MAX_CONCURRENCY = 8  # simultaneous API requests per account
+
+# Shared by all config entries, see transport.py
+DATA_TRANSPORT = "transport"
+RATE_LIMIT_PER_SECOND = 5.0  # average API requests per second, all accounts
+RATE_LIMIT_BURST = 20  # requests that may be sent back to back
+DATA_MEDIA_CACHE = "media_cache"
+MEDIA_CACHE_MAX_BYTES = 50 * 1024 * 1024  # bird images and audio kept on disk
+MEDIA_PREFETCH_SPECIES = 20  # most sighted species whose images are prefetched
+MEDIA_TIMEOUT = 30  # seconds per media download
+MEDIA_URL_VALIDITY = timedelta(days=7)  # lifetime of a signed media URL
+
+ENDPOINT_DEVICES = "devices"
+ENDPOINT_STATS = "stats"
+ENDPOINT_LATEST_BIRDS = "latest_birds"
+ENDPOINT_YARD_LIST = "yard_list"
+
+# How often each endpoint is polled. Latest birds are not listed: they adapt
+# per station between the configured minimum and maximum poll interval.
+ENDPOINT_INTERVALS: dict[str, timedelta] = {
+    ENDPOINT_DEVICES: timedelta(hours=1),
+    ENDPOINT_STATS: timedelta(minutes=5),
+    ENDPOINT_YARD_LIST: timedelta(days=1),
+}
+DEFAULT_MIN_POLL_INTERVAL = 30  # seconds, while detections are arriving
+DEFAULT_MAX_POLL_INTERVAL = 600  # seconds, when quiet or not streaming
+POLL_BACKOFF_FACTOR = 2  # growth per quiet latest-birds poll
+RETRY_INTERVAL = timedelta(minutes=5)  # upper bound before retrying a failed call
+DEFAULT_STALE_MAX_AGE = 60  # minutes a failed slice keeps its last good value
+
+API_RETRY_ATTEMPTS = 3  # tries per call on transient errors
+API_RETRY_BACKOFF = 1.0  # seconds, upper bound of the first jittered delay
+BREAKER_FAILURE_THRESHOLD = 3  # consecutive failures that open a breaker
+BREAKER_COOLDOWN = timedelta(minutes=5)  # first pause once a breaker opens
+BREAKER_MAX_COOLDOWN = timedelta(hours=1)  # pauses double up to this
+
+LATEST_BIRDS_COUNT = 5  # detections requested per poll
+LATEST_BIRDS_MAX_COUNT = 50  # cap when widening the window to close a gap
+SEEN_DETECTIONS_MAX = 500  # detection IDs remembered per station
+
+# terra_listens.refresh service calls this close together share one fetch
+REFRESH_COALESCE_DELAY = timedelta(seconds=2)
+
+# Detections and station status pushed through a webhook, see webhook.py
+PUSH_RESYNC_INTERVAL = timedelta(minutes=30)  # latest-birds polls while pushed to
+PUSH_TIMEOUT = timedelta(minutes=10)  # without a push, polling resumes as normal
+
+# Local detection history, see history.py
+HISTORY_RETENTION = timedelta(days=30)  # detections older than this are pruned
+HISTORY_PRUNE_INTERVAL = timedelta(hours=1)
+
+# Past detections loaded by the terra_listens.backfill service, see backfill.py
+BACKFILL_PAGE_SIZE = 200  # older detections parsed and stored per request
+BACKFILL_MAX_RECORDS = 5000  # deepest the latest detections are paged
+BACKFILL_PAGE_DELAY = timedelta(seconds=2)  # pause between pages for live polls
+
+# Hourly detection counts imported into long-term statistics, see statistics.py
+STATISTICS_DELAY = timedelta(minutes=15)  # wait for late detections of an hour
+STATISTICS_IMPORT_MINUTE = 20  # minute past each hour the import runs
+
+EVENT_DETECTION = f"{DOMAIN}_detection"
+SERVICE_REFRESH = "refresh"
+SERVICE_BACKFILL = "backfill"
+ATTR_STATION_ID = "station_id"
+ATTR_ENDPOINTS = "endpoints"
+
+METRICS_WINDOW = 200  # latency samples kept per endpoint for percentiles
 
 CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+CONF_DIAGNOSTIC_METRICS = "diagnostic_metrics"
+CONF_STALE_MAX_AGE = "stale_max_age"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_PUSH = "push"
+CONF_SPECIES_SENSORS = "species_sensors"
 
 MANUFACTURER = "Terra"
 MODEL = "Terra Listens Station"
@@ -1,85 +1,958 @@
-"""DataUpdateCoordinator for Terra Listens."""
+"""DataUpdateCoordinators for Terra Listens."""
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
-from dataclasses import dataclass, field
-from datetime import timedelta
-from typing import Any
+import random
+import sqlite3
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Any, TypeVar
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from terra_sdk import TerraClient
-from terra_sdk.exceptions import TerraError
-from terra_sdk.models import BirdDetection, Station, StationStats
+from terra_sdk.exceptions import TerraAuthError, TerraError
+from terra_sdk.models import BirdDetection, Station, StationStats, YardListEntry
 
-from .const import DOMAIN, SCAN_INTERVAL_SECONDS
+from .api import TerraAsyncClient, TerraConnectionError
+from .backfill import TerraBackfill
+from .breaker import CircuitBreaker
+from .const import (
+    API_RETRY_ATTEMPTS,
+    API_RETRY_BACKOFF,
+    CONF_DIAGNOSTIC_METRICS,
+    CONF_MAX_CONCURRENCY,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_SPECIES_SENSORS,
+    CONF_STALE_MAX_AGE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_STALE_MAX_AGE,
+    DOMAIN,
+    ENDPOINT_DEVICES,
+    ENDPOINT_INTERVALS,
+    ENDPOINT_LATEST_BIRDS,
+    ENDPOINT_STATS,
+    ENDPOINT_YARD_LIST,
+    EVENT_DETECTION,
+    LATEST_BIRDS_COUNT,
+    LATEST_BIRDS_MAX_COUNT,
+    MEDIA_PREFETCH_SPECIES,
+    POLL_BACKOFF_FACTOR,
+    PUSH_RESYNC_INTERVAL,
+    PUSH_TIMEOUT,
+    RETRY_INTERVAL,
+)
+from .detections import DetectionTracker
+from .history import TerraDetectionHistory, async_remove_history
+from .media import async_get_media_cache
+from .metrics import TerraMetrics
+from .refresh import RefreshRequests
+from .species import SpeciesTable
+from .statistics import TerraStatistics, async_remove_statistics_state
+from .views import StationView, build_station_view, station_device_info
+from .yard_list import TerraYardListCache
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60  # seconds
+
 
 @dataclass
 class TerraStationData:
-    """Holds all polled data for a single station."""
+    """Holds all polled data for a single station.
+
+    Each slice belongs to one endpoint. When a fetch fails, the last good
+    value is carried forward and the endpoint is listed in ``stale``; once
+    that value is older than the configured maximum age, the endpoint moves
+    to ``expired`` and its entities become unavailable.
+    """
 
     station: Station
     stats: StationStats | None = None
     latest_birds: list[BirdDetection] = field(default_factory=list)
+    yard_list: list[YardListEntry] = field(default_factory=list)
     yard_list_count: int = 0
+    # Detections first seen on the latest tick, oldest first
+    new_detections: list[BirdDetection] = field(default_factory=list)
+    # Endpoint -> when its slice was last fetched successfully (UTC)
+    updated: dict[str, datetime] = field(default_factory=dict)
+    stale: frozenset[str] = frozenset()
+    expired: frozenset[str] = frozenset()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for the startup snapshot (the yard list is cached separately)."""
+        return {
+            "station": self.station.model_dump(by_alias=True),
+            "stats": self.stats.model_dump(by_alias=True) if self.stats else None,
+            "latest_birds": [b.model_dump(by_alias=True) for b in self.latest_birds],
+            "yard_list_count": self.yard_list_count,
+            "updated": {
+                endpoint: updated.isoformat()
+                for endpoint, updated in self.updated.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TerraStationData:
+        """Restore from a startup snapshot."""
+        return cls(
+            station=Station.model_validate(data["station"]),
+            stats=(
+                StationStats.model_validate(data["stats"]) if data["stats"] else None
+            ),
+            latest_birds=[
+                BirdDetection.model_validate(b) for b in data["latest_birds"]
+            ],
+            yard_list_count=data["yard_list_count"],
+            updated={
+                endpoint: datetime.fromisoformat(updated)
+                for endpoint, updated in data.get("updated", {}).items()
+            },
+        )
+
+    def with_staleness(
+        self, stale: set[str], now: datetime, max_age: timedelta
+    ) -> TerraStationData:
+        """Return a copy flagging the given endpoints as stale (or expired)."""
+        return replace(
+            self,
+            stale=frozenset(stale),
+            expired=frozenset(
+                endpoint
+                for endpoint in stale
+                if (updated := self.updated.get(endpoint)) is None
+                or now - updated > max_age
+            ),
+        )
 
 
 @dataclass
 class TerraData:
-    """Container for all data from the coordinator."""
+    """The data of every station on an account, as stored in the snapshot."""
 
     stations: dict[str, TerraStationData] = field(default_factory=dict)
 
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for the startup snapshot."""
+        return {
+            "stations": {
+                station_id: station_data.as_dict()
+                for station_id, station_data in self.stations.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TerraData:
+        """Restore from a startup snapshot."""
+        return cls(
+            stations={
+                station_id: TerraStationData.from_dict(station_data)
+                for station_id, station_data in data["stations"].items()
+            }
+        )
+
 
-class TerraDataUpdateCoordinator(DataUpdateCoordinator[TerraData]):
-    """Fetch data from Terra Listens API."""
+class TerraAccountCoordinator(DataUpdateCoordinator[dict[str, Station]]):
+    """Keep the list of stations on a Terra Listens account.
 
-    def __init__(self, hass: HomeAssistant, client: TerraClient) -> None:
+    Only calls ``get_devices``. Every station gets its own
+    ``TerraStationCoordinator`` with an independent schedule, so a slow or
+    failing station does not hold back the others; children are created and
+    shut down as stations appear on and disappear from the account.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: TerraAsyncClient,
+    ) -> None:
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name=DOMAIN,
-            update_interval=timedelta(seconds=SCAN_INTERVAL_SECONDS),
+            update_interval=ENDPOINT_INTERVALS[ENDPOINT_DEVICES],
         )
         self.client = client
+        self.options = dict(entry.options)
+        self.metrics: TerraMetrics | None = None
+        if entry.options.get(CONF_DIAGNOSTIC_METRICS, False):
+            self.metrics = client.metrics = TerraMetrics()
+        self.min_poll: int = entry.options.get(
+            CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+        )
+        self.max_poll: int = entry.options.get(
+            CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+        )
+        self.stale_max_age = timedelta(
+            minutes=entry.options.get(CONF_STALE_MAX_AGE, DEFAULT_STALE_MAX_AGE)
+        )
+        self.species_sensors: bool = entry.options.get(CONF_SPECIES_SENSORS, False)
+        self.yard_lists = TerraYardListCache(hass, entry.entry_id)
+        self.history = TerraDetectionHistory(hass, entry.entry_id)
+        self.statistics = TerraStatistics(hass, self)
+        self.backfill = TerraBackfill(hass, self)
+        self.media = async_get_media_cache(hass)
+        self.stations: dict[str, TerraStationCoordinator] = {}
+        # False while the station list is carried over from a failed fetch
+        self.stations_fresh = True
+        self._restored: dict[str, TerraStationData] = {}
+        self._snapshot_store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshot"
+        )
+        self._semaphore = asyncio.Semaphore(
+            entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
+        )
+        self._breaker = CircuitBreaker()
+        self.refresh_requests = RefreshRequests(
+            hass, entry, f"{DOMAIN} stations", self._async_refresh_stations
+        )
 
-    async def _async_update_data(self) -> TerraData:
-        """Fetch data from the API."""
+    async def async_restore(self) -> bool:
+        """Load persisted state; return True if a data snapshot was restored.
+
+        A restored snapshot lets entities be created before the first live
+        refresh. They are reported as stale until their station refreshes,
+        and slices older than the maximum age are reported as unavailable.
+        """
+        await self.yard_lists.async_load()
+        await self.history.async_load()
+        if not (stored := await self._snapshot_store.async_load()):
+            return False
         try:
-            return await self.hass.async_add_executor_job(self._fetch_data)
+            data = TerraData.from_dict(stored)
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.warning("Discarding invalid data snapshot")
+            return False
+        now = dt_util.utcnow()
+        for station_id, station_data in data.stations.items():
+            station_data.yard_list = self.yard_lists.get(station_id)
+            self._restored[station_id] = station_data.with_staleness(
+                set(station_data.updated), now, self.stale_max_age
+            )
+        self.data = {
+            station_id: station_data.station
+            for station_id, station_data in data.stations.items()
+        }
+        return True
+
+    async def _async_update_data(self) -> dict[str, Station]:
+        """Fetch the station list.
+
+        Without any previous list there is nothing to fall back to, so a
+        failure fails the refresh; otherwise the known stations are kept.
+        """
+        now = time.monotonic()
+        if self.data is not None and not self._breaker.allow(now):
+            self.stations_fresh = False
+            return self.data
+        try:
+            devices = await self.async_call(self.client.get_devices)
+        except TerraAuthError as err:
+            raise ConfigEntryAuthFailed(
+                f"Terra Listens rejected the credentials: {err}"
+            ) from err
         except TerraError as err:
-            raise UpdateFailed(f"Error communicating with Terra API: {err}") from err
+            self._breaker.record_failure(now, str(err))
+            # Retry sooner than the usual hour, but not while the breaker is open
+            self.update_interval = timedelta(
+                seconds=max(
+                    RETRY_INTERVAL.total_seconds(), self._breaker.open_until - now
+                )
+            )
+            if self.data is None:
+                raise UpdateFailed(
+                    f"Error communicating with Terra API: {err}"
+                ) from err
+            _LOGGER.warning("Failed to get stations, keeping the known ones: %s", err)
+            self.stations_fresh = False
+            return self.data
+        self._breaker.record_success()
+        self.update_interval = ENDPOINT_INTERVALS[ENDPOINT_DEVICES]
+        self.stations_fresh = True
+        return {device.id: device for device in devices}
 
-    def _fetch_data(self) -> TerraData:
-        """Synchronous data fetch (runs in executor)."""
-        devices = self.client.get_devices()
-        data = TerraData()
+    async def _async_refresh_stations(self, endpoints: set[str]) -> None:
+        """Fetch the station list now (the only account-level endpoint)."""
+        await self.async_refresh()
 
-        for device in devices:
-            station_data = TerraStationData(station=device)
-            try:
-                station_data.stats = self.client.get_stats(device.id)
-            except TerraError:
-                _LOGGER.warning("Failed to get stats for %s", device.alias)
+    @callback
+    def async_sync_stations(self) -> None:
+        """Start, update and shut down station coordinators to match the list.
 
-            try:
-                station_data.latest_birds = self.client.get_latest_birds(
-                    device.id, count=5
-                )
-            except TerraError:
-                _LOGGER.warning("Failed to get latest birds for %s", device.alias)
+        Registered as a listener, so it runs after every refresh. New stations
+        are announced together on ``signal_stations_added``, so each platform
+        adds their entities in one batch; the devices (and entities) of
+        removed stations are removed.
+        """
+        if self.data is None:
+            return
+        for station_id in self.stations.keys() - self.data.keys():
+            self._async_remove_station(station_id)
+        added: list[TerraStationCoordinator] = []
+        for station_id, device in self.data.items():
+            if (station := self.stations.get(station_id)) is not None:
+                station.async_set_station(device, fetched=self.stations_fresh)
+                continue
+            station = self.stations[station_id] = TerraStationCoordinator(
+                self.hass, self, device
+            )
+            if (restored := self._restored.pop(station_id, None)) is not None:
+                station.async_restore(restored)
+            self.config_entry.async_create_background_task(
+                self.hass,
+                station.async_refresh(),
+                f"{DOMAIN} {station_id} first refresh",
+            )
+            added.append(station)
+        if added:
+            async_dispatcher_send(
+                self.hass, signal_stations_added(self.config_entry.entry_id), added
+            )
 
+    @callback
+    def _async_remove_station(self, station_id: str) -> None:
+        station = self.stations.pop(station_id)
+        self.backfill.async_cancel(station_id)
+        self.config_entry.async_create_background_task(
+            self.hass, station.async_shutdown(), f"{DOMAIN} {station_id} shutdown"
+        )
+        device_registry = dr.async_get(self.hass)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, station_id)}
+        ):
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=self.config_entry.entry_id
+            )
+        _LOGGER.info("Station %s is no longer on the account", station.station.alias)
+
+    async def async_call(
+        self, func: Callable[..., Awaitable[_T]], *args: Any, **kwargs: Any
+    ) -> _T:
+        """Await an API call, bounded by the account's concurrency limit.
+
+        Transient errors are retried up to ``API_RETRY_ATTEMPTS`` times with
+        full-jitter exponential backoff. The concurrency slot is released
+        while waiting.
+        """
+        attempt = 0
+        while True:
             try:
-                yard_list = self.client.get_yard_list(device.id, timeframe="all")
-                station_data.yard_list_count = len(yard_list)
-            except TerraError:
-                _LOGGER.warning("Failed to get yard list for %s", device.alias)
+                async with self._semaphore:
+                    return await func(*args, **kwargs)
+            except TerraConnectionError as err:
+                attempt += 1
+                if attempt >= API_RETRY_ATTEMPTS:
+                    raise
+                delay = random.uniform(0, API_RETRY_BACKOFF * 2 ** (attempt - 1))
+                _LOGGER.debug("Retrying in %.1fs after: %s", delay, err)
+                await asyncio.sleep(delay)
+
+    @callback
+    def async_schedule_snapshot_save(self) -> None:
+        """Persist the data of all stations for the next startup, debounced."""
+        self._snapshot_store.async_delay_save(
+            self._snapshot_to_save, SNAPSHOT_SAVE_DELAY
+        )
+
+    @callback
+    def _snapshot_to_save(self) -> dict[str, Any]:
+        return self.as_data().as_dict()
+
+    @callback
+    def as_data(self) -> TerraData:
+        """Return the current data of every station that has any."""
+        return TerraData(
+            stations={
+                station_id: station.data
+                for station_id, station in self.stations.items()
+                if station.data is not None
+            }
+        )
+
+    @callback
+    def breakers_as_dict(self) -> dict[str, dict[str, Any]]:
+        """Summarize circuit breaker states for diagnostics."""
+        now = time.monotonic()
+        breakers = {f"{ENDPOINT_DEVICES}/account": self._breaker.as_dict(now)}
+        for station_id, station in self.stations.items():
+            for endpoint, breaker in station.breakers.items():
+                breakers[f"{endpoint}/{station_id}"] = breaker.as_dict(now)
+        return breakers
+
+
+class TerraStationCoordinator(DataUpdateCoordinator[TerraStationData]):
+    """Fetch the data of one Terra station.
 
-            data.stations[device.id] = station_data
+    Each endpoint has its own cadence (``ENDPOINT_INTERVALS``); latest birds
+    are polled at an interval that adapts to detection activity. The
+    coordinator sleeps until the next endpoint is due and on every tick only
+    calls the endpoints that are due, carrying the other slices over.
+
+    Transient errors are retried with jittered exponential backoff. Each
+    endpoint has a circuit breaker, so one that keeps failing is skipped
+    until its cooldown ends instead of costing a timeout every tick.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        account: TerraAccountCoordinator,
+        station: Station,
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=account.config_entry,
+            name=f"{DOMAIN} {station.alias}",
+            update_interval=timedelta(seconds=account.min_poll),
+        )
+        self.account = account
+        self.station = station
+        self.station_id = station.id
+        # True while ``data`` comes from the startup snapshot, not a live poll
+        self.stale = False
+        # Rebuilt whenever data changes; entities only read from it
+        self.view: StationView | None = None
+        self.device_info: DeviceInfo = station_device_info(station)
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._poll_interval = float(account.min_poll)
+        self._next_due: dict[str, float] = {}
+        self._tracker: DetectionTracker | None = None
+        # Monotonic times of the last webhook push and latest-birds poll
+        self.last_push: float | None = None
+        self._latest_polled: float | None = None
+        # Last latest-birds result; the client returns the same list while
+        # the response is unchanged, which needs no tracking or merging
+        self._polled_birds: list[BirdDetection] | None = None
+        # Endpoints asked for through the refresh service, fetched on the
+        # next tick even when they are not due
+        self.refresh_requests = RefreshRequests(
+            hass, account.config_entry, self.name, self._async_refresh_endpoints
+        )
+        self._requested: set[str] = set()
+        self._fetch_lock = asyncio.Lock()
+        # Species sensors, see species.py. The table is built from the first
+        # yard list; only the listeners of changed species are called.
+        self.species: SpeciesTable | None = None
+        self._species_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._species_changed: set[str] = set()
+        self._species_announced: set[str] = set()
+
+    @callback
+    def async_restore(self, data: TerraStationData) -> None:
+        """Start from snapshot data until the first live refresh."""
+        self.data = data
+        self.stale = True
+        self.view = build_station_view(
+            data,
+            self.account.history.activity(self.station_id),
+            restored=True,
+            media=self.account.media,
+        )
+
+    @callback
+    def async_set_station(self, station: Station, *, fetched: bool) -> None:
+        """Take the station details from the latest station list fetch.
+
+        ``fetched`` is False when the list was carried over after a failure.
+        """
+        if (station.alias, station.version) != (
+            self.station.alias,
+            self.station.version,
+        ):
+            self.device_info = station_device_info(station)
+        self.station = station
+        if self.data is None:
+            return
+        utcnow = dt_util.utcnow()
+        data = replace(self.data, station=station, updated=dict(self.data.updated))
+        stale = set(data.stale)
+        if fetched:
+            data.updated[ENDPOINT_DEVICES] = utcnow
+            stale.discard(ENDPOINT_DEVICES)
+        else:
+            stale.add(ENDPOINT_DEVICES)
+        self.data = data.with_staleness(stale, utcnow, self.account.stale_max_age)
+        self.async_update_listeners()
+
+    def push_active(self, now: float) -> bool:
+        """Return True while detections are being pushed through the webhook."""
+        return (
+            self.last_push is not None
+            and now - self.last_push < PUSH_TIMEOUT.total_seconds()
+        )
+
+    def _push_due(self) -> float:
+        """Return when latest birds are due while pushes arrive.
+
+        They are resynced every ``PUSH_RESYNC_INTERVAL``, or as soon as no
+        push has arrived for ``PUSH_TIMEOUT``.
+        """
+        assert self.last_push is not None
+        polled = self.last_push if self._latest_polled is None else self._latest_polled
+        return min(
+            polled + PUSH_RESYNC_INTERVAL.total_seconds(),
+            self.last_push + PUSH_TIMEOUT.total_seconds(),
+        )
 
+    async def async_push_detections(self, detections: list[BirdDetection]) -> None:
+        """Apply detections pushed through the webhook.
+
+        They go through the same de-duplication, events, history and yard
+        list merge as polled ones, and each push defers the next latest-birds
+        poll. Pushes before the first poll are dropped; that poll covers them
+        and seeds the de-duplication, so a restored station does not replay
+        its recent detections as events.
+        """
+        now = time.monotonic()
+        self.last_push = now
+        # A push must not interleave with a poll applying the same detections
+        async with self._fetch_lock:
+            if self._tracker is not None and self.data is not None:
+                await self._async_push_detections_locked(detections, now)
+
+    async def _async_push_detections_locked(
+        self, detections: list[BirdDetection], now: float
+    ) -> None:
+        assert self.data is not None
+        utcnow = dt_util.utcnow()
+        known = {bird.id: bird for bird in (*detections, *self.data.latest_birds)}
+        latest = sorted(known.values(), key=attrgetter("epoch"), reverse=True)
+        data = replace(
+            self.data,
+            latest_birds=latest[:LATEST_BIRDS_COUNT],
+            new_detections=self._async_track_detections(detections),
+            updated=dict(self.data.updated),
+        )
+        await self.account.history.async_add(self.station_id, detections)
+        yard_lists = self.account.yard_lists
+        yard_lists.async_merge_detections(self.station_id, detections)
+        if self.account.species_sensors:
+            await self._async_update_species(False, data.new_detections)
+        data.yard_list = yard_lists.get(self.station_id)
+        data.yard_list_count = len(data.yard_list)
+        stale = set(data.stale) - {ENDPOINT_LATEST_BIRDS}
+        data.updated[ENDPOINT_LATEST_BIRDS] = utcnow
+        if self.station_id in yard_lists:
+            data.updated[ENDPOINT_YARD_LIST] = utcnow
+        self._next_due[ENDPOINT_LATEST_BIRDS] = self._push_due()
+        self._async_set_next_tick(now)
+        self.async_set_updated_data(
+            data.with_staleness(stale, utcnow, self.account.stale_max_age)
+        )
+
+    @callback
+    def async_push_station(self, station: Station) -> None:
+        """Apply a station status pushed through the webhook."""
+        self.async_set_station(station, fetched=True)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Rebuild the entity view once, then notify the entities."""
+        if self.data is not None:
+            self.view = build_station_view(
+                self.data,
+                self.account.history.activity(self.station_id),
+                restored=self.stale,
+                media=self.account.media,
+            )
+        super().async_update_listeners()
+        if self._species_changed:
+            self._async_notify_species()
+
+    @callback
+    def async_add_species_listener(
+        self, code: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Call ``update_callback`` whenever the species' record changes."""
+        listeners = self._species_listeners.setdefault(code, [])
+        listeners.append(update_callback)
+
+        @callback
+        def _async_remove() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                del self._species_listeners[code]
+
+        return _async_remove
+
+    @callback
+    def _async_notify_species(self) -> None:
+        """Update the sensors of changed species and announce new species."""
+        changed, self._species_changed = self._species_changed, set()
+        for code in changed:
+            for update_callback in list(self._species_listeners.get(code, ())):
+                update_callback()
+        if self.species is not None and (
+            added := sorted(
+                code
+                for code in changed
+                if code in self.species and code not in self._species_announced
+            )
+        ):
+            self._species_announced.update(added)
+            async_dispatcher_send(
+                self.hass,
+                signal_species_added(self.config_entry.entry_id),
+                self,
+                added,
+            )
+
+    async def _async_update_species(
+        self, downloaded: bool, new_detections: list[BirdDetection]
+    ) -> None:
+        """Keep the species table current and note which species changed.
+
+        The table is rebuilt from the yard list when one was downloaded (it
+        already counts the detections fetched with it) or on the first poll;
+        otherwise only the species of new detections are counted.
+        """
+        if self.species is not None and not downloaded:
+            self._species_changed |= self.species.add_detections(new_detections)
+            return
+        if self.station_id not in self.account.yard_lists:
+            return
+        try:
+            last_seen = await self.account.history.async_last_seen(self.station_id)
+        except sqlite3.Error as err:
+            _LOGGER.warning(
+                "Failed to read the detection history of %s: %s",
+                self.station.alias,
+                err,
+            )
+            last_seen = {}
+        if self.species is None:
+            self.species = SpeciesTable()
+        self._species_changed |= self.species.replace(
+            self.account.yard_lists.get(self.station_id), last_seen
+        )
+
+    async def _async_refresh_endpoints(self, endpoints: set[str]) -> None:
+        """Fetch the requested endpoints now, whenever they would be due."""
+        for endpoint in endpoints:
+            self._next_due[endpoint] = 0.0
+        self._requested |= endpoints
+        await self.async_refresh()
+
+    async def async_wait_idle(self) -> None:
+        """Wait until a fetch in progress has finished."""
+        async with self._fetch_lock:
+            pass
+
+    async def _async_update_data(self) -> TerraStationData:
+        """Fetch the endpoints that are due from the API."""
+        # A requested refresh must not overlap a scheduled one
+        async with self._fetch_lock:
+            return await self._async_update_data_locked()
+
+    async def _async_update_data_locked(self) -> TerraStationData:
+        now = time.monotonic()
+        try:
+            data = await self._async_fetch(now)
+        except TerraAuthError as err:
+            raise ConfigEntryAuthFailed(
+                f"Terra Listens rejected the credentials: {err}"
+            ) from err
+        self.stale = False
+        self._async_set_next_tick(now)
+        self.account.async_schedule_snapshot_save()
         return data
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return the circuit breaker of an endpoint, creating it on first use."""
+        if (breaker := self.breakers.get(endpoint)) is None:
+            breaker = self.breakers[endpoint] = CircuitBreaker()
+        return breaker
+
+    def _is_due(self, now: float, endpoint: str) -> bool:
+        """Return True if the endpoint should be called on this tick."""
+        if (breaker := self.breakers.get(endpoint)) is not None and not (
+            breaker.allow(now)
+        ):
+            return False
+        return now >= self._next_due.get(endpoint, 0.0)
+
+    def _schedule(
+        self,
+        now: float,
+        endpoint: str,
+        *,
+        interval: timedelta | None = None,
+        failed: bool = False,
+    ) -> None:
+        """Schedule the next call of an endpoint.
+
+        A failed call is retried sooner, but not before its breaker's cooldown
+        has ended.
+        """
+        if interval is None:
+            interval = ENDPOINT_INTERVALS[endpoint]
+        next_due = now + interval.total_seconds()
+        if failed:
+            next_due = now + min(interval, RETRY_INTERVAL).total_seconds()
+            if (breaker := self.breakers.get(endpoint)) is not None:
+                next_due = max(next_due, breaker.open_until)
+        self._next_due[endpoint] = next_due
+
+    @callback
+    def _async_set_next_tick(self, now: float) -> None:
+        """Sleep until the next endpoint is due, but never less than the minimum."""
+        next_due = min(self._next_due.values(), default=now + self.account.max_poll)
+        self.update_interval = timedelta(
+            seconds=max(next_due - now, self.account.min_poll)
+        )
+
+    def _adapt_poll_interval(self, new_detections: list[BirdDetection]) -> timedelta:
+        """Return the next latest-birds interval.
+
+        Snaps to the minimum as soon as something is detected, jumps to the
+        maximum while the station is not streaming and otherwise backs off
+        geometrically while it stays quiet.
+        """
+        if new_detections:
+            seconds = float(self.account.min_poll)
+        elif not self.station.streaming:
+            seconds = float(self.account.max_poll)
+        else:
+            seconds = min(
+                self._poll_interval * POLL_BACKOFF_FACTOR, self.account.max_poll
+            )
+        self._poll_interval = seconds
+        return timedelta(seconds=seconds)
+
+    async def _async_fetch(self, now: float) -> TerraStationData:
+        """Refresh the slices whose endpoints are due.
+
+        Slices whose fetch failed keep their last good value and stay stale
+        until a later fetch succeeds.
+        """
+        device = self.station
+        client = self.account.client
+        yard_lists = self.account.yard_lists
+        requested, self._requested = self._requested, set()
+        calls: dict[str, Coroutine[Any, Any, Any]] = {}
+        if self._is_due(now, ENDPOINT_STATS):
+            calls[ENDPOINT_STATS] = self._async_try_call(
+                ENDPOINT_STATS, self.account.async_call(client.get_stats, device.id)
+            )
+        if self._is_due(now, ENDPOINT_LATEST_BIRDS):
+            calls[ENDPOINT_LATEST_BIRDS] = self._async_try_call(
+                ENDPOINT_LATEST_BIRDS, self._async_fetch_latest_birds()
+            )
+        if self._is_due(now, ENDPOINT_YARD_LIST) and (
+            ENDPOINT_YARD_LIST in requested or yard_lists.needs_resync(device.id)
+        ):
+            calls[ENDPOINT_YARD_LIST] = self._async_try_call(
+                ENDPOINT_YARD_LIST,
+                self.account.async_call(
+                    client.get_yard_list, device.id, timeframe="all"
+                ),
+            )
+        results = dict(zip(calls, await asyncio.gather(*calls.values())))
+        for endpoint, result in results.items():
+            if endpoint != ENDPOINT_LATEST_BIRDS:
+                self._schedule(now, endpoint, failed=result is None)
+
+        utcnow = dt_util.utcnow()
+        previous = self.data
+        if previous is None:
+            station_data = TerraStationData(station=device)
+            stale: set[str] = set()
+        else:
+            station_data = replace(
+                previous, station=device, updated=dict(previous.updated)
+            )
+            stale = set(previous.stale)
+        for endpoint, result in results.items():
+            if result is None:
+                stale.add(endpoint)
+            else:
+                stale.discard(endpoint)
+                station_data.updated[endpoint] = utcnow
+
+        if (stats := results.get(ENDPOINT_STATS)) is not None:
+            station_data.stats = stats
+        station_data.new_detections = []
+        birds: list[BirdDetection] = results.get(ENDPOINT_LATEST_BIRDS) or []
+        if results.get(ENDPOINT_LATEST_BIRDS) is not None:
+            if birds is not self._polled_birds:
+                self._polled_birds = birds
+                station_data.latest_birds = birds[:LATEST_BIRDS_COUNT]
+                station_data.new_detections = self._async_track_detections(birds)
+                await self.account.history.async_add(device.id, birds)
+                yard_lists.async_merge_detections(device.id, birds)
+            self._schedule(
+                now,
+                ENDPOINT_LATEST_BIRDS,
+                interval=self._adapt_poll_interval(station_data.new_detections),
+            )
+        elif ENDPOINT_LATEST_BIRDS in results:
+            self._schedule(
+                now,
+                ENDPOINT_LATEST_BIRDS,
+                interval=timedelta(seconds=self._poll_interval),
+                failed=True,
+            )
+        if ENDPOINT_LATEST_BIRDS in results:
+            self._latest_polled = now
+            if self.push_active(now):
+                self._next_due[ENDPOINT_LATEST_BIRDS] = self._push_due()
+
+        if (yard_list := results.get(ENDPOINT_YARD_LIST)) is not None:
+            yard_lists.async_replace(device.id, yard_list, birds)
+            self._async_prefetch_media(yard_list)
+        if self.account.species_sensors:
+            await self._async_update_species(
+                yard_list is not None, station_data.new_detections
+            )
+        station_data.yard_list = yard_lists.get(device.id)
+        station_data.yard_list_count = len(station_data.yard_list)
+        if device.id not in yard_lists:
+            stale.add(ENDPOINT_YARD_LIST)
+        elif results.get(ENDPOINT_LATEST_BIRDS) is not None:
+            # Merged detections keep the cached list current between downloads
+            station_data.updated[ENDPOINT_YARD_LIST] = utcnow
+        return station_data.with_staleness(stale, utcnow, self.account.stale_max_age)
+
+    @callback
+    def _async_prefetch_media(self, yard_list: list[YardListEntry]) -> None:
+        """Cache the images of the station's most sighted species."""
+        common = heapq.nlargest(
+            MEDIA_PREFETCH_SPECIES, yard_list, key=attrgetter("sighting_count")
+        )
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.account.media.async_prefetch(
+                (entry.species_code, entry.image_url) for entry in common
+            ),
+            f"{DOMAIN} {self.station.alias} media prefetch",
+        )
+
+    async def _async_fetch_latest_birds(self) -> list[BirdDetection]:
+        """Fetch latest detections, widening the window if it may have a gap.
+
+        If every returned detection is new, more may have happened since the
+        last poll than fit in the window, so the count is doubled (up to
+        ``LATEST_BIRDS_MAX_COUNT``) and the call repeated.
+        """
+        get_latest_birds = self.account.client.get_latest_birds
+        count = LATEST_BIRDS_COUNT
+        birds = await self.account.async_call(
+            get_latest_birds, self.station_id, count=count
+        )
+        if (tracker := self._tracker) is None:
+            return birds
+        while (
+            len(birds) >= count
+            and count < LATEST_BIRDS_MAX_COUNT
+            and not any(bird.id in tracker for bird in birds)
+        ):
+            count = min(count * 2, LATEST_BIRDS_MAX_COUNT)
+            birds = await self.account.async_call(
+                get_latest_birds, self.station_id, count=count
+            )
+        return birds
+
+    @callback
+    def _async_track_detections(
+        self, birds: list[BirdDetection]
+    ) -> list[BirdDetection]:
+        """Return the detections not seen before and fire an event for each.
+
+        The first batch seen for the station only seeds the tracker, so a
+        restart does not replay the station's recent history as events.
+        """
+        if (tracker := self._tracker) is None:
+            self._tracker = DetectionTracker()
+            self._tracker.seed(birds)
+            return []
+
+        new = tracker.filter_new(birds)
+        for bird in new:
+            self.hass.bus.async_fire(
+                EVENT_DETECTION,
+                {
+                    "station_id": self.station_id,
+                    "station_name": self.station.alias,
+                    "detection_id": bird.id,
+                    "common_name": bird.common_name,
+                    "scientific_name": bird.scientific_name,
+                    "alpha_code": bird.alpha_code,
+                    "confidence": bird.confidence,
+                    "timestamp": bird.timestamp,
+                    "epoch": bird.epoch,
+                    "image_url": bird.image_url,
+                    "audio_url": bird.audio_url,
+                },
+            )
+        return new
+
+    async def _async_try_call(self, endpoint: str, call: Awaitable[_T]) -> _T | None:
+        """Await a call, logging a warning instead of raising on failure.
+
+        The outcome is recorded on the endpoint's circuit breaker.
+        """
+        breaker = self._breaker(endpoint)
+        try:
+            result = await call
+        except TerraAuthError:
+            raise
+        except TerraError as err:
+            what = endpoint.replace("_", " ")
+            now = time.monotonic()
+            if breaker.record_failure(now, str(err)):
+                _LOGGER.warning(
+                    "Failed to get %s for %s %d times in a row, pausing for %ds",
+                    what,
+                    self.station.alias,
+                    breaker.failures,
+                    breaker.open_until - now,
+                )
+            else:
+                _LOGGER.warning("Failed to get %s for %s", what, self.station.alias)
+            return None
+        breaker.record_success()
+        return result
+
+
+@callback
+def signal_species_added(entry_id: str) -> str:
+    """Return the dispatcher signal sent with a station's newly seen species."""
+    return f"{DOMAIN}_{entry_id}_species_added"
+
+
+@callback
+def signal_stations_added(entry_id: str) -> str:
+    """Return the dispatcher signal sent with newly discovered stations."""
+    return f"{DOMAIN}_{entry_id}_stations_added"
+
+
+async def async_remove_persisted_data(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete everything a config entry keeps in storage."""
+    await Store(
+        hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+    ).async_remove()
+    await TerraYardListCache(hass, entry_id).async_remove()
+    await async_remove_history(hass, entry_id)
+    await async_remove_statistics_state(hass, entry_id)
@@ -0,0 +1,48 @@
+"""Detection de-duplication for Terra Listens."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+from terra_sdk.models import BirdDetection
+
+from .const import SEEN_DETECTIONS_MAX
+
+
+class DetectionTracker:
+    """Remember the most recently seen detection IDs of one station.
+
+    Consecutive polls of ``birdIDLatest`` overlap heavily, so the tracker keeps
+    a bounded ring of IDs (with a set for O(1) lookups) and only lets through
+    detections it has not seen before.
+    """
+
+    def __init__(self, maxlen: int = SEEN_DETECTIONS_MAX) -> None:
+        self._order: deque[str] = deque()
+        self._seen: set[str] = set()
+        self._maxlen = maxlen
+
+    def __contains__(self, detection_id: object) -> bool:
+        return detection_id in self._seen
+
+    def _add(self, detection_id: str) -> None:
+        if len(self._order) >= self._maxlen:
+            self._seen.discard(self._order.popleft())
+        self._order.append(detection_id)
+        self._seen.add(detection_id)
+
+    def seed(self, detections: Iterable[BirdDetection]) -> None:
+        """Mark detections as seen without reporting them."""
+        for detection in detections:
+            if detection.id not in self._seen:
+                self._add(detection.id)
+
+    def filter_new(self, detections: Iterable[BirdDetection]) -> list[BirdDetection]:
+        """Return unseen detections, oldest first, and mark them as seen."""
+        new: list[BirdDetection] = []
+        for detection in sorted(detections, key=lambda d: d.epoch):
+            if detection.id not in self._seen:
+                self._add(detection.id)
+                new.append(detection)
+        return new
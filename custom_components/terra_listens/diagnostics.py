@@ -0,0 +1,59 @@
+"""Diagnostics support for Terra Listens."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_TOKEN, CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import TerraAccountCoordinator
+
+TO_REDACT = {
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_WEBHOOK_ID,
+    "ip_address",
+    "serial",
+    "lat",
+    "lon",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    account: TerraAccountCoordinator = hass.data[DOMAIN][entry.entry_id]
+    now = time.monotonic()
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": account.last_update_success,
+            "stations_fresh": account.stations_fresh,
+            "stations": {
+                station_id: {
+                    "last_update_success": station.last_update_success,
+                    "update_interval_s": (
+                        station.update_interval.total_seconds()
+                        if station.update_interval
+                        else None
+                    ),
+                    "stale": station.stale,
+                    "push_active": station.push_active(now),
+                }
+                for station_id, station in account.stations.items()
+            },
+            "circuit_breakers": account.breakers_as_dict(),
+        },
+        "metrics": account.metrics.as_dict() if account.metrics is not None else None,
+        "data": async_redact_data(account.as_data().as_dict(), TO_REDACT),
+    }
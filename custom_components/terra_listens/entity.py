@@ -2,40 +2,117 @@
 
 from __future__ import annotations
 
+from abc import abstractmethod
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL
-from .coordinator import TerraDataUpdateCoordinator
+from .const import DOMAIN
+from .coordinator import (
+    TerraAccountCoordinator,
+    TerraStationCoordinator,
+    signal_stations_added,
+)
+from .views import StationView
+
+
+@callback
+def async_setup_station_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    entities_fn: Callable[[TerraStationCoordinator], Iterable[Entity]],
+) -> None:
+    """Add a platform's entities for every station, now and when discovered.
 
+    Entities of a station that leaves the account are removed together with
+    its device by the account coordinator.
+    """
+    account: TerraAccountCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-class TerraEntity(CoordinatorEntity[TerraDataUpdateCoordinator]):
-    """Base class for Terra Listens entities."""
+    @callback
+    def _async_add_stations(stations: Iterable[TerraStationCoordinator]) -> None:
+        # One batch for all stations, however many the account has
+        entities = [entity for station in stations for entity in entities_fn(station)]
+        if entities:
+            async_add_entities(entities)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, signal_stations_added(entry.entry_id), _async_add_stations
+        )
+    )
+    _async_add_stations(account.stations.values())
+
+
+class TerraEntity(CoordinatorEntity[TerraStationCoordinator]):
+    """Base class for Terra Listens entities of one station."""
 
     _attr_has_entity_name = True
+    # Endpoint whose slice this entity shows, for per-slice staleness
+    _endpoint: str | None = None
 
-    def __init__(
-        self,
-        coordinator: TerraDataUpdateCoordinator,
-        station_id: str,
-    ) -> None:
+    def __init__(self, coordinator: TerraStationCoordinator) -> None:
         super().__init__(coordinator)
-        self._station_id = station_id
+        self._station_id = coordinator.station_id
+        self._last_fingerprint: tuple[Any, ...] | None = None
 
     @property
-    def _station_data(self):
-        """Get the station data from the coordinator."""
-        return self.coordinator.data.stations.get(self._station_id)
+    def _view(self) -> StationView | None:
+        """Get the station view (None before the first poll)."""
+        return self.coordinator.view
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for grouping entities under a station."""
-        station = self._station_data.station if self._station_data else None
-        name = station.alias if station else self._station_id
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._station_id)},
-            name=f"Terra {name}",
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-            sw_version=station.version if station else None,
-        )
+        return self.coordinator.device_info
+
+    @property
+    def available(self) -> bool:
+        """Return False before the first poll or once the slice is too stale."""
+        if not super().available or (view := self._view) is None:
+            return False
+        return self._endpoint not in view.expired
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Flag restored or carried-forward values as stale."""
+        if (view := self._view) is None:
+            return None
+        return view.attributes.get(self._endpoint)
+
+    @abstractmethod
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return the values that make up this entity's written state.
+
+        Availability and ``extra_state_attributes`` are always compared.
+        """
+
+    def _fingerprint(self) -> tuple[Any, ...]:
+        return (self.available, self.extra_state_attributes, *self._state_fingerprint())
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._last_fingerprint = self._fingerprint()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this entity's value or attributes changed.
+
+        Every refresh produces a new ``StationView``, but most slices of a station
+        are identical to the last poll, so comparing fingerprints avoids
+        recorder writes and websocket traffic for unchanged entities.
+        """
+        fingerprint = self._fingerprint()
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        super()._handle_coordinator_update()
@@ -0,0 +1,395 @@
+"""Local detection history for Terra Listens."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from collections import Counter, deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from terra_sdk.models import BirdDetection
+
+from .const import DOMAIN, HISTORY_PRUNE_INTERVAL, HISTORY_RETENTION
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = 3600  # seconds
+DAY = 24 * HOUR
+HOUR_BUCKET = 300  # seconds per bucket of the last-hour window
+DAY_BUCKET = HOUR  # seconds per bucket of the last-day window
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS detections (
+        station_id TEXT NOT NULL,
+        detection_id TEXT NOT NULL,
+        epoch INTEGER NOT NULL,
+        species TEXT NOT NULL,
+        common_name TEXT NOT NULL,
+        confidence REAL NOT NULL,
+        PRIMARY KEY (station_id, detection_id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS detections_epoch ON detections (epoch)",
+    """
+    CREATE INDEX IF NOT EXISTS detections_station_epoch
+    ON detections (station_id, epoch)
+    """,
+    # Records paged through by an unfinished backfill, see backfill.py
+    """
+    CREATE TABLE IF NOT EXISTS backfill (
+        station_id TEXT PRIMARY KEY,
+        fetched INTEGER NOT NULL
+    )
+    """,
+)
+
+
+def _history_path(hass: HomeAssistant, entry_id: str) -> str:
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.history.db")
+
+
+def _species(detection: BirdDetection) -> str:
+    return detection.alpha_code or detection.common_name
+
+
+class RollingCounts:
+    """Detection and species counts over a sliding window of fixed buckets.
+
+    Adding a detection and reading the totals never rescan the window:
+    buckets that fall out of it are subtracted from the running totals.
+    The window is exact to one bucket.
+    """
+
+    __slots__ = ("_bucket", "_buckets", "_species", "_window", "calls")
+
+    def __init__(self, window: int, bucket: int) -> None:
+        self._window = window
+        self._bucket = bucket
+        # (bucket start, calls per species), oldest first
+        self._buckets: deque[tuple[int, Counter[str]]] = deque()
+        self._species: Counter[str] = Counter()
+        self.calls = 0
+
+    @property
+    def species(self) -> int:
+        """Return the number of distinct species in the window."""
+        return len(self._species)
+
+    def add(self, now: float, epoch: int, species: str, count: int = 1) -> None:
+        """Count detections of a species at ``epoch``."""
+        self.expire(now)
+        if epoch <= now - self._window:
+            return
+        start = epoch - epoch % self._bucket
+        buckets = self._buckets
+        # Detections arrive (almost) in order, so look from the newest end
+        index = len(buckets)
+        while index and buckets[index - 1][0] > start:
+            index -= 1
+        if index and buckets[index - 1][0] == start:
+            counts = buckets[index - 1][1]
+        else:
+            counts = Counter()
+            buckets.insert(index, (start, counts))
+        counts[species] += count
+        self._species[species] += count
+        self.calls += count
+
+    def expire(self, now: float) -> None:
+        """Drop the buckets that ended before the window."""
+        cutoff = now - self._window
+        while self._buckets and self._buckets[0][0] + self._bucket <= cutoff:
+            _, counts = self._buckets.popleft()
+            self.calls -= counts.total()
+            for species, count in counts.items():
+                if (left := self._species[species] - count) > 0:
+                    self._species[species] = left
+                else:
+                    del self._species[species]
+
+
+@dataclass(frozen=True, slots=True)
+class DetectionActivity:
+    """Rolling detection counts of one station."""
+
+    calls_last_hour: int
+    calls_last_24h: int
+    species_last_24h: int
+
+
+class TerraDetectionHistory:
+    """Keep the detections of every station in a local SQLite database.
+
+    Detections older than ``HISTORY_RETENTION`` are pruned. Rolling counts
+    for the last hour and day are kept in memory and updated as detections
+    are stored; on start they are rebuilt with one grouped query over the
+    last day, which the epoch index keeps fast however long the history is.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._hass = hass
+        self._path = _history_path(hass, entry_id)
+        self._conn: sqlite3.Connection | None = None
+        # Executor jobs may run on different threads
+        self._lock = threading.Lock()
+        self._pruned = 0.0
+        self._windows: dict[str, tuple[RollingCounts, RollingCounts]] = {}
+        # Station ID -> start of the earliest hour given new detections since
+        # the statistics import last recounted the station
+        self._changed_hours: dict[str, int] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def _windows_for(self, station_id: str) -> tuple[RollingCounts, RollingCounts]:
+        if (windows := self._windows.get(station_id)) is None:
+            windows = self._windows[station_id] = (
+                RollingCounts(HOUR, HOUR_BUCKET),
+                RollingCounts(DAY, DAY_BUCKET),
+            )
+        return windows
+
+    async def async_load(self) -> None:
+        """Open the database and rebuild the rolling counts."""
+        now = dt_util.utcnow().timestamp()
+        try:
+            rows = await self._hass.async_add_executor_job(self._load, now)
+        except sqlite3.Error as err:
+            _LOGGER.warning("Failed to load the detection history: %s", err)
+            return
+        for station_id, epoch, species, count in rows:
+            for window in self._windows_for(station_id):
+                window.add(now, epoch, species, count)
+
+    def _load(self, now: float) -> list[tuple[str, int, str, int]]:
+        with self._lock:
+            conn = self._connect()
+            self._prune(conn, now)
+            return conn.execute(
+                f"""
+                SELECT station_id, epoch - epoch % {HOUR_BUCKET} AS bucket,
+                    species, COUNT(*)
+                FROM detections WHERE epoch > ?
+                GROUP BY station_id, bucket, species
+                ORDER BY bucket
+                """,
+                (int(now) - DAY,),
+            ).fetchall()
+
+    async def async_add(
+        self, station_id: str, detections: Iterable[BirdDetection]
+    ) -> list[BirdDetection]:
+        """Store detections and return the ones that were not stored before."""
+        now = dt_util.utcnow().timestamp()
+        try:
+            stored = await self._hass.async_add_executor_job(
+                self._insert, station_id, list(detections), now
+            )
+        except sqlite3.Error as err:
+            _LOGGER.warning("Failed to store detections of %s: %s", station_id, err)
+            return []
+        self._count(station_id, stored, now)
+        return stored
+
+    async def async_add_backfill(
+        self, station_id: str, detections: Iterable[BirdDetection], fetched: int
+    ) -> int:
+        """Store a backfilled page and return how many detections were new.
+
+        The number of records ``fetched`` so far is saved with the page, so an
+        interrupted backfill resumes after it. Raises ``sqlite3.Error`` if the
+        page cannot be stored.
+        """
+        now = dt_util.utcnow().timestamp()
+        stored = await self._hass.async_add_executor_job(
+            self._insert, station_id, list(detections), now, fetched
+        )
+        self._count(station_id, stored, now)
+        return len(stored)
+
+    def _count(
+        self, station_id: str, detections: list[BirdDetection], now: float
+    ) -> None:
+        windows = self._windows_for(station_id)
+        for detection in detections:
+            for window in windows:
+                window.add(now, detection.epoch, _species(detection))
+        if detections:
+            self.mark_changed(station_id, min(d.epoch for d in detections))
+
+    def mark_changed(self, station_id: str, epoch: int) -> None:
+        """Note that a station's hourly counts changed from ``epoch`` on."""
+        hour = epoch - epoch % HOUR
+        self._changed_hours[station_id] = min(
+            hour, self._changed_hours.get(station_id, hour)
+        )
+
+    def pop_changed(self, station_id: str) -> int | None:
+        """Return and forget the earliest hour with new detections of a station."""
+        return self._changed_hours.pop(station_id, None)
+
+    def _insert(
+        self,
+        station_id: str,
+        detections: list[BirdDetection],
+        now: float,
+        fetched: int | None = None,
+    ) -> list[BirdDetection]:
+        stored: list[BirdDetection] = []
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if fetched is not None:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO backfill VALUES (?, ?)",
+                        (station_id, fetched),
+                    )
+                for detection in detections:
+                    cursor = conn.execute(
+                        "INSERT OR IGNORE INTO detections VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            station_id,
+                            detection.id,
+                            detection.epoch,
+                            _species(detection),
+                            detection.common_name,
+                            detection.confidence,
+                        ),
+                    )
+                    if cursor.rowcount:
+                        stored.append(detection)
+            if now - self._pruned >= HISTORY_PRUNE_INTERVAL.total_seconds():
+                self._prune(conn, now)
+        return stored
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        cutoff = int(now - HISTORY_RETENTION.total_seconds())
+        with conn:
+            conn.execute("DELETE FROM detections WHERE epoch < ?", (cutoff,))
+        self._pruned = now
+
+    async def async_hourly_counts(
+        self, station_id: str, since: int, until: int
+    ) -> dict[int, int]:
+        """Return a station's detections per hour start in ``[since, until)``.
+
+        Raises ``sqlite3.Error`` if the database cannot be read.
+        """
+        return await self._hass.async_add_executor_job(
+            self._hourly_counts, station_id, since, until
+        )
+
+    def _hourly_counts(self, station_id: str, since: int, until: int) -> dict[int, int]:
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    f"""
+                    SELECT epoch - epoch % {HOUR} AS hour, COUNT(*)
+                    FROM detections
+                    WHERE station_id = ? AND epoch >= ? AND epoch < ?
+                    GROUP BY hour
+                    """,
+                    (station_id, since, until),
+                )
+                .fetchall()
+            )
+        return dict(rows)
+
+    async def async_last_seen(self, station_id: str) -> dict[str, int]:
+        """Return the epoch of the latest detection of each species of a station.
+
+        Species are keyed by common name, which the yard list shares with
+        detections. Raises ``sqlite3.Error`` if the database cannot be read.
+        """
+        return await self._hass.async_add_executor_job(self._last_seen, station_id)
+
+    def _last_seen(self, station_id: str) -> dict[str, int]:
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    """
+                    SELECT common_name, MAX(epoch) FROM detections
+                    WHERE station_id = ? GROUP BY common_name
+                    """,
+                    (station_id,),
+                )
+                .fetchall()
+            )
+        return dict(rows)
+
+    async def async_backfills(self) -> dict[str, int]:
+        """Return the records fetched so far by each unfinished backfill.
+
+        Raises ``sqlite3.Error`` if the database cannot be read.
+        """
+        return await self._hass.async_add_executor_job(self._backfills)
+
+    def _backfills(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._connect().execute("SELECT * FROM backfill").fetchall()
+        return dict(rows)
+
+    async def async_end_backfill(self, station_id: str) -> None:
+        """Forget the checkpoint of a finished backfill.
+
+        Raises ``sqlite3.Error`` if the database cannot be written.
+        """
+        await self._hass.async_add_executor_job(self._end_backfill, station_id)
+
+    def _end_backfill(self, station_id: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM backfill WHERE station_id = ?", (station_id,))
+
+    def activity(self, station_id: str) -> DetectionActivity:
+        """Return the rolling detection counts of a station."""
+        last_hour, last_day = self._windows_for(station_id)
+        now = dt_util.utcnow().timestamp()
+        last_hour.expire(now)
+        last_day.expire(now)
+        return DetectionActivity(
+            calls_last_hour=last_hour.calls,
+            calls_last_24h=last_day.calls,
+            species_last_24h=last_day.species,
+        )
+
+    async def async_close(self) -> None:
+        """Close the database."""
+        if self._conn is not None:
+            await self._hass.async_add_executor_job(self._close)
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+async def async_remove_history(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the detection history database of a config entry."""
+
+    def _remove() -> None:
+        try:
+            os.remove(_history_path(hass, entry_id))
+        except FileNotFoundError:
+            pass
+
+    await hass.async_add_executor_job(_remove)
@@ -0,0 +1,78 @@
+"""Image platform for Terra Listens."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import ENDPOINT_LATEST_BIRDS
+from .coordinator import TerraStationCoordinator
+from .entity import TerraEntity, async_setup_station_entities
+from .media import CachedMedia, TerraMediaCache
+
+
+class TerraLastBirdImage(TerraEntity, ImageEntity):
+    """The image of the last detected species, served from the media cache."""
+
+    _attr_translation_key = "last_bird_image"
+    _endpoint = ENDPOINT_LATEST_BIRDS
+
+    def __init__(self, coordinator: TerraStationCoordinator) -> None:
+        super().__init__(coordinator)
+        ImageEntity.__init__(self, coordinator.hass)
+        self._attr_unique_id = f"{coordinator.station_id}_last_bird_image"
+        self._media_cache: TerraMediaCache = coordinator.account.media
+        # (alpha code, URL) of the image shown, and its content once loaded
+        self._media_key = self._current_media_key()
+        self._media: CachedMedia | None = None
+        if self._media_key is not None:
+            self._attr_image_last_updated = dt_util.utcnow()
+
+    def _current_media_key(self) -> tuple[str, str] | None:
+        view = self._view
+        if view is None or view.last_bird_image_url is None:
+            return None
+        return (view.last_bird_alpha_code or "", view.last_bird_image_url)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Switch to the new species' image when the last bird changes."""
+        if (key := self._current_media_key()) != self._media_key:
+            self._media_key = key
+            self._media = None
+            self._attr_image_last_updated = dt_util.utcnow()
+        super()._handle_coordinator_update()
+
+    async def async_image(self) -> bytes | None:
+        """Return the image of the last detected species."""
+        if (key := self._media_key) is None:
+            return None
+        if (media := self._media) is None:
+            if (media := await self._media_cache.async_get(*key)) is None:
+                return None
+            if key == self._media_key:
+                self._media = media
+        self._attr_content_type = media.content_type
+        return media.content
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self._media_key,)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Terra Listens image entities."""
+    async_setup_station_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda station: [TerraLastBirdImage(station)],
+    )
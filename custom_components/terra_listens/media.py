@@ -0,0 +1,269 @@
+"""On-disk media cache shared by all Terra Listens config entries."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp import hdrs, web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http.auth import async_sign_path
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import slugify
+
+from .const import (
+    DATA_MEDIA_CACHE,
+    DOMAIN,
+    MEDIA_CACHE_MAX_BYTES,
+    MEDIA_TIMEOUT,
+    MEDIA_URL_VALIDITY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+MEDIA_URL = f"/api/{DOMAIN}/media/{{name}}"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedMedia:
+    """The content of a cached file."""
+
+    content: bytes
+    content_type: str
+
+
+def _file_name(alpha_code: str, url: str) -> str:
+    """Return the cache file name of a species' media URL."""
+    digest = hashlib.sha1(url.encode(), usedforsecurity=False).hexdigest()[:16]
+    extension = os.path.splitext(urlsplit(url).path)[1].lower()[:8]
+    return f"{slugify(alpha_code) or 'unknown'}_{digest}{extension}"
+
+
+def _content_type(name: str) -> str:
+    return mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+
+class TerraMediaCache:
+    """Size-bounded LRU cache of bird images and audio on disk.
+
+    Files are keyed by alpha code and URL, so each species' image is
+    downloaded once however many stations, entities and dashboards show it.
+    Once the cache grows past ``max_bytes`` the least recently used files are
+    deleted. Concurrent requests for a missing file share one download.
+
+    ``async_local_url`` gives a file's signed address in Home Assistant, so
+    entity pictures are served from the cache by ``TerraMediaView`` too.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: aiohttp.ClientSession,
+        directory: str,
+        max_bytes: int = MEDIA_CACHE_MAX_BYTES,
+    ) -> None:
+        self._hass = hass
+        self._session = session
+        self._directory = directory
+        self._max_bytes = max_bytes
+        # File name -> size, least recently used first
+        self._files: OrderedDict[str, int] | None = None
+        self._size = 0
+        self._load_lock = asyncio.Lock()
+        self._downloads: dict[str, asyncio.Future[CachedMedia | None]] = {}
+        # File name -> URL of the files handed out by async_local_url
+        self._sources: dict[str, str] = {}
+        # File name -> signed local URL and when it expires
+        self._signed: dict[str, tuple[str, float]] = {}
+
+    async def _async_load(self) -> OrderedDict[str, int]:
+        """Index the files already on disk, oldest use first."""
+        async with self._load_lock:
+            if self._files is None:
+                files = await self._hass.async_add_executor_job(self._scan)
+                self._files = OrderedDict(files)
+                self._size = sum(self._files.values())
+        return self._files
+
+    def _scan(self) -> list[tuple[str, int]]:
+        os.makedirs(self._directory, exist_ok=True)
+        with os.scandir(self._directory) as entries:
+            files = [
+                (entry.name, entry.stat())
+                for entry in entries
+                if entry.is_file() and not entry.name.endswith(".tmp")
+            ]
+        files.sort(key=lambda file: file[1].st_mtime)
+        return [(name, stat.st_size) for name, stat in files]
+
+    @callback
+    def async_local_url(self, alpha_code: str, url: str) -> str | None:
+        """Return a signed local URL serving a species' media from the cache.
+
+        A signature is reused until half its validity is left, so the URL,
+        and with it the state of the entities showing it, rarely changes.
+        """
+        # Without the HTTP server there is nothing to serve it
+        if not url or "http" not in self._hass.config.components:
+            return None
+        name = _file_name(alpha_code, url)
+        self._sources[name] = url
+        validity = MEDIA_URL_VALIDITY.total_seconds()
+        now = time.time()
+        if (signed := self._signed.get(name)) is None or signed[1] - now < (
+            validity / 2
+        ):
+            signed = self._signed[name] = (
+                async_sign_path(
+                    self._hass, MEDIA_URL.format(name=name), MEDIA_URL_VALIDITY
+                ),
+                now + validity,
+            )
+        return signed[0]
+
+    async def async_get(self, alpha_code: str, url: str) -> CachedMedia | None:
+        """Return a file from the cache, downloading it on a miss."""
+        return await self._async_get(_file_name(alpha_code, url), url)
+
+    async def async_get_local(self, name: str) -> CachedMedia | None:
+        """Return the file behind a local URL, or None if it is not known."""
+        return await self._async_get(name, self._sources.get(name))
+
+    async def _async_get(self, name: str, url: str | None) -> CachedMedia | None:
+        """Return a cached file, downloading it from ``url`` on a miss."""
+        files = await self._async_load()
+        if name in files:
+            files.move_to_end(name)
+            try:
+                content = await self._hass.async_add_executor_job(self._read, name)
+            except OSError:
+                self._forget(name)
+            else:
+                return CachedMedia(content, _content_type(name))
+        if url is None:
+            return None
+        return await self._async_download(name, url)
+
+    async def async_prefetch(self, media: Iterable[tuple[str, str]]) -> None:
+        """Download ``(alpha code, URL)`` pairs that are not cached yet."""
+        files = await self._async_load()
+        for alpha_code, url in media:
+            if url and (name := _file_name(alpha_code, url)) not in files:
+                await self._async_download(name, url)
+
+    def _read(self, name: str) -> bytes:
+        path = os.path.join(self._directory, name)
+        with open(path, "rb") as file:
+            content = file.read()
+        # The modification time orders the files by last use after a restart
+        os.utime(path)
+        return content
+
+    def _forget(self, name: str) -> None:
+        assert self._files is not None
+        if (size := self._files.pop(name, None)) is not None:
+            self._size -= size
+
+    async def _async_download(self, name: str, url: str) -> CachedMedia | None:
+        if (download := self._downloads.get(name)) is None:
+            download = self._downloads[name] = self._hass.async_create_task(
+                self._async_fetch(name, url), f"{DOMAIN} media download"
+            )
+            download.add_done_callback(lambda _: self._downloads.pop(name, None))
+        return await asyncio.shield(download)
+
+    async def _async_fetch(self, name: str, url: str) -> CachedMedia | None:
+        try:
+            async with self._session.get(
+                url, timeout=aiohttp.ClientTimeout(total=MEDIA_TIMEOUT)
+            ) as resp:
+                resp.raise_for_status()
+                content = await resp.read()
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Failed to download %s: %s", url, err)
+            return None
+        media = CachedMedia(content, _content_type(name))
+        if len(content) > self._max_bytes:
+            return media
+        try:
+            await self._hass.async_add_executor_job(self._write, name, content)
+        except OSError as err:
+            _LOGGER.warning("Failed to cache %s: %s", url, err)
+            return media
+
+        assert self._files is not None
+        self._forget(name)
+        self._files[name] = len(content)
+        self._size += len(content)
+        evicted: list[str] = []
+        while self._size > self._max_bytes:
+            old, size = self._files.popitem(last=False)
+            self._size -= size
+            evicted.append(old)
+        if evicted:
+            await self._hass.async_add_executor_job(self._remove, evicted)
+        return media
+
+    def _write(self, name: str, content: bytes) -> None:
+        path = os.path.join(self._directory, name)
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(content)
+        os.replace(temporary, path)
+
+    def _remove(self, names: list[str]) -> None:
+        for name in names:
+            try:
+                os.remove(os.path.join(self._directory, name))
+            except FileNotFoundError:
+                pass
+
+
+class TerraMediaView(HomeAssistantView):
+    """Serve cached species media at the URLs from ``async_local_url``.
+
+    Entity pictures are loaded by image tags, which cannot send credentials,
+    so they use signed URLs. Only files the integration handed out a URL
+    for, or that are already cached, are served.
+    """
+
+    url = MEDIA_URL
+    name = f"api:{DOMAIN}:media"
+
+    def __init__(self, cache: TerraMediaCache) -> None:
+        self._cache = cache
+
+    async def get(self, request: web.Request, name: str) -> web.Response:
+        """Return a cached file."""
+        if (media := await self._cache.async_get_local(name)) is None:
+            raise web.HTTPNotFound
+        return web.Response(
+            body=media.content,
+            content_type=media.content_type,
+            # A file name is derived from its URL, so its content never changes
+            headers={hdrs.CACHE_CONTROL: "private, max-age=86400"},
+        )
+
+
+@callback
+def async_get_media_cache(hass: HomeAssistant) -> TerraMediaCache:
+    """Return the integration-wide media cache, creating it on first use."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (cache := domain_data.get(DATA_MEDIA_CACHE)) is None:
+        cache = domain_data[DATA_MEDIA_CACHE] = TerraMediaCache(
+            hass,
+            async_get_clientsession(hass),
+            hass.config.path(".cache", DOMAIN, "media"),
+        )
+    return cache
@@ -0,0 +1,114 @@
+"""Per-endpoint request metrics for Terra Listens."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from .const import METRICS_WINDOW
+
+# API resource names mapped to the SDK method that calls them
+RESOURCE_ENDPOINTS = {
+    "signIn": "login",
+    "getDevices": "get_devices",
+    "getCurrentStats": "get_stats",
+    "birdIDLatest": "get_latest_birds",
+    "yardList": "get_yard_list",
+    "getGraphStatsCalls": "get_graph_stats",
+}
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class EndpointMetrics:
+    """Rolling latency window and counters for one endpoint (of one station)."""
+
+    __slots__ = ("latencies", "calls", "errors", "payload_bytes", "last_payload_bytes")
+
+    def __init__(self) -> None:
+        self.latencies: deque[float] = deque(maxlen=METRICS_WINDOW)
+        self.calls = 0
+        self.errors = 0
+        self.payload_bytes = 0
+        self.last_payload_bytes = 0
+
+    def add(self, latency: float, error: bool, payload_bytes: int) -> None:
+        """Record one request."""
+        self.latencies.append(latency)
+        self.calls += 1
+        if error:
+            self.errors += 1
+        self.payload_bytes += payload_bytes
+        self.last_payload_bytes = payload_bytes
+
+    def percentile_ms(self, fraction: float) -> float | None:
+        """Return a latency percentile over the rolling window in milliseconds."""
+        if not self.latencies:
+            return None
+        return round(_percentile(sorted(self.latencies), fraction) * 1000, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize for diagnostics and sensor attributes."""
+        ordered = sorted(self.latencies)
+        summary: dict[str, Any] = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "payload_bytes_total": self.payload_bytes,
+            "payload_bytes_last": self.last_payload_bytes,
+        }
+        for name, fraction in (("p50_ms", 0.5), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+            summary[name] = (
+                round(_percentile(ordered, fraction) * 1000, 1) if ordered else None
+            )
+        return summary
+
+
+class TerraMetrics:
+    """Collect request metrics per endpoint and per station."""
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self._stations: dict[str, dict[str, EndpointMetrics]] = {}
+
+    def record(
+        self,
+        resource: str,
+        station_id: str | None,
+        latency: float,
+        *,
+        error: bool = False,
+        payload_bytes: int = 0,
+    ) -> None:
+        """Record one API request."""
+        endpoint = RESOURCE_ENDPOINTS.get(resource, resource)
+        self._endpoints.setdefault(endpoint, EndpointMetrics()).add(
+            latency, error, payload_bytes
+        )
+        if station_id is not None:
+            self._stations.setdefault(station_id, {}).setdefault(
+                endpoint, EndpointMetrics()
+            ).add(latency, error, payload_bytes)
+
+    def station(self, station_id: str) -> dict[str, EndpointMetrics]:
+        """Return the per-endpoint metrics of one station."""
+        return self._stations.get(station_id, {})
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summarize everything for diagnostics."""
+        return {
+            "endpoints": {
+                endpoint: metrics.as_dict()
+                for endpoint, metrics in self._endpoints.items()
+            },
+            "stations": {
+                station_id: {
+                    endpoint: metrics.as_dict()
+                    for endpoint, metrics in endpoints.items()
+                }
+                for station_id, endpoints in self._stations.items()
+            },
+        }
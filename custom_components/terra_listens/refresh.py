@@ -0,0 +1,50 @@
+"""Coalescing of on-demand refresh requests for Terra Listens."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import REFRESH_COALESCE_DELAY
+
+
+class RefreshRequests:
+    """Merge refresh requests that arrive close together into one fetch.
+
+    The first request starts a ``REFRESH_COALESCE_DELAY`` wait, and requests
+    made during it add their endpoints to the same batch. ``refresh`` is then
+    called once with every requested endpoint, and all requesters await that
+    one call. Requests made while it runs start the next batch.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        name: str,
+        refresh: Callable[[set[str]], Awaitable[None]],
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._name = name
+        self._refresh = refresh
+        self._endpoints: set[str] = set()
+        self._batch: asyncio.Task[None] | None = None
+
+    async def async_request(self, endpoints: Iterable[str]) -> None:
+        """Refresh the endpoints soon and wait until they have been fetched."""
+        self._endpoints.update(endpoints)
+        if (batch := self._batch) is None:
+            batch = self._batch = self._entry.async_create_background_task(
+                self._hass, self._async_run(), f"{self._name} requested refresh"
+            )
+        await asyncio.shield(batch)
+
+    async def _async_run(self) -> None:
+        await asyncio.sleep(REFRESH_COALESCE_DELAY.total_seconds())
+        endpoints, self._endpoints = self._endpoints, set()
+        self._batch = None
+        await self._refresh(endpoints)
@@ -2,110 +2,159 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import TerraDataUpdateCoordinator, TerraStationData
-from .entity import TerraEntity
+from .const import DOMAIN, ENDPOINT_LATEST_BIRDS, ENDPOINT_STATS, ENDPOINT_YARD_LIST
+from .coordinator import (
+    TerraAccountCoordinator,
+    TerraStationCoordinator,
+    signal_species_added,
+)
+from .entity import TerraEntity, async_setup_station_entities
+from .metrics import EndpointMetrics
+from .species import SpeciesRecord
+from .views import StationView
 
 
 @dataclass(frozen=True, kw_only=True)
 class TerraSensorDescription(SensorEntityDescription):
     """Describes a Terra sensor."""
 
-    value_fn: Callable[[TerraStationData], Any]
-    extra_attrs_fn: Callable[[TerraStationData], dict[str, Any]] | None = None
-
-
-def _species_today(data: TerraStationData) -> int | None:
-    return data.stats.unique_species if data.stats else None
-
-
-def _calls_today(data: TerraStationData) -> int | None:
-    return data.stats.call_count if data.stats else None
-
-
-def _top_bird(data: TerraStationData) -> str | None:
-    return data.stats.top_bird if data.stats else None
-
-
-def _last_bird(data: TerraStationData) -> str | None:
-    if data.latest_birds:
-        return data.latest_birds[0].common_name
-    return None
-
-
-def _last_bird_attrs(data: TerraStationData) -> dict[str, Any]:
-    if not data.latest_birds:
-        return {}
-    bird = data.latest_birds[0]
-    return {
-        "scientific_name": bird.scientific_name,
-        "alpha_code": bird.alpha_code,
-        "confidence": round(bird.confidence, 3),
-        "image_url": bird.image_url,
-        "audio_url": bird.audio_url,
-        "timestamp": bird.timestamp,
-        "entity_picture": bird.image_url,
-    }
-
-
-def _yard_list_total(data: TerraStationData) -> int:
-    return data.yard_list_count
+    endpoint: str
+    value_fn: Callable[[StationView], Any]
+    # Replaces the stale flags of the endpoint; the view merges them in
+    extra_attrs_fn: Callable[[StationView], Mapping[str, Any]] | None = None
 
 
 SENSOR_DESCRIPTIONS: tuple[TerraSensorDescription, ...] = (
     TerraSensorDescription(
         key="species_today",
         translation_key="species_today",
+        endpoint=ENDPOINT_STATS,
         native_unit_of_measurement="species",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_species_today,
+        value_fn=attrgetter("species_today"),
         icon="mdi:bird",
     ),
     TerraSensorDescription(
         key="calls_today",
         translation_key="calls_today",
+        endpoint=ENDPOINT_STATS,
         native_unit_of_measurement="calls",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_calls_today,
+        value_fn=attrgetter("calls_today"),
         icon="mdi:waveform",
     ),
     TerraSensorDescription(
         key="top_bird",
         translation_key="top_bird",
-        value_fn=_top_bird,
+        endpoint=ENDPOINT_STATS,
+        value_fn=attrgetter("top_bird"),
         icon="mdi:trophy-outline",
     ),
     TerraSensorDescription(
         key="last_bird",
         translation_key="last_bird",
-        value_fn=_last_bird,
-        extra_attrs_fn=_last_bird_attrs,
+        endpoint=ENDPOINT_LATEST_BIRDS,
+        value_fn=attrgetter("last_bird"),
+        extra_attrs_fn=attrgetter("last_bird_attributes"),
+        icon="mdi:bird",
+    ),
+    TerraSensorDescription(
+        key="calls_last_hour",
+        translation_key="calls_last_hour",
+        endpoint=ENDPOINT_LATEST_BIRDS,
+        native_unit_of_measurement="calls",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=attrgetter("calls_last_hour"),
+        icon="mdi:waveform",
+    ),
+    TerraSensorDescription(
+        key="calls_last_24h",
+        translation_key="calls_last_24h",
+        endpoint=ENDPOINT_LATEST_BIRDS,
+        native_unit_of_measurement="calls",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=attrgetter("calls_last_24h"),
+        icon="mdi:waveform",
+    ),
+    TerraSensorDescription(
+        key="species_last_24h",
+        translation_key="species_last_24h",
+        endpoint=ENDPOINT_LATEST_BIRDS,
+        native_unit_of_measurement="species",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=attrgetter("species_last_24h"),
         icon="mdi:bird",
     ),
     TerraSensorDescription(
         key="yard_list_total",
         translation_key="yard_list_total",
+        endpoint=ENDPOINT_YARD_LIST,
         native_unit_of_measurement="species",
         state_class=SensorStateClass.TOTAL,
-        value_fn=_yard_list_total,
+        value_fn=attrgetter("yard_list_total"),
         icon="mdi:format-list-numbered",
     ),
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class TerraMetricsSensorDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor fed by the request metrics of a station."""
+
+    value_fn: Callable[[dict[str, EndpointMetrics]], Any]
+
+
+def _api_latency(endpoints: dict[str, EndpointMetrics]) -> float | None:
+    """Slowest p95 latency across the station's endpoints."""
+    p95 = [m.percentile_ms(0.95) for m in endpoints.values() if m.latencies]
+    return max(p95, default=None)
+
+
+def _api_errors(endpoints: dict[str, EndpointMetrics]) -> int:
+    return sum(m.errors for m in endpoints.values())
+
+
+METRICS_SENSOR_DESCRIPTIONS: tuple[TerraMetricsSensorDescription, ...] = (
+    TerraMetricsSensorDescription(
+        key="api_latency",
+        translation_key="api_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_api_latency,
+        icon="mdi:timer-outline",
+    ),
+    TerraMetricsSensorDescription(
+        key="api_errors",
+        translation_key="api_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_api_errors,
+        icon="mdi:alert-circle-outline",
+    ),
+)
+
+
 class TerraSensor(TerraEntity, SensorEntity):
     """A Terra Listens sensor entity."""
 
@@ -113,27 +162,152 @@ class TerraSensor(TerraEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: TerraDataUpdateCoordinator,
-        station_id: str,
+        coordinator: TerraStationCoordinator,
         description: TerraSensorDescription,
     ) -> None:
-        super().__init__(coordinator, station_id)
+        super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{station_id}_{description.key}"
+        self._endpoint = description.endpoint
+        self._attr_unique_id = f"{coordinator.station_id}_{description.key}"
 
     @property
     def native_value(self) -> Any:
         """Return the sensor value."""
-        if self._station_data is None:
+        if (view := self._view) is None:
             return None
-        return self.entity_description.value_fn(self._station_data)
+        return self.entity_description.value_fn(view)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return extra state attributes."""
-        if self._station_data is None or self.entity_description.extra_attrs_fn is None:
+        attrs_fn = self.entity_description.extra_attrs_fn
+        if attrs_fn is None or (view := self._view) is None:
+            return super().extra_state_attributes
+        return attrs_fn(view)
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self.native_value,)
+
+
+class TerraMetricsSensor(TerraEntity, SensorEntity):
+    """A diagnostic sensor reporting API request metrics for a station."""
+
+    entity_description: TerraMetricsSensorDescription
+
+    def __init__(
+        self,
+        coordinator: TerraStationCoordinator,
+        description: TerraMetricsSensorDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.station_id}_{description.key}"
+
+    @property
+    def _endpoints(self) -> dict[str, EndpointMetrics]:
+        if (metrics := self.coordinator.account.metrics) is None:
+            return {}
+        return metrics.station(self._station_id)
+
+    @property
+    def native_value(self) -> Any:
+        """Return the sensor value."""
+        return self.entity_description.value_fn(self._endpoints)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the per-endpoint breakdown."""
+        return {
+            endpoint: metrics.as_dict() for endpoint, metrics in self._endpoints.items()
+        }
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self.native_value,)
+
+
+class TerraSpeciesSensor(CoordinatorEntity[TerraStationCoordinator], SensorEntity):
+    """Detections and last-seen time of one species at a station.
+
+    It is written when the station's species table reports a change to this
+    species, and on coordinator updates only if its availability changed, so
+    a long yard list costs nothing on polls that do not detect it.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = "calls"
+    _attr_icon = "mdi:bird"
+
+    def __init__(self, coordinator: TerraStationCoordinator, code: str) -> None:
+        super().__init__(coordinator)
+        self._code = code
+        self._written_available: bool | None = None
+        self._attr_unique_id = f"{coordinator.station_id}_species_{code.lower()}"
+        if (record := self._record) is not None:
+            self._attr_name = record.common_name
+
+    @property
+    def _record(self) -> SpeciesRecord | None:
+        if (species := self.coordinator.species) is None:
+            return None
+        return species.get(self._code)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info for grouping entities under a station."""
+        return self.coordinator.device_info
+
+    @property
+    def available(self) -> bool:
+        """Return False once the species is no longer on the yard list."""
+        return self.coordinator.last_update_success and self._record is not None
+
+    @property
+    def native_value(self) -> int | None:
+        """Return how often the species has been detected."""
+        if (record := self._record) is None:
+            return None
+        return record.sightings
+
+    @property
+    def entity_picture(self) -> str | None:
+        """Return the species image, served from the media cache."""
+        if (record := self._record) is None:
+            return None
+        return self.coordinator.account.media.async_local_url(
+            record.code, record.image_url
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the species' code and when it was last detected."""
+        if (record := self._record) is None:
             return None
-        return self.entity_description.extra_attrs_fn(self._station_data)
+        return {
+            "species_code": record.code,
+            "last_seen": record.last_seen,
+        }
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember the availability written."""
+        self._written_available = self.available
+        super().async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the station became available or unavailable."""
+        if self.available != self._written_available:
+            self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Write state whenever the species' record changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_species_listener(
+                self._code, self.async_write_ha_state
+            )
+        )
 
 
 async def async_setup_entry(
@@ -142,11 +316,30 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Terra Listens sensor entities."""
-    coordinator: TerraDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[TerraSensor] = []
-    for station_id in coordinator.data.stations:
-        for description in SENSOR_DESCRIPTIONS:
-            entities.append(TerraSensor(coordinator, station_id, description))
+    def _station_entities(station: TerraStationCoordinator) -> list[SensorEntity]:
+        entities: list[SensorEntity] = [
+            TerraSensor(station, description) for description in SENSOR_DESCRIPTIONS
+        ]
+        if station.account.metrics is not None:
+            entities.extend(
+                TerraMetricsSensor(station, description)
+                for description in METRICS_SENSOR_DESCRIPTIONS
+            )
+        return entities
+
+    async_setup_station_entities(hass, entry, async_add_entities, _station_entities)
+
+    account: TerraAccountCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if not account.species_sensors:
+        return
+
+    @callback
+    def _async_add_species(station: TerraStationCoordinator, codes: list[str]) -> None:
+        async_add_entities(TerraSpeciesSensor(station, code) for code in codes)
 
-    async_add_entities(entities)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, signal_species_added(entry.entry_id), _async_add_species
+        )
+    )
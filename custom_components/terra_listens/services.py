@@ -0,0 +1,124 @@
+"""Services for Terra Listens."""
+
+from __future__ import annotations
+
+import asyncio
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_ENDPOINTS,
+    ATTR_STATION_ID,
+    DOMAIN,
+    ENDPOINT_DEVICES,
+    ENDPOINT_LATEST_BIRDS,
+    ENDPOINT_STATS,
+    ENDPOINT_YARD_LIST,
+    SERVICE_BACKFILL,
+    SERVICE_REFRESH,
+)
+from .coordinator import TerraAccountCoordinator, TerraStationCoordinator
+from .refresh import RefreshRequests
+
+REFRESH_ENDPOINTS = (
+    ENDPOINT_STATS,
+    ENDPOINT_LATEST_BIRDS,
+    ENDPOINT_YARD_LIST,
+    ENDPOINT_DEVICES,
+)
+
+SERVICE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_STATION_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(
+            ATTR_ENDPOINTS, default=[ENDPOINT_STATS, ENDPOINT_LATEST_BIRDS]
+        ): vol.All(cv.ensure_list, [vol.In(REFRESH_ENDPOINTS)]),
+    }
+)
+
+SERVICE_BACKFILL_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_STATION_ID): vol.All(cv.ensure_list, [cv.string])}
+)
+
+
+@callback
+def _async_get_stations(
+    hass: HomeAssistant, station_ids: list[str] | None
+) -> list[tuple[TerraAccountCoordinator, list[TerraStationCoordinator]]]:
+    """Return the accounts with the given stations (or all of them).
+
+    Raises ServiceValidationError if a station ID is not set up.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    accounts: list[tuple[TerraAccountCoordinator, list[TerraStationCoordinator]]] = []
+    found: set[str] = set()
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        account: TerraAccountCoordinator | None = domain_data.get(entry.entry_id)
+        if account is None:
+            continue
+        stations = [
+            station
+            for station_id, station in account.stations.items()
+            if station_ids is None or station_id in station_ids
+        ]
+        if not stations and station_ids is not None:
+            continue
+        found.update(station.station_id for station in stations)
+        accounts.append((account, stations))
+    if station_ids is not None and (missing := set(station_ids) - found):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="unknown_station",
+            translation_placeholders={"station_id": ", ".join(sorted(missing))},
+        )
+    return accounts
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Terra Listens services."""
+
+    async def _async_refresh(call: ServiceCall) -> None:
+        """Fetch endpoints of the given stations (or all) now.
+
+        Calls that arrive within a short window are merged per station, and
+        every caller waits for the shared fetch.
+        """
+        endpoints = set(call.data[ATTR_ENDPOINTS])
+        station_endpoints = endpoints - {ENDPOINT_DEVICES}
+        targets: list[tuple[RefreshRequests, set[str]]] = []
+        for account, stations in _async_get_stations(
+            hass, call.data.get(ATTR_STATION_ID)
+        ):
+            if ENDPOINT_DEVICES in endpoints:
+                targets.append((account.refresh_requests, {ENDPOINT_DEVICES}))
+            if station_endpoints:
+                targets.extend(
+                    (station.refresh_requests, station_endpoints)
+                    for station in stations
+                )
+        await asyncio.gather(
+            *(requests.async_request(names) for requests, names in targets)
+        )
+
+    async def _async_backfill(call: ServiceCall) -> None:
+        """Start loading the past detections of the given stations (or all).
+
+        Returns once the backfills are started; a station that is already
+        being backfilled is left alone.
+        """
+        for account, stations in _async_get_stations(
+            hass, call.data.get(ATTR_STATION_ID)
+        ):
+            for station in stations:
+                account.backfill.async_start(station)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH, _async_refresh, schema=SERVICE_REFRESH_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_BACKFILL, _async_backfill, schema=SERVICE_BACKFILL_SCHEMA
+    )
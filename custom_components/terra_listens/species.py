@@ -0,0 +1,123 @@
+"""Per-species detection counts of a Terra Listens station."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+from terra_sdk.models import BirdDetection, YardListEntry
+
+
+@dataclass(frozen=True, slots=True)
+class SpeciesRecord:
+    """What a species sensor shows."""
+
+    code: str
+    common_name: str
+    sightings: int
+    last_seen: datetime | None
+    image_url: str
+
+
+def species_code(code: str, common_name: str) -> str:
+    """Return the key of a species: its code, else its common name."""
+    return code or common_name
+
+
+class SpeciesTable:
+    """The species of one station, indexed by species code.
+
+    Built from the yard list when it is downloaded, then kept current from new
+    detections. Yard-list entries carry a species code and detections an alpha
+    code, so like the yard-list cache a detection is matched to its species by
+    common name. Every change reports the codes whose record changed, so only
+    the sensors of those species are written.
+    """
+
+    __slots__ = ("_codes", "_records")
+
+    def __init__(self) -> None:
+        self._records: dict[str, SpeciesRecord] = {}
+        # Species code of each common name
+        self._codes: dict[str, str] = {}
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, code: str) -> SpeciesRecord | None:
+        """Return the record of a species."""
+        return self._records.get(code)
+
+    def replace(
+        self, yard_list: Iterable[YardListEntry], last_seen: Mapping[str, int]
+    ) -> set[str]:
+        """Rebuild the table from a yard list; return the changed codes.
+
+        ``last_seen`` maps common names to the epoch of their latest
+        detection, as far as the local history goes back. A species that was
+        seen more recently than that keeps its last-seen time.
+        """
+        records: dict[str, SpeciesRecord] = {}
+        codes: dict[str, str] = {}
+        for entry in yard_list:
+            code = codes[entry.common_name] = species_code(
+                entry.species_code, entry.common_name
+            )
+            seen = last_seen.get(entry.common_name)
+            if (old := self._records.get(code)) is not None and old.last_seen:
+                seen = max(seen or 0, int(old.last_seen.timestamp()))
+            records[code] = SpeciesRecord(
+                code=code,
+                common_name=entry.common_name,
+                sightings=entry.sighting_count,
+                last_seen=None if seen is None else dt_util.utc_from_timestamp(seen),
+                image_url=entry.image_url,
+            )
+        changed = {
+            code
+            for code in records.keys() | self._records.keys()
+            if records.get(code) != self._records.get(code)
+        }
+        self._records = records
+        self._codes = codes
+        return changed
+
+    def add_detections(self, detections: Iterable[BirdDetection]) -> set[str]:
+        """Count new detections; return the codes of the species they touch."""
+        changed: set[str] = set()
+        for detection in detections:
+            code = self._codes.setdefault(
+                detection.common_name,
+                species_code(detection.alpha_code, detection.common_name),
+            )
+            seen = dt_util.utc_from_timestamp(detection.epoch)
+            if (record := self._records.get(code)) is None:
+                record = SpeciesRecord(
+                    code=code,
+                    common_name=detection.common_name,
+                    sightings=1,
+                    last_seen=seen,
+                    image_url=detection.image_url,
+                )
+            else:
+                record = replace(
+                    record,
+                    sightings=record.sightings + 1,
+                    last_seen=(
+                        seen
+                        if record.last_seen is None or seen > record.last_seen
+                        else record.last_seen
+                    ),
+                )
+            self._records[code] = record
+            changed.add(code)
+        return changed
@@ -0,0 +1,262 @@
+"""Long-term statistics of detection counts for Terra Listens."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from terra_sdk.exceptions import TerraError
+from terra_sdk.models import Station
+
+from .const import (
+    DOMAIN,
+    HISTORY_RETENTION,
+    STATISTICS_DELAY,
+    STATISTICS_IMPORT_MINUTE,
+)
+from .history import HOUR
+
+if TYPE_CHECKING:
+    from .coordinator import TerraAccountCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+def _storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.{entry_id}.statistics"
+
+
+def statistic_id(station_id: str) -> str:
+    """Return the ID of a station's hourly call statistic."""
+    return f"{DOMAIN}:{slugify(station_id)}_calls"
+
+
+def _hour_start(value: str) -> int | None:
+    """Return the start of the hour a graph timestamp falls in.
+
+    Timestamps without an offset are taken to be in Home Assistant's time zone.
+    """
+    if (parsed := dt_util.parse_datetime(value)) is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.get_default_time_zone())
+    epoch = int(parsed.timestamp())
+    return epoch - epoch % HOUR
+
+
+class TerraStatistics:
+    """Import hourly call counts into Home Assistant's long-term statistics.
+
+    Each station gets an external ``terra_listens:<station>_calls`` statistic
+    with one row per hour, counted from the local detection history, so
+    history graphs need a row per hour instead of a state per poll. An hour
+    is imported once it has been over for ``STATISTICS_DELAY``, so detections
+    fetched late still count. The first import of a station backfills the
+    hours the API's call graph still covers.
+
+    Detections stored for hours that were already imported, e.g. by the first
+    poll after a restart, by a push or by a backfill, make the next import
+    recount from the earliest of those hours, continuing from the sum the
+    recorder holds for the hour before.
+    """
+
+    def __init__(self, hass: HomeAssistant, account: TerraAccountCoordinator) -> None:
+        self._hass = hass
+        self._account = account
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, _storage_key(account.config_entry.entry_id)
+        )
+        # Station ID -> start of the last imported hour and the sum up to it
+        self._imported: dict[str, dict[str, Any]] | None = None
+        self._lock = asyncio.Lock()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Import now and then every hour; return a callback that stops it."""
+
+        @callback
+        def _async_schedule_import(now: datetime | None = None) -> None:
+            self._account.config_entry.async_create_background_task(
+                self._hass, self.async_import(), f"{DOMAIN} statistics import"
+            )
+
+        _async_schedule_import()
+        return async_track_time_change(
+            self._hass,
+            _async_schedule_import,
+            minute=STATISTICS_IMPORT_MINUTE,
+            second=0,
+        )
+
+    async def async_import(self) -> None:
+        """Import the hours completed since the last import of every station."""
+        if "recorder" not in self._hass.config.components:
+            return
+        async with self._lock:
+            if self._imported is None:
+                self._imported = await self._store.async_load() or {}
+            now = dt_util.utcnow().timestamp()
+            until = int(now - STATISTICS_DELAY.total_seconds())
+            until -= until % HOUR
+            for station_id, coordinator in list(self._account.stations.items()):
+                try:
+                    await self._async_import_station(coordinator.station, now, until)
+                except sqlite3.Error as err:
+                    _LOGGER.warning(
+                        "Failed to read the detection history of %s: %s",
+                        station_id,
+                        err,
+                    )
+            await self._store.async_save(self._imported)
+
+    async def _async_import_station(
+        self, station: Station, now: float, until: int
+    ) -> None:
+        assert self._imported is not None
+        earliest = int(now - HISTORY_RETENTION.total_seconds())
+        earliest -= earliest % HOUR
+        history = self._account.history
+        changed = history.pop_changed(station.id)
+        try:
+            await self._async_import_hours(station, earliest, until, changed)
+        except BaseException:
+            if changed is not None:
+                history.mark_changed(station.id, changed)
+            raise
+
+    async def _async_import_hours(
+        self, station: Station, earliest: int, until: int, changed: int | None
+    ) -> None:
+        # Only imported once the recorder is running, so setups without it
+        # never load the recorder (and SQLAlchemy) through this integration
+        from homeassistant.components.recorder.models import (
+            StatisticData,
+            StatisticMeanType,
+            StatisticMetaData,
+        )
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        assert self._imported is not None
+        history = self._account.history
+        if (imported := self._imported.get(station.id)) is not None:
+            last_hour = imported["last_hour"]
+            start = last_hour + HOUR
+            if changed is not None:
+                start = min(start, changed)
+            start = max(start, earliest)
+            total = imported["sum"]
+            if start >= until:
+                return
+            counts = await history.async_hourly_counts(station.id, start, until)
+            if start <= last_hour:
+                total, recorded = await self._async_recorded(station, start, last_hour)
+                # Hours backfilled from the call graph may count more than
+                # the local history holds
+                for hour, calls in recorded.items():
+                    counts[hour] = max(counts.get(hour, 0), calls)
+        else:
+            counts = await history.async_hourly_counts(station.id, earliest, until)
+            # The API also counts detections the integration never fetched
+            for hour, calls in (await self._async_backfill(station, until)).items():
+                if hour >= earliest:
+                    counts[hour] = max(counts.get(hour, 0), calls)
+            start = min(counts, default=until - HOUR)
+            total = 0
+
+        statistics: list[StatisticData] = []
+        for hour in range(start, until, HOUR):
+            total += counts.get(hour, 0)
+            statistics.append(
+                StatisticData(
+                    start=dt_util.utc_from_timestamp(hour),
+                    state=counts.get(hour, 0),
+                    sum=total,
+                )
+            )
+        async_add_external_statistics(
+            self._hass,
+            StatisticMetaData(
+                mean_type=StatisticMeanType.NONE,
+                has_sum=True,
+                name=f"{station.alias} calls",
+                source=DOMAIN,
+                statistic_id=statistic_id(station.id),
+                unit_class=None,
+                unit_of_measurement="calls",
+            ),
+            statistics,
+        )
+        self._imported[station.id] = {"last_hour": until - HOUR, "sum": total}
+
+    async def _async_recorded(
+        self, station: Station, start: int, last_hour: int
+    ) -> tuple[int, dict[int, int]]:
+        """Return the recorded sum before ``start`` and the hourly states since."""
+        from homeassistant.components.recorder import get_instance
+        from homeassistant.components.recorder.statistics import (
+            statistics_during_period,
+        )
+
+        stat_id = statistic_id(station.id)
+        rows = await get_instance(self._hass).async_add_executor_job(
+            statistics_during_period,
+            self._hass,
+            dt_util.utc_from_timestamp(start - HOUR),
+            dt_util.utc_from_timestamp(last_hour + HOUR),
+            {stat_id},
+            "hour",
+            None,
+            {"state", "sum"},
+        )
+        total = 0
+        states: dict[int, int] = {}
+        for row in rows.get(stat_id, []):
+            hour = int(row["start"])
+            if hour < start:
+                total = int(row.get("sum") or 0)
+            else:
+                states[hour] = int(row.get("state") or 0)
+        return total, states
+
+    async def _async_backfill(self, station: Station, until: int) -> dict[int, int]:
+        """Return the hourly calls of the API's call graph before ``until``.
+
+        Only attempted once per station; without it, the statistic starts at
+        the hours the local history covers.
+        """
+        try:
+            entries = await self._account.async_call(
+                self._account.client.get_graph_stats, station.id
+            )
+        except TerraError as err:
+            _LOGGER.warning(
+                "Failed to get past call counts of %s: %s", station.alias, err
+            )
+            return {}
+        counts: dict[int, int] = {}
+        for entry in entries:
+            hour = _hour_start(entry.ts)
+            if hour is not None and hour < until:
+                counts[hour] = counts.get(hour, 0) + entry.total_calls
+        return counts
+
+
+async def async_remove_statistics_state(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the import state of a config entry.
+
+    The imported statistics stay in the recorder.
+    """
+    await Store(hass, STORAGE_VERSION, _storage_key(entry_id)).async_remove()
@@ -0,0 +1,82 @@
+"""HTTP transport shared by all Terra Listens config entries."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from terra_sdk.client import API_ENDPOINT
+
+from .const import DATA_TRANSPORT, DOMAIN, RATE_LIMIT_BURST, RATE_LIMIT_PER_SECOND
+
+
+class TokenBucket:
+    """Asyncio token-bucket rate limiter.
+
+    Allows bursts of up to ``burst`` requests and ``rate`` requests per second
+    on average. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class TerraTransport:
+    """Send API requests over one pooled session behind one rate limiter.
+
+    Every config entry's client goes through the same transport, so several
+    accounts refreshing at once share keep-alive connections and cannot burst
+    past the integration-wide request rate.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, limiter: TokenBucket) -> None:
+        self._session = session
+        self._limiter = limiter
+
+    async def throttle(self) -> None:
+        """Wait for the rate limiter before sending a request."""
+        await self._limiter.acquire()
+
+    async def post(self, body: dict[str, Any], timeout: aiohttp.ClientTimeout) -> bytes:
+        """POST a request body to the API endpoint and return the raw response.
+
+        Raises ``aiohttp.ClientError`` or ``TimeoutError`` on failure.
+        """
+        async with self._session.post(API_ENDPOINT, json=body, timeout=timeout) as resp:
+            resp.raise_for_status()
+            return await resp.read()
+
+
+@callback
+def async_get_transport(hass: HomeAssistant) -> TerraTransport:
+    """Return the integration-wide transport, creating it on first use."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (transport := domain_data.get(DATA_TRANSPORT)) is None:
+        transport = domain_data[DATA_TRANSPORT] = TerraTransport(
+            async_get_clientsession(hass),
+            TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST),
+        )
+    return transport
@@ -0,0 +1,142 @@
+"""Immutable per-station views that entities read their state from."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from terra_sdk.models import Station
+
+from .const import (
+    DOMAIN,
+    ENDPOINT_DEVICES,
+    ENDPOINT_LATEST_BIRDS,
+    ENDPOINT_STATS,
+    ENDPOINT_YARD_LIST,
+    MANUFACTURER,
+    MODEL,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import TerraStationData
+    from .history import DetectionActivity
+    from .media import TerraMediaCache
+
+_ENDPOINTS = (
+    ENDPOINT_DEVICES,
+    ENDPOINT_STATS,
+    ENDPOINT_LATEST_BIRDS,
+    ENDPOINT_YARD_LIST,
+)
+_RESTORED_ATTRS: Mapping[str, Any] = MappingProxyType({"stale": True})
+
+
+@dataclass(frozen=True, slots=True)
+class StationView:
+    """Entity-facing state of one station, computed once per refresh.
+
+    Entities read values and attribute mappings straight from the view, so
+    the cost of a refresh depends on the number of stations, not on how often
+    Home Assistant reads entity properties.
+    """
+
+    streaming: bool
+    species_today: int | None
+    calls_today: int | None
+    top_bird: str | None
+    last_bird: str | None
+    last_bird_alpha_code: str | None
+    last_bird_image_url: str | None
+    yard_list_total: int
+    calls_last_hour: int | None
+    calls_last_24h: int | None
+    species_last_24h: int | None
+    expired: frozenset[str]
+    # Extra state attributes of each endpoint's entities (stale flags)
+    attributes: Mapping[str | None, Mapping[str, Any] | None]
+    last_bird_attributes: Mapping[str, Any]
+
+
+def station_device_info(station: Station) -> DeviceInfo:
+    """Return device info for grouping a station's entities."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, station.id)},
+        name=f"Terra {station.alias}",
+        manufacturer=MANUFACTURER,
+        model=MODEL,
+        sw_version=station.version,
+    )
+
+
+def _stale_attrs(updated: datetime | None) -> Mapping[str, Any]:
+    return MappingProxyType(
+        {"stale": True, "last_updated": updated.isoformat() if updated else None}
+    )
+
+
+def _last_bird_attrs(
+    data: TerraStationData, media: TerraMediaCache | None
+) -> dict[str, Any]:
+    if not data.latest_birds:
+        return {}
+    bird = data.latest_birds[0]
+    attrs = {
+        "scientific_name": bird.scientific_name,
+        "alpha_code": bird.alpha_code,
+        "confidence": round(bird.confidence, 3),
+        "image_url": bird.image_url,
+        "audio_url": bird.audio_url,
+        "timestamp": bird.timestamp,
+    }
+    if media is not None and (
+        picture := media.async_local_url(bird.alpha_code, bird.image_url)
+    ):
+        attrs["entity_picture"] = picture
+    return attrs
+
+
+def build_station_view(
+    data: TerraStationData,
+    activity: DetectionActivity | None = None,
+    *,
+    restored: bool = False,
+    media: TerraMediaCache | None = None,
+) -> StationView:
+    """Compute the view of a station's data.
+
+    ``restored`` marks every value as stale because it comes from the startup
+    snapshot rather than a live poll. With ``media``, the last bird's picture
+    is served from the media cache.
+    """
+    base = _RESTORED_ATTRS if restored else None
+    attributes: dict[str | None, Mapping[str, Any] | None] = {None: base}
+    for endpoint in _ENDPOINTS:
+        attributes[endpoint] = (
+            _stale_attrs(data.updated.get(endpoint)) if endpoint in data.stale else base
+        )
+    stats = data.stats
+    bird = data.latest_birds[0] if data.latest_birds else None
+    return StationView(
+        streaming=data.station.streaming,
+        species_today=stats.unique_species if stats else None,
+        calls_today=stats.call_count if stats else None,
+        top_bird=stats.top_bird if stats else None,
+        last_bird=bird.common_name if bird else None,
+        last_bird_alpha_code=bird.alpha_code if bird else None,
+        last_bird_image_url=(bird.image_url or None) if bird else None,
+        yard_list_total=data.yard_list_count,
+        calls_last_hour=activity.calls_last_hour if activity else None,
+        calls_last_24h=activity.calls_last_24h if activity else None,
+        species_last_24h=activity.species_last_24h if activity else None,
+        expired=data.expired,
+        attributes=MappingProxyType(attributes),
+        last_bird_attributes=MappingProxyType(
+            _last_bird_attrs(data, media)
+            | dict(attributes[ENDPOINT_LATEST_BIRDS] or {})
+        ),
+    )
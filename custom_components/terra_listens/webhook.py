@@ -0,0 +1,84 @@
+"""Webhook for detections and station status pushed by a local relay."""
+
+from __future__ import annotations
+
+import logging
+from functools import partial
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from terra_sdk.models import BirdDetection, Station
+
+from .const import DOMAIN
+from .coordinator import TerraAccountCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_webhook(
+    hass: HomeAssistant, entry: ConfigEntry, account: TerraAccountCoordinator
+) -> CALLBACK_TYPE | None:
+    """Register the entry's push webhook; return a callback that removes it.
+
+    The relay POSTs JSON such as ``{"station_id": ..., "detections": [...],
+    "station": {...}}``, where detections and the station use the record
+    format of the Terra API (``birdIDLatest`` and ``getDevices``). Both keys
+    are optional; a push without detections is a heartbeat that keeps
+    latest-birds polling at the slow resync cadence.
+
+    The webhook integration is only loaded here, as most setups poll only.
+    If it cannot be set up, an error is logged and the stations are polled.
+    """
+    if not await async_setup_component(hass, webhook.DOMAIN, {}):
+        _LOGGER.error(
+            "Push is enabled for %s, but the webhook integration could not be "
+            "set up; its stations are polled instead",
+            entry.title,
+        )
+        return None
+    webhook_id: str = entry.data[CONF_WEBHOOK_ID]
+
+    async def _async_handle_push(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        try:
+            payload: dict[str, Any] = await request.json()
+            station_id = payload["station_id"]
+            detections = [
+                BirdDetection.model_validate(raw)
+                for raw in payload.get("detections", [])
+            ]
+            raw_station = payload.get("station")
+            station = (
+                None if raw_station is None else Station.model_validate(raw_station)
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring invalid push: %s", err)
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        if station is not None and station.id != station_id:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        if (coordinator := account.stations.get(station_id)) is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        if station is not None:
+            coordinator.async_push_station(station)
+        await coordinator.async_push_detections(detections)
+        return web.Response(status=HTTPStatus.OK)
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        f"Terra Listens ({entry.title})",
+        webhook_id,
+        _async_handle_push,
+        local_only=True,
+        allowed_methods=("POST",),
+    )
+    return partial(webhook.async_unregister, hass, webhook_id)
@@ -0,0 +1,152 @@
+"""Persistent yard-list cache for Terra Listens."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from terra_sdk.models import BirdDetection, YardListEntry
+
+from .const import DOMAIN, ENDPOINT_INTERVALS, ENDPOINT_YARD_LIST
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30  # seconds
+
+
+@dataclass
+class StationYardList:
+    """The cached yard list of a single station."""
+
+    entries: dict[str, YardListEntry] = field(default_factory=dict)
+    synced: float = 0.0  # UTC timestamp of the last full download
+    last_epoch: int = 0  # newest detection already merged into the list
+
+
+class TerraYardListCache:
+    """Keep each station's yard list across polls and restarts.
+
+    The full list is only downloaded when a station has never been synced or
+    its last sync is older than the yard-list polling interval. In between, new
+    detections are merged in so the list and its count stay current.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.yard_list"
+        )
+        self._stations: dict[str, StationYardList] = {}
+
+    async def async_load(self) -> None:
+        """Load the cached yard lists from storage."""
+        if not (stored := await self._store.async_load()):
+            return
+        for station_id, raw in stored.items():
+            try:
+                entries = [YardListEntry.model_validate(e) for e in raw["entries"]]
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.warning(
+                    "Discarding invalid cached yard list for %s", station_id
+                )
+                continue
+            self._stations[station_id] = StationYardList(
+                entries={e.common_name: e for e in entries},
+                synced=raw.get("synced", 0.0),
+                last_epoch=raw.get("last_epoch", 0),
+            )
+
+    def __contains__(self, station_id: object) -> bool:
+        """Return True if a yard list has been downloaded for the station."""
+        return station_id in self._stations
+
+    async def async_remove(self) -> None:
+        """Delete the cache from storage."""
+        await self._store.async_remove()
+
+    def get(self, station_id: str) -> list[YardListEntry]:
+        """Return the cached yard list of a station."""
+        if (yard_list := self._stations.get(station_id)) is None:
+            return []
+        return list(yard_list.entries.values())
+
+    def needs_resync(self, station_id: str) -> bool:
+        """Return True if the station's full yard list should be downloaded."""
+        if (yard_list := self._stations.get(station_id)) is None:
+            return True
+        age = dt_util.utcnow().timestamp() - yard_list.synced
+        return age >= ENDPOINT_INTERVALS[ENDPOINT_YARD_LIST].total_seconds()
+
+    @callback
+    def async_replace(
+        self,
+        station_id: str,
+        entries: list[YardListEntry],
+        detections: list[BirdDetection],
+    ) -> None:
+        """Replace a station's yard list with a freshly downloaded one.
+
+        ``detections`` are the latest detections fetched alongside the list;
+        they are already counted by the backend and must not be merged again,
+        and neither must the ones merged before.
+        """
+        last_epoch = max((d.epoch for d in detections), default=0)
+        if (previous := self._stations.get(station_id)) is not None:
+            last_epoch = max(last_epoch, previous.last_epoch)
+        self._stations[station_id] = StationYardList(
+            entries={e.common_name: e for e in entries},
+            synced=dt_util.utcnow().timestamp(),
+            last_epoch=last_epoch,
+        )
+        self._async_schedule_save()
+
+    @callback
+    def async_merge_detections(
+        self, station_id: str, detections: list[BirdDetection]
+    ) -> None:
+        """Fold detections newer than the last merged one into the yard list."""
+        yard_list = self._stations.get(station_id)
+        if yard_list is None:
+            return
+        new = [d for d in detections if d.epoch > yard_list.last_epoch]
+        if not new:
+            return
+
+        for detection in sorted(new, key=lambda d: d.epoch):
+            if (entry := yard_list.entries.get(detection.common_name)) is not None:
+                yard_list.entries[detection.common_name] = entry.model_copy(
+                    update={"sighting_count": entry.sighting_count + 1}
+                )
+                continue
+            yard_list.entries[detection.common_name] = YardListEntry(
+                commonName=detection.common_name,
+                speciesCode=detection.alpha_code,
+                sighting_count=1,
+                first_seen_after_cutoff=detection.timestamp,
+                Image_url=detection.image_url,
+                epoch=detection.epoch,
+            )
+        yard_list.last_epoch = max(d.epoch for d in new)
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            station_id: {
+                "entries": [
+                    e.model_dump(by_alias=True) for e in yard_list.entries.values()
+                ],
+                "synced": yard_list.synced,
+                "last_epoch": yard_list.last_epoch,
+            }
+            for station_id, yard_list in self._stations.items()
+        }
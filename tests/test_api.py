@@ -0,0 +1,239 @@
+"""Tests for the Terra Listens async API client."""
+
+import asyncio
+
+import aiohttp
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+
+from terra_sdk.client import API_ENDPOINT
+from terra_sdk.exceptions import TerraAPIError, TerraAuthError
+
+from custom_components.terra_listens.api import TerraAsyncClient, TerraConnectionError
+from custom_components.terra_listens.metrics import TerraMetrics
+from custom_components.terra_listens.transport import async_get_transport
+
+MOCK_BIRD = {
+    "id": "abc123",
+    "commonName": "Oak Titmouse",
+    "scientificName": "Baeolophus inornatus",
+    "alphacode": "OATI",
+    "speciesConfidence": "0.92",
+    "stamp": "2026-02-08 07:30:00",
+    "epoch": "1770534600",
+    "audioURL": "",
+    "Image_url": "",
+    "notPredicted": "0",
+    "complete": "1",
+    "anthro": "0",
+}
+
+
+def _client(hass: HomeAssistant, **kwargs) -> TerraAsyncClient:
+    return TerraAsyncClient(
+        async_get_transport(hass),
+        email="test@example.com",
+        password="testpass123",
+        **kwargs,
+    )
+
+
+async def test_login_success(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker):
+    aioclient_mock.post(
+        API_ENDPOINT, json={"result": "success", "token": "fake-token-123"}
+    )
+    client = _client(hass)
+
+    assert await client.login() == "fake-token-123"
+    assert client.token == "fake-token-123"
+    assert aioclient_mock.mock_calls[0][2] == {
+        "resource": "signIn",
+        "email": "test@example.com",
+        "password": "testpass123",
+    }
+
+
+async def test_login_rejected(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker):
+    aioclient_mock.post(API_ENDPOINT, json={"result": "error", "message": "nope"})
+
+    with pytest.raises(TerraAuthError):
+        await _client(hass).login()
+
+
+async def test_call_error_response(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    aioclient_mock.post(API_ENDPOINT, json={"result": "error", "message": "down"})
+
+    with pytest.raises(TerraAPIError, match="getCurrentStats"):
+        await _client(hass, token="tok").get_stats("DEV1")
+
+
+async def test_call_connection_error(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    aioclient_mock.post(API_ENDPOINT, exc=aiohttp.ClientConnectionError())
+
+    with pytest.raises(TerraConnectionError):
+        await _client(hass, token="tok").get_devices()
+
+
+async def test_call_server_error_is_transient(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    aioclient_mock.post(API_ENDPOINT, status=503)
+
+    with pytest.raises(TerraConnectionError):
+        await _client(hass, token="tok").get_devices()
+
+
+async def test_call_client_error_is_not_transient(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    aioclient_mock.post(API_ENDPOINT, status=400)
+
+    with pytest.raises(TerraAPIError) as excinfo:
+        await _client(hass, token="tok").get_devices()
+    assert not isinstance(excinfo.value, TerraConnectionError)
+
+
+async def test_get_stats(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker):
+    aioclient_mock.post(
+        API_ENDPOINT,
+        json={
+            "uniqueSpecies": "12",
+            "callCount": "345",
+            "topBird": "Oak Titmouse",
+            "topBirdCount": "42",
+            "topTime": "08:00",
+            "topTimeCount": "15",
+        },
+    )
+
+    stats = await _client(hass, token="tok").get_stats("DEV1")
+
+    assert stats.unique_species == 12
+    assert aioclient_mock.mock_calls[0][2] == {
+        "resource": "getCurrentStats",
+        "deviceGUID": "DEV1",
+        "token": "tok",
+    }
+
+
+async def test_unchanged_response_not_parsed_again(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    aioclient_mock.post(API_ENDPOINT, json=[MOCK_BIRD])
+    client = _client(hass, token="tok")
+
+    first = await client.get_latest_birds("DEV1", count=5)
+    assert await client.get_latest_birds("DEV1", count=5) is first
+    # Responses are remembered per station
+    assert await client.get_latest_birds("DEV2", count=5) is not first
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.post(API_ENDPOINT, json=[{**MOCK_BIRD, "id": "def456"}, MOCK_BIRD])
+    birds = await client.get_latest_birds("DEV1", count=5)
+    assert [b.id for b in birds] == ["def456", "abc123"]
+
+
+async def test_bird_history_parses_only_older_records(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    aioclient_mock.post(
+        API_ENDPOINT, json=[{**MOCK_BIRD, "id": f"det{n}"} for n in range(5)]
+    )
+    client = _client(hass, token="tok")
+
+    page = await client.get_bird_history("DEV1", 5, skip=3)
+    assert [b.id for b in page] == ["det3", "det4"]
+    assert aioclient_mock.mock_calls[0][2]["recordCount"] == 5
+    # History pages are not kept for reuse
+    assert await client.get_bird_history("DEV1", 5, skip=3) is not page
+
+
+async def test_relogin_once_on_expired_token(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    async def _respond(method, url, data):
+        if data["resource"] == "signIn":
+            body = {"result": "success", "token": "new-token"}
+        elif data["token"] != "new-token":
+            body = {"result": "error", "message": "Invalid token"}
+        else:
+            body = []
+        return AiohttpClientMockResponse(method, url, json=body)
+
+    aioclient_mock.post(API_ENDPOINT, side_effect=_respond)
+    refreshed = []
+    client = _client(hass, token="old-token", on_token_refresh=refreshed.append)
+
+    assert await asyncio.gather(client.get_devices(), client.get_devices()) == [
+        [],
+        [],
+    ]
+    resources = [call[2]["resource"] for call in aioclient_mock.mock_calls]
+    assert resources.count("signIn") == 1
+    assert refreshed == ["new-token"]
+
+
+async def test_relogin_rejected(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    async def _respond(method, url, data):
+        if data["resource"] == "signIn":
+            body = {"result": "error", "message": "Bad password"}
+        else:
+            body = {"result": "error", "message": "Session expired"}
+        return AiohttpClientMockResponse(method, url, json=body)
+
+    aioclient_mock.post(API_ENDPOINT, side_effect=_respond)
+
+    with pytest.raises(TerraAuthError):
+        await _client(hass, token="old-token").get_devices()
+
+
+async def test_call_error_mentioning_auth_is_not_a_token_error(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    aioclient_mock.post(
+        API_ENDPOINT,
+        json={"result": "error", "message": "Not authorized for this device"},
+    )
+
+    with pytest.raises(TerraAPIError) as err:
+        await _client(hass, token="tok").get_stats("DEV1")
+    assert not isinstance(err.value, TerraAuthError)
+    resources = [call[2]["resource"] for call in aioclient_mock.mock_calls]
+    assert resources == ["getCurrentStats"]
+
+
+async def test_metrics_recorded(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+):
+    async def _respond(method, url, data):
+        if data["resource"] == "getCurrentStats":
+            body = {"result": "error", "message": "stats down"}
+        else:
+            body = []
+        return AiohttpClientMockResponse(method, url, json=body)
+
+    aioclient_mock.post(API_ENDPOINT, side_effect=_respond)
+    metrics = TerraMetrics()
+    client = _client(hass, token="tok", metrics=metrics)
+
+    await client.get_latest_birds("DEV1", count=5)
+    with pytest.raises(TerraAPIError):
+        await client.get_stats("DEV1")
+
+    summary = metrics.as_dict()
+    birds = summary["stations"]["DEV1"]["get_latest_birds"]
+    assert birds["calls"] == 1
+    assert birds["errors"] == 0
+    assert birds["payload_bytes_last"] == 2
+    assert birds["p50_ms"] is not None
+    assert summary["endpoints"]["get_stats"]["errors"] == 1
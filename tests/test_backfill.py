@@ -0,0 +1,95 @@
+"""Tests for the Terra Listens history backfill."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from terra_sdk.exceptions import TerraAPIError
+from terra_sdk.models import BirdDetection, Station
+
+from custom_components.terra_listens.const import DOMAIN
+from custom_components.terra_listens.coordinator import (
+    TerraAccountCoordinator,
+    TerraStationCoordinator,
+)
+from custom_components.terra_listens.history import async_remove_history
+
+NOW = datetime(2026, 2, 8, 12, 0, tzinfo=UTC)
+NOW_TS = int(NOW.timestamp())
+
+MOCK_STATION = Station(
+    station_id="DEVICE123",
+    alias="Oxbow",
+    last_heard="2026-02-08 01:00:00",
+    streaming="1",
+    lat="37.93",
+    lon="-120.27",
+)
+
+
+def _bird(n: int, hours_ago: float) -> BirdDetection:
+    return BirdDetection(
+        id=f"det{n}",
+        commonName="Oak Titmouse",
+        scientificName="Baeolophus inornatus",
+        alphacode="OATI",
+        speciesConfidence="0.9",
+        stamp="2026-02-08 12:00:00",
+        epoch=str(int(NOW_TS - hours_ago * 3600)),
+        audioURL="",
+        Image_url="",
+        notPredicted="0",
+        complete="1",
+        anthro="0",
+    )
+
+
+async def test_backfill_pages_and_resumes(hass: HomeAssistant, freezer):
+    """Test that pages are stored as they arrive and a failed run resumes."""
+    freezer.move_to(NOW)
+    # Newest first: 25 detections within the retention, then 10 older ones
+    birds = [_bird(n, n * 24) for n in range(25)]
+    birds += [_bird(n, 31 * 24 + n) for n in range(25, 35)]
+    requests: list[tuple[int, int]] = []
+
+    async def _get_bird_history(device_id: str, count: int, skip: int = 0):
+        requests.append((count, skip))
+        if len(requests) == 3:
+            raise TerraAPIError("Server error", "birdIDLatest")
+        return birds[skip:count]
+
+    client = MagicMock()
+    client.get_bird_history = AsyncMock(side_effect=_get_bird_history)
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    account = TerraAccountCoordinator(hass, entry, client)
+    station = account.stations[MOCK_STATION.id] = TerraStationCoordinator(
+        hass, account, MOCK_STATION
+    )
+    history = account.history
+
+    with (
+        patch("custom_components.terra_listens.backfill.BACKFILL_PAGE_SIZE", 10),
+        patch(
+            "custom_components.terra_listens.backfill.BACKFILL_PAGE_DELAY",
+            timedelta(0),
+        ),
+    ):
+        assert account.backfill.async_start(station)
+        assert not account.backfill.async_start(station)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert requests == [(10, 0), (20, 10), (30, 20)]
+        assert await history.async_backfills() == {MOCK_STATION.id: 20}
+
+        # Resumed after the last stored page, and stops at the retention
+        await account.backfill.async_resume()
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert requests[3:] == [(30, 20)]
+    assert await history.async_backfills() == {}
+    counts = await history.async_hourly_counts(MOCK_STATION.id, 0, NOW_TS + 1)
+    assert sum(counts.values()) == 25
+
+    await history.async_close()
+    await async_remove_history(hass, entry.entry_id)
@@ -1,11 +1,12 @@
 """Tests for Terra Listens config flow."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_TOKEN, CONF_WEBHOOK_ID
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.terra_listens.const import DOMAIN
 
@@ -23,12 +24,12 @@ def auto_enable_custom_integrations(enable_custom_integrations):
 
 @pytest.fixture
 def mock_client():
-    """Return a mocked TerraClient."""
+    """Return a mocked TerraAsyncClient."""
     with patch(
-        "custom_components.terra_listens.config_flow.TerraClient"
+        "custom_components.terra_listens.config_flow.TerraAsyncClient"
     ) as mock_cls:
         client = MagicMock()
-        client.login.return_value = "fake-token-123"
+        client.login = AsyncMock(return_value="fake-token-123")
         mock_cls.return_value = client
         yield mock_cls
 
@@ -46,7 +47,7 @@ async def test_form_valid_credentials(hass: HomeAssistant, mock_client):
     )
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Terra Listens (test@example.com)"
-    assert result["data"] == MOCK_USER_INPUT
+    assert result["data"] == {**MOCK_USER_INPUT, CONF_TOKEN: "fake-token-123"}
 
 
 async def test_form_invalid_auth(hass: HomeAssistant, mock_client):
@@ -93,3 +94,61 @@ async def test_form_unknown_error(hass: HomeAssistant, mock_client):
     )
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {"base": "unknown"}
+
+
+async def test_reauth(hass: HomeAssistant, mock_client):
+    """Test that reauth stores the new password and token."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=MOCK_USER_INPUT[CONF_EMAIL],
+        data={**MOCK_USER_INPUT, CONF_TOKEN: "expired"},
+    )
+    entry.add_to_hass(hass)
+
+    result = await entry.start_reauth_flow(hass)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "reauth_confirm"
+
+    with patch(
+        "custom_components.terra_listens.async_setup_entry", return_value=True
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_PASSWORD: "newpass"}
+        )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert entry.data[CONF_PASSWORD] == "newpass"
+    assert entry.data[CONF_TOKEN] == "fake-token-123"
+
+
+async def test_options_flow(hass: HomeAssistant):
+    """Test setting the adaptive polling bounds."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={**MOCK_USER_INPUT, CONF_WEBHOOK_ID: "abc123"}
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+    assert result["description_placeholders"] == {"webhook_path": "/api/webhook/abc123"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"min_poll_interval": 600, "max_poll_interval": 60}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_poll_bounds"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"min_poll_interval": 15, "max_poll_interval": 900}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        "min_poll_interval": 15,
+        "max_poll_interval": 900,
+        "stale_max_age": 60,
+        "max_concurrency": 8,
+        "push": False,
+        "species_sensors": False,
+        "diagnostic_metrics": False,
+    }
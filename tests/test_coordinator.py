@@ -1,18 +1,36 @@
 """Tests for Terra Listens coordinator."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
 
-from terra_sdk.exceptions import TerraError
+from terra_sdk.exceptions import TerraAuthError, TerraError
 from terra_sdk.models import BirdDetection, Station, StationStats, YardListEntry
 
+from custom_components.terra_listens.api import TerraConnectionError
+from custom_components.terra_listens.const import (
+    DOMAIN,
+    ENDPOINT_YARD_LIST,
+    EVENT_DETECTION,
+)
 from custom_components.terra_listens.coordinator import (
+    TerraAccountCoordinator,
     TerraData,
-    TerraDataUpdateCoordinator,
+    TerraStationCoordinator,
     TerraStationData,
+    signal_stations_added,
 )
+from custom_components.terra_listens.detections import DetectionTracker
 
 MOCK_STATION = Station(
     station_id="DEVICE123",
@@ -49,28 +67,64 @@ MOCK_BIRD = BirdDetection(
     anthro="0",
 )
 
+MOCK_YARD_LIST = [
+    YardListEntry(
+        commonName="Oak Titmouse",
+        speciesCode="OATI",
+        sighting_count="3",
+        first_seen_after_cutoff="2025-06-01",
+        Image_url="",
+        epoch=1748736000,
+    ),
+    *(
+        YardListEntry(
+            commonName=f"Bird {i}",
+            speciesCode=f"B{i:03}",
+            sighting_count="3",
+            first_seen_after_cutoff="2025-06-01",
+            Image_url="",
+            epoch=1748736000,
+        )
+        for i in range(1, 47)
+    ),
+]
+
+
+def _make_account(hass, client, entry=None):
+    """Create an account coordinator bound to a mock config entry."""
+    if entry is None:
+        entry = MockConfigEntry(domain=DOMAIN, data={})
+        entry.add_to_hass(hass)
+    return TerraAccountCoordinator(hass, entry, client)
+
+
+def _make_coordinator(hass, client, entry=None, station=MOCK_STATION):
+    """Create a station coordinator registered with a mock account."""
+    account = _make_account(hass, client, entry)
+    coordinator = account.stations[station.id] = TerraStationCoordinator(
+        hass, account, station
+    )
+    return coordinator
+
 
 def _make_mock_client():
-    """Create a mock TerraClient with standard responses."""
+    """Create a mock TerraAsyncClient with standard responses."""
     client = MagicMock()
-    client.get_devices.return_value = [MOCK_STATION]
-    client.get_stats.return_value = MOCK_STATS
-    client.get_latest_birds.return_value = [MOCK_BIRD]
-    client.get_yard_list.return_value = [MagicMock()] * 47
+    client.get_devices = AsyncMock(return_value=[MOCK_STATION])
+    client.get_stats = AsyncMock(return_value=MOCK_STATS)
+    client.get_latest_birds = AsyncMock(return_value=[MOCK_BIRD])
+    client.get_yard_list = AsyncMock(return_value=MOCK_YARD_LIST)
     return client
 
 
-def test_fetch_data_success():
-    """Test that _fetch_data returns proper TerraData."""
+async def test_fetch_data_success(hass: HomeAssistant):
+    """Test that a refresh returns proper TerraStationData."""
     client = _make_mock_client()
-    coordinator = TerraDataUpdateCoordinator.__new__(TerraDataUpdateCoordinator)
-    coordinator.client = client
+    coordinator = _make_coordinator(hass, client)
 
-    data = coordinator._fetch_data()
+    sd = await coordinator._async_update_data()
 
-    assert isinstance(data, TerraData)
-    assert "DEVICE123" in data.stations
-    sd = data.stations["DEVICE123"]
+    assert isinstance(sd, TerraStationData)
     assert sd.station.alias == "Oxbow"
     assert sd.stats.unique_species == 12
     assert sd.stats.call_count == 345
@@ -79,51 +133,624 @@ def test_fetch_data_success():
     assert sd.yard_list_count == 47
 
 
-def test_fetch_data_stats_failure():
+async def test_fetch_data_stats_failure(hass: HomeAssistant):
     """Test that stats failure is handled gracefully."""
     client = _make_mock_client()
     client.get_stats.side_effect = TerraError("stats down")
-    coordinator = TerraDataUpdateCoordinator.__new__(TerraDataUpdateCoordinator)
-    coordinator.client = client
+    coordinator = _make_coordinator(hass, client)
 
-    data = coordinator._fetch_data()
-    sd = data.stations["DEVICE123"]
+    sd = await coordinator._async_update_data()
     assert sd.stats is None
     assert len(sd.latest_birds) == 1
 
 
-def test_fetch_data_birds_failure():
+async def test_fetch_data_birds_failure(hass: HomeAssistant):
     """Test that bird fetch failure is handled gracefully."""
     client = _make_mock_client()
     client.get_latest_birds.side_effect = TerraError("birds down")
-    coordinator = TerraDataUpdateCoordinator.__new__(TerraDataUpdateCoordinator)
-    coordinator.client = client
+    coordinator = _make_coordinator(hass, client)
 
-    data = coordinator._fetch_data()
-    sd = data.stations["DEVICE123"]
+    sd = await coordinator._async_update_data()
     assert sd.latest_birds == []
     assert sd.stats is not None
 
 
-def test_fetch_data_yard_list_failure():
+async def test_common_species_images_prefetched(hass: HomeAssistant):
+    """Test that a yard list download prefetches the most sighted species."""
+    client = _make_mock_client()
+    client.get_yard_list.return_value = [
+        entry.model_copy(
+            update={"sighting_count": i, "image_url": f"https://example.com/{i}.jpg"}
+        )
+        for i, entry in enumerate(MOCK_YARD_LIST)
+    ]
+    coordinator = _make_coordinator(hass, client)
+    coordinator.account.media = MagicMock(async_prefetch=AsyncMock())
+
+    await coordinator._async_update_data()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    (media,) = coordinator.account.media.async_prefetch.call_args.args
+    media = list(media)
+    assert len(media) == 20
+    assert media[0] == ("B046", "https://example.com/46.jpg")
+
+
+async def test_fetch_data_yard_list_failure(hass: HomeAssistant):
     """Test that yard list failure is handled gracefully."""
     client = _make_mock_client()
     client.get_yard_list.side_effect = TerraError("yard down")
-    coordinator = TerraDataUpdateCoordinator.__new__(TerraDataUpdateCoordinator)
-    coordinator.client = client
+    coordinator = _make_coordinator(hass, client)
 
-    data = coordinator._fetch_data()
-    sd = data.stations["DEVICE123"]
+    sd = await coordinator._async_update_data()
     assert sd.yard_list_count == 0
 
 
-def test_fetch_data_devices_failure():
-    """Test that device fetch failure raises."""
+async def test_yard_list_merged_from_detections(hass: HomeAssistant):
+    """Test that the yard list is downloaded once and then kept current."""
+    client = _make_mock_client()
+    coordinator = _make_coordinator(hass, client)
+
+    with patch("custom_components.terra_listens.coordinator.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        new_bird = MOCK_BIRD.model_copy(
+            update={
+                "id": "def456",
+                "common_name": "Wrentit",
+                "alpha_code": "WREN",
+                "epoch": 1770534700,
+            }
+        )
+        client.get_latest_birds.return_value = [new_bird, MOCK_BIRD]
+        mock_time.monotonic.return_value = 1061.0
+        sd = await coordinator._async_update_data()
+
+    assert client.get_yard_list.call_count == 1
+    assert sd.yard_list_count == 48
+    assert "Wrentit" in {entry.common_name for entry in sd.yard_list}
+
+
+async def test_yard_list_download_keeps_merged_detections(hass: HomeAssistant):
+    """Test that a yard-list-only tick does not let detections be merged twice."""
+    client = _make_mock_client()
+    coordinator = _make_coordinator(hass, client)
+    wrentit = MOCK_BIRD.model_copy(
+        update={
+            "id": "def456",
+            "common_name": "Wrentit",
+            "alpha_code": "WREN",
+            "epoch": 1770534700,
+        }
+    )
+
+    def _wrentits(sd: TerraStationData) -> int:
+        return next(
+            e.sighting_count for e in sd.yard_list if e.common_name == "Wrentit"
+        )
+
+    with patch("custom_components.terra_listens.coordinator.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        client.get_latest_birds.return_value = [wrentit, MOCK_BIRD]
+        mock_time.monotonic.return_value = 1061.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        assert _wrentits(coordinator.data) == 1
+
+        # The backend's list already counts the Wrentit
+        client.get_yard_list.return_value = [
+            *MOCK_YARD_LIST,
+            YardListEntry(
+                commonName="Wrentit",
+                speciesCode="WREN",
+                sighting_count="1",
+                first_seen_after_cutoff="2026-02-08",
+                Image_url="",
+                epoch=1770534700,
+            ),
+        ]
+        # A new list per poll, so it is not skipped as unchanged
+        client.get_latest_birds.side_effect = lambda *args, **kwargs: [
+            wrentit,
+            MOCK_BIRD,
+        ]
+        for now, yard_list_only in (
+            (1070.0, True),
+            (1200.0, False),
+            (1210.0, True),
+            (1400.0, False),
+        ):
+            mock_time.monotonic.return_value = now
+            if yard_list_only:
+                await coordinator._async_refresh_endpoints({ENDPOINT_YARD_LIST})
+            else:
+                coordinator.async_set_updated_data(
+                    await coordinator._async_update_data()
+                )
+
+    assert client.get_yard_list.call_count == 3
+    assert client.get_latest_birds.call_count == 4
+    assert _wrentits(coordinator.data) == 1
+
+
+async def test_endpoints_polled_on_own_cadence(hass: HomeAssistant):
+    """Test that a tick only calls the endpoints that are due."""
+    client = _make_mock_client()
+    coordinator = _make_coordinator(hass, client)
+
+    with patch("custom_components.terra_listens.coordinator.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        mock_time.monotonic.return_value = 1061.0
+        sd = await coordinator._async_update_data()
+
+    assert client.get_stats.call_count == 1
+    assert client.get_latest_birds.call_count == 2
+    assert client.get_yard_list.call_count == 1
+    assert sd.stats.unique_species == 12
+    assert sd.yard_list_count == 47
+
+
+async def test_failed_slices_keep_last_good_value(hass: HomeAssistant, freezer):
+    """Test that failed slices are carried forward until they are too old."""
+    client = _make_mock_client()
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={"stale_max_age": 10})
+    entry.add_to_hass(hass)
+    coordinator = _make_coordinator(hass, client, entry)
+
+    with patch("custom_components.terra_listens.coordinator.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        client.get_stats.side_effect = TerraError("stats down")
+        client.get_latest_birds.side_effect = TerraError("birds down")
+        freezer.tick(timedelta(seconds=301))
+        mock_time.monotonic.return_value = 1301.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+
+        sd = coordinator.data
+        assert sd.stats.unique_species == 12
+        assert sd.latest_birds == [MOCK_BIRD]
+        assert sd.yard_list_count == 47
+        assert sd.stale == {"stats", "latest_birds"}
+        assert not sd.expired
+
+        freezer.tick(timedelta(seconds=300))
+        mock_time.monotonic.return_value = 1602.0
+        sd = await coordinator._async_update_data()
+
+    assert sd.stats.unique_species == 12
+    assert sd.expired == {"stats", "latest_birds"}
+
+
+async def test_fetch_data_devices_failure(hass: HomeAssistant):
+    """Test that device fetch failure raises UpdateFailed."""
     client = _make_mock_client()
     client.get_devices.side_effect = TerraError("API down")
-    coordinator = TerraDataUpdateCoordinator.__new__(TerraDataUpdateCoordinator)
-    coordinator.client = client
+    account = _make_account(hass, client)
+
+    with pytest.raises(UpdateFailed):
+        await account._async_update_data()
+
+
+async def test_devices_failure_keeps_known_stations(hass: HomeAssistant):
+    """Test that a failed station list refresh falls back to the previous one."""
+    client = _make_mock_client()
+    account = _make_account(hass, client)
+
+    account.async_set_updated_data(await account._async_update_data())
+    assert account.stations_fresh
+    client.get_devices.side_effect = TerraError("API down")
+    data = await account._async_update_data()
+
+    assert client.get_devices.call_count == 2
+    assert data == {"DEVICE123": MOCK_STATION}
+    assert not account.stations_fresh
+    assert account.update_interval == timedelta(minutes=5)
+
+
+async def test_stations_added_and_removed(hass: HomeAssistant):
+    """Test that station coordinators follow the station list."""
+    client = _make_mock_client()
+    account = _make_account(hass, client)
+    added: list[TerraStationCoordinator] = []
+    async_dispatcher_connect(
+        hass, signal_stations_added(account.config_entry.entry_id), added.extend
+    )
+    second = MOCK_STATION.model_copy(update={"id": "DEVICE456", "alias": "Meadow"})
+
+    account.async_set_updated_data({"DEVICE123": MOCK_STATION})
+    account.async_sync_stations()
+    account.async_set_updated_data({"DEVICE123": MOCK_STATION, "DEVICE456": second})
+    account.async_sync_stations()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert [station.station_id for station in added] == ["DEVICE123", "DEVICE456"]
+    assert account.stations["DEVICE456"].data.station.alias == "Meadow"
+
+    account.async_set_updated_data({"DEVICE456": second})
+    account.async_sync_stations()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert list(account.stations) == ["DEVICE456"]
+    assert len(added) == 2
+
+
+async def test_transient_error_retried(hass: HomeAssistant):
+    """Test that a transient error is retried within the same tick."""
+    client = _make_mock_client()
+    client.get_stats.side_effect = [
+        TerraConnectionError("timeout", "getCurrentStats"),
+        MOCK_STATS,
+    ]
+    coordinator = _make_coordinator(hass, client)
+
+    with patch("custom_components.terra_listens.coordinator.API_RETRY_BACKOFF", 0):
+        data = await coordinator._async_update_data()
+
+    assert client.get_stats.call_count == 2
+    assert data.stats is not None
+
+
+async def test_transient_error_retries_bounded(hass: HomeAssistant):
+    """Test that retries give up after the configured number of attempts."""
+    client = _make_mock_client()
+    client.get_stats.side_effect = TerraConnectionError("timeout", "getCurrentStats")
+    coordinator = _make_coordinator(hass, client)
+
+    with patch("custom_components.terra_listens.coordinator.API_RETRY_BACKOFF", 0):
+        data = await coordinator._async_update_data()
+
+    assert client.get_stats.call_count == 3
+    assert data.stats is None
+
+
+async def test_refresh_requests_coalesced(hass: HomeAssistant):
+    """Test that requests made together share one fetch of their endpoints."""
+    client = _make_mock_client()
+    coordinator = _make_coordinator(hass, client)
+
+    with (
+        patch("custom_components.terra_listens.coordinator.time") as mock_time,
+        patch(
+            "custom_components.terra_listens.refresh.REFRESH_COALESCE_DELAY",
+            timedelta(0),
+        ),
+    ):
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        mock_time.monotonic.return_value = 1010.0
+        await asyncio.gather(
+            coordinator.refresh_requests.async_request({"stats"}),
+            coordinator.refresh_requests.async_request({"stats", "yard_list"}),
+        )
+
+    assert client.get_stats.call_count == 2
+    assert client.get_yard_list.call_count == 2
+    # Not requested and not due yet
+    assert client.get_latest_birds.call_count == 1
+
+
+async def test_circuit_breaker_skips_failing_endpoint(hass: HomeAssistant):
+    """Test that an endpoint failing repeatedly is paused until its cooldown ends."""
+    client = _make_mock_client()
+    client.get_stats.side_effect = TerraError("stats down")
+    coordinator = _make_coordinator(hass, client)
+
+    with patch("custom_components.terra_listens.coordinator.time") as mock_time:
+        for now in (1000.0, 1301.0, 1602.0):
+            mock_time.monotonic.return_value = now
+            coordinator.async_set_updated_data(await coordinator._async_update_data())
+        assert client.get_stats.call_count == 3
+        breaker = coordinator.account.breakers_as_dict()["stats/DEVICE123"]
+        assert breaker["state"] == "open"
+        assert breaker["failures"] == 3
+
+        mock_time.monotonic.return_value = 1700.0
+        await coordinator._async_update_data()
+        assert client.get_stats.call_count == 3
+
+        client.get_stats.side_effect = None
+        mock_time.monotonic.return_value = 1903.0
+        data = await coordinator._async_update_data()
+
+    assert client.get_stats.call_count == 4
+    assert data.stats is not None
+    assert (
+        coordinator.account.breakers_as_dict()["stats/DEVICE123"]["state"] == "closed"
+    )
+
+
+async def test_fetch_data_auth_failure(hass: HomeAssistant):
+    """Test that a rejected re-login from any endpoint starts reauth."""
+    client = _make_mock_client()
+    client.get_stats.side_effect = TerraAuthError("Bad password")
+    coordinator = _make_coordinator(hass, client)
+
+    with pytest.raises(ConfigEntryAuthFailed):
+        await coordinator._async_update_data()
+
+
+async def test_fetch_data_concurrency_limit(hass: HomeAssistant):
+    """Test that stations share the account's configured concurrency limit."""
+    stations = [MOCK_STATION.model_copy(update={"id": f"DEVICE{i}"}) for i in range(6)]
+    in_flight = 0
+    peak = 0
+    release = asyncio.Event()
+
+    def _blocking(result):
+        async def _call(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return result
+
+        return _call
+
+    client = _make_mock_client()
+    client.get_stats.side_effect = _blocking(MOCK_STATS)
+    client.get_latest_birds.side_effect = _blocking([MOCK_BIRD])
+    client.get_yard_list.side_effect = _blocking([])
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={"max_concurrency": 4})
+    entry.add_to_hass(hass)
+    account = _make_account(hass, client, entry)
+
+    fetches = asyncio.gather(
+        *(
+            TerraStationCoordinator(hass, account, station)._async_update_data()
+            for station in stations
+        )
+    )
+    # Let every station start its calls; the ones over the limit must wait
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert in_flight == 4
+    release.set()
+    results = await fetches
+
+    assert len(results) == 6
+    assert peak == 4
+    assert in_flight == 0
+
+
+async def test_restore_snapshot(hass: HomeAssistant, hass_storage):
+    """Test that a stored snapshot is restored and flagged stale until refreshed."""
+    client = _make_mock_client()
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    live = await _make_coordinator(hass, client, entry)._async_update_data()
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshot"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}.snapshot",
+        "data": TerraData(stations={"DEVICE123": live}).as_dict(),
+    }
+
+    account = _make_account(hass, client, entry)
+    assert await account.async_restore()
+    assert account.data == {"DEVICE123": MOCK_STATION}
+    stats_answered = asyncio.Event()
+
+    async def _stats_down(*args, **kwargs):
+        await stats_answered.wait()
+        raise TerraError("stats down")
+
+    # The first live refresh starts right away; hold it until the restored
+    # view has been checked
+    client.get_stats.side_effect = _stats_down
+    account.async_sync_stations()
+
+    coordinator = account.stations["DEVICE123"]
+    assert coordinator.stale
+    sd = coordinator.data
+    assert sd.station == MOCK_STATION
+    assert sd.stats == MOCK_STATS
+    assert sd.latest_birds == [MOCK_BIRD]
+    assert sd.yard_list_count == 47
+    # Restored values are stale and tell when they were last fetched
+    assert coordinator.view.attributes["stats"] == {
+        "stale": True,
+        "last_updated": live.updated["stats"].isoformat(),
+    }
+
+    stats_answered.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert not coordinator.stale
+    assert coordinator.data.stats == MOCK_STATS
+    # The view was rebuilt by the live refresh; stats failed and stay flagged
+    assert coordinator.view.species_today == MOCK_STATS.unique_species
+    assert coordinator.view.attributes["stats"]["stale"] is True
+    assert coordinator.view.attributes["latest_birds"] is None
+
+
+async def test_restore_without_snapshot(hass: HomeAssistant):
+    """Test that restore reports when there is nothing to start from."""
+    account = _make_account(hass, _make_mock_client())
+    assert not await account.async_restore()
+    assert account.data is None
+
+
+def _bird(n: int) -> BirdDetection:
+    return MOCK_BIRD.model_copy(update={"id": f"det{n}", "epoch": 1770534600 + n})
+
+
+async def test_new_detections_fire_events(hass: HomeAssistant):
+    """Test that only detections not seen before are reported."""
+    events = async_capture_events(hass, EVENT_DETECTION)
+    client = _make_mock_client()
+    client.get_latest_birds.return_value = [_bird(2), _bird(1)]
+    coordinator = _make_coordinator(hass, client)
+
+    with patch("custom_components.terra_listens.coordinator.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        data = await coordinator._async_update_data()
+        coordinator.async_set_updated_data(data)
+        assert data.new_detections == []
+
+        client.get_latest_birds.return_value = [_bird(4), _bird(3), _bird(2)]
+        mock_time.monotonic.return_value = 1061.0
+        sd = await coordinator._async_update_data()
+    await hass.async_block_till_done()
+
+    assert [b.id for b in sd.new_detections] == ["det3", "det4"]
+    assert [e.data["detection_id"] for e in events] == ["det3", "det4"]
+    assert events[0].data["station_id"] == "DEVICE123"
+
+
+async def test_unchanged_latest_birds_skipped(hass: HomeAssistant):
+    """Test that a repeated response is not tracked or stored again."""
+    client = _make_mock_client()
+    client.get_latest_birds.return_value = [_bird(2), _bird(1)]
+    coordinator = _make_coordinator(hass, client)
+    history = coordinator.account.history
+
+    with (
+        patch("custom_components.terra_listens.coordinator.time") as mock_time,
+        patch.object(history, "async_add", wraps=history.async_add) as mock_add,
+    ):
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        mock_time.monotonic.return_value = 1061.0
+        sd = await coordinator._async_update_data()
+
+    assert client.get_latest_birds.call_count == 2
+    assert mock_add.call_count == 1
+    assert sd.latest_birds == [_bird(2), _bird(1)]
+    assert sd.new_detections == []
+
+
+async def test_pushed_detections_defer_polling(hass: HomeAssistant):
+    """Test that pushes are applied and slow latest-birds polling until they stop."""
+    events = async_capture_events(hass, EVENT_DETECTION)
+    client = _make_mock_client()
+    client.get_latest_birds.return_value = [_bird(1)]
+    coordinator = _make_coordinator(hass, client)
+
+    with patch("custom_components.terra_listens.coordinator.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        assert not coordinator.push_active(1000.0)
+
+        mock_time.monotonic.return_value = 1010.0
+        await coordinator.async_push_detections([_bird(2), _bird(1)])
+        await hass.async_block_till_done()
+        assert [b.id for b in coordinator.data.latest_birds] == ["det2", "det1"]
+        assert [e.data["detection_id"] for e in events] == ["det2"]
+        assert coordinator.push_active(1010.0)
+
+        mock_time.monotonic.return_value = 1061.0
+        await coordinator._async_update_data()
+        assert client.get_latest_birds.call_count == 1
+
+        # Polling resumes once pushes stop arriving
+        mock_time.monotonic.return_value = 1611.0
+        await coordinator._async_update_data()
+    assert client.get_latest_birds.call_count == 2
+    assert not coordinator.push_active(1611.0)
+
+
+async def test_push_after_restore_does_not_replay_detections(hass: HomeAssistant):
+    """Test that a push before the first poll of a restored station is dropped."""
+    events = async_capture_events(hass, EVENT_DETECTION)
+    client = _make_mock_client()
+    client.get_latest_birds.return_value = [_bird(1)]
+    restored = await _make_coordinator(hass, client)._async_update_data()
+    coordinator = _make_coordinator(hass, client)
+    coordinator.async_restore(restored)
+
+    await coordinator.async_push_detections([_bird(2)])
+    assert coordinator.data.latest_birds == [_bird(1)]
+
+    # The first poll seeds the de-duplication without firing events
+    client.get_latest_birds.return_value = [_bird(3), _bird(2), _bird(1)]
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+    await coordinator.async_push_detections([_bird(3)])
+    await hass.async_block_till_done()
+    assert events == []
+
+    await coordinator.async_push_detections([_bird(4), _bird(3)])
+    await hass.async_block_till_done()
+    assert [e.data["detection_id"] for e in events] == ["det4"]
+
+
+async def test_latest_birds_window_widens_on_gap(hass: HomeAssistant):
+    """Test that the request count grows when every returned detection is new."""
+    client = _make_mock_client()
+    history = [_bird(n) for n in range(5, 0, -1)]
+
+    async def _latest(device_id, count):
+        return history[:count]
+
+    client.get_latest_birds.side_effect = _latest
+    coordinator = _make_coordinator(hass, client)
+
+    with patch("custom_components.terra_listens.coordinator.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+
+        history = [_bird(n) for n in range(13, 0, -1)]
+        mock_time.monotonic.return_value = 1061.0
+        data = await coordinator._async_update_data()
+
+    counts = [call.kwargs["count"] for call in client.get_latest_birds.call_args_list]
+    assert counts == [5, 5, 10]
+    assert len(data.new_detections) == 8
+    assert len(data.latest_birds) == 5
+
+
+def test_detection_tracker_is_bounded():
+    """Test that the tracker forgets the oldest IDs beyond its size."""
+    tracker = DetectionTracker(maxlen=3)
+    assert [b.id for b in tracker.filter_new([_bird(1), _bird(2)])] == [
+        "det1",
+        "det2",
+    ]
+    assert tracker.filter_new([_bird(2)]) == []
+
+    tracker.seed([_bird(3), _bird(4)])
+    assert "det1" not in tracker
+    assert "det4" in tracker
+
+
+async def test_poll_interval_adapts_to_activity(hass: HomeAssistant):
+    """Test that latest birds are polled faster while detections arrive."""
+    client = _make_mock_client()
+    client.get_latest_birds.return_value = [_bird(1)]
+    coordinator = _make_coordinator(hass, client)
+
+    with patch("custom_components.terra_listens.coordinator.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        # Nothing new yet: back off from the 30 s minimum
+        assert coordinator.update_interval == timedelta(seconds=60)
+
+        client.get_latest_birds.return_value = [_bird(2), _bird(1)]
+        mock_time.monotonic.return_value = 1060.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        assert coordinator.update_interval == timedelta(seconds=30)
+
+        mock_time.monotonic.return_value = 1090.0
+        await coordinator._async_update_data()
+        assert coordinator._poll_interval == 60
+
+
+async def test_poll_interval_max_when_not_streaming(hass: HomeAssistant):
+    """Test that an offline station is polled at the configured maximum."""
+    client = _make_mock_client()
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={"min_poll_interval": 20, "max_poll_interval": 900},
+    )
+    entry.add_to_hass(hass)
+    coordinator = _make_coordinator(
+        hass,
+        client,
+        entry,
+        station=MOCK_STATION.model_copy(update={"streaming": False}),
+    )
+
+    await coordinator._async_update_data()
 
-    # _fetch_data itself raises TerraError; the coordinator wraps it in UpdateFailed
-    with pytest.raises(TerraError):
-        coordinator._fetch_data()
+    assert coordinator._poll_interval == 900
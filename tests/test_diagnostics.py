@@ -0,0 +1,110 @@
+"""Tests for Terra Listens diagnostics."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_TOKEN, CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from terra_sdk.models import BirdDetection, Station, StationStats
+
+from custom_components.terra_listens.const import DOMAIN
+from custom_components.terra_listens.coordinator import (
+    TerraAccountCoordinator,
+    TerraStationCoordinator,
+)
+from custom_components.terra_listens.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.terra_listens.history import async_remove_history
+
+MOCK_STATION = Station(
+    station_id="DEVICE123",
+    alias="Oxbow",
+    last_heard="2026-02-08 01:00:00",
+    streaming="1",
+    lat="37.93",
+    lon="-120.27",
+    version="3.18",
+    serial="SN001",
+)
+
+MOCK_BIRD = BirdDetection(
+    id="abc123",
+    commonName="Oak Titmouse",
+    scientificName="Baeolophus inornatus",
+    alphacode="OATI",
+    speciesConfidence="0.92",
+    stamp="2026-02-08 07:30:00",
+    epoch="1770534600",
+    audioURL="",
+    Image_url="",
+    notPredicted="0",
+    complete="1",
+    anthro="0",
+)
+
+
+async def test_diagnostics_redact_secrets(hass: HomeAssistant):
+    """Test that credentials, the webhook ID and locations are redacted."""
+    client = MagicMock()
+    client.get_stats = AsyncMock(
+        return_value=StationStats(
+            uniqueSpecies="1",
+            callCount="2",
+            topBird="Oak Titmouse",
+            topBirdCount="2",
+            topTime="08:00",
+            topTimeCount="2",
+        )
+    )
+    client.get_latest_birds = AsyncMock(return_value=[MOCK_BIRD])
+    client.get_yard_list = AsyncMock(return_value=[])
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_EMAIL: "user@example.com",
+            CONF_PASSWORD: "hunter2",
+            CONF_TOKEN: "secret-token",
+            CONF_WEBHOOK_ID: "secret-webhook",
+        },
+        options={"diagnostic_metrics": True},
+    )
+    entry.add_to_hass(hass)
+    account = TerraAccountCoordinator(hass, entry, client)
+    station = account.stations[MOCK_STATION.id] = TerraStationCoordinator(
+        hass, account, MOCK_STATION
+    )
+    hass.data[DOMAIN] = {entry.entry_id: account}
+    with patch.object(account.media, "async_prefetch", AsyncMock()):
+        station.async_set_updated_data(await station._async_update_data())
+    await station.async_push_detections([MOCK_BIRD])
+    account.metrics.record("birdIDLatest", MOCK_STATION.id, 0.2)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"] == {
+        CONF_EMAIL: REDACTED,
+        CONF_PASSWORD: REDACTED,
+        CONF_TOKEN: REDACTED,
+        CONF_WEBHOOK_ID: REDACTED,
+    }
+    for secret in ("user@example.com", "hunter2", "secret-token", "secret-webhook"):
+        assert secret not in str(diagnostics)
+    station_data = diagnostics["data"]["stations"][MOCK_STATION.id]["station"]
+    assert station_data["lat"] == station_data["lon"] == REDACTED
+    assert station_data["serial"] == REDACTED
+
+    stations = diagnostics["coordinator"]["stations"]
+    assert stations[MOCK_STATION.id]["push_active"] is True
+    assert stations[MOCK_STATION.id]["stale"] is False
+    breakers = diagnostics["coordinator"]["circuit_breakers"]
+    assert breakers["devices/account"]["state"] == "closed"
+    assert breakers[f"stats/{MOCK_STATION.id}"]["failures"] == 0
+    metrics = diagnostics["metrics"]
+    assert metrics["endpoints"]["get_latest_birds"]["calls"] == 1
+    assert metrics["stations"][MOCK_STATION.id]["get_latest_birds"]["p50_ms"] == 200
+
+    await account.history.async_close()
+    await async_remove_history(hass, entry.entry_id)
@@ -0,0 +1,105 @@
+"""Tests for the Terra Listens detection history."""
+
+from datetime import UTC, datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+
+from terra_sdk.models import BirdDetection
+
+from custom_components.terra_listens.history import (
+    DetectionActivity,
+    RollingCounts,
+    TerraDetectionHistory,
+    async_remove_history,
+)
+
+NOW = datetime(2026, 2, 8, 12, 0, tzinfo=UTC)
+NOW_TS = int(NOW.timestamp())
+
+
+def _bird(detection_id: str, minutes_ago: float, alpha: str = "OATI") -> BirdDetection:
+    return BirdDetection(
+        id=detection_id,
+        commonName=f"Bird {alpha}",
+        scientificName="Aves",
+        alphacode=alpha,
+        speciesConfidence="0.9",
+        stamp="2026-02-08 12:00:00",
+        epoch=str(int(NOW_TS - minutes_ago * 60)),
+        audioURL="",
+        Image_url="",
+        notPredicted="0",
+        complete="1",
+        anthro="0",
+    )
+
+
+def test_rolling_counts_expire_without_rescanning():
+    window = RollingCounts(3600, 300)
+    window.add(NOW_TS, NOW_TS - 3000, "OATI")
+    window.add(NOW_TS, NOW_TS - 60, "CALT")
+    window.add(NOW_TS, NOW_TS - 30, "CALT")
+    # Out of order, and too old to count
+    window.add(NOW_TS, NOW_TS - 1200, "WREN")
+    window.add(NOW_TS, NOW_TS - 7200, "ACWO")
+    assert window.calls == 4
+    assert window.species == 3
+
+    window.expire(NOW_TS + 900)
+    assert window.calls == 3
+    assert window.species == 2
+
+    window.expire(NOW_TS + 3600)
+    assert window.calls == 0
+    assert window.species == 0
+
+
+async def test_history_counts_each_detection_once(hass: HomeAssistant, freezer):
+    freezer.move_to(NOW)
+    history = TerraDetectionHistory(hass, "counts")
+    await history.async_load()
+
+    stored = await history.async_add(
+        "DEV1", [_bird("a", 5), _bird("b", 90, "CALT"), _bird("c", 2000, "WREN")]
+    )
+    assert [bird.id for bird in stored] == ["a", "b", "c"]
+    # Overlapping polls return the same detections again
+    stored = await history.async_add("DEV1", [_bird("a", 5), _bird("d", 1)])
+    assert [bird.id for bird in stored] == ["d"]
+
+    assert history.activity("DEV1") == DetectionActivity(
+        calls_last_hour=2, calls_last_24h=3, species_last_24h=2
+    )
+    assert history.activity("DEV2") == DetectionActivity(0, 0, 0)
+    assert await history.async_last_seen("DEV1") == {
+        "Bird OATI": NOW_TS - 60,
+        "Bird CALT": NOW_TS - 90 * 60,
+        "Bird WREN": NOW_TS - 2000 * 60,
+    }
+
+    freezer.tick(timedelta(hours=2))
+    assert history.activity("DEV1") == DetectionActivity(0, 3, 2)
+    await history.async_close()
+    await async_remove_history(hass, "counts")
+
+
+async def test_history_rebuilds_counts_and_prunes(hass: HomeAssistant, freezer):
+    freezer.move_to(NOW)
+    history = TerraDetectionHistory(hass, "entry1")
+    old = [_bird(f"old{i}", 40 * 24 * 60 + i) for i in range(3)]
+    await history.async_add("DEV1", [*old, _bird("a", 5), _bird("b", 600, "CALT")])
+    await history.async_close()
+
+    reloaded = TerraDetectionHistory(hass, "entry1")
+    await reloaded.async_load()
+    assert reloaded.activity("DEV1") == DetectionActivity(1, 2, 2)
+    # Pruned on load, so the old detections are stored as new again
+    stored = await reloaded.async_add("DEV1", old)
+    assert len(stored) == 3
+    await reloaded.async_close()
+
+    await async_remove_history(hass, "entry1")
+    emptied = TerraDetectionHistory(hass, "entry1")
+    await emptied.async_load()
+    assert emptied.activity("DEV1") == DetectionActivity(0, 0, 0)
+    await emptied.async_close()
@@ -0,0 +1,157 @@
+"""Tests for the Terra Listens media cache and image entity."""
+
+import asyncio
+import os
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.setup import async_setup_component
+
+from custom_components.terra_listens.image import TerraLastBirdImage
+from custom_components.terra_listens.media import (
+    CachedMedia,
+    TerraMediaCache,
+    TerraMediaView,
+)
+from custom_components.terra_listens.views import StationView
+
+OATI_URL = "https://example.com/OATI.jpg"
+CALT_URL = "https://example.com/CALT.jpg"
+WREN_URL = "https://example.com/WREN.png"
+
+
+def _make_cache(hass: HomeAssistant, directory, max_bytes: int = 1024):
+    return TerraMediaCache(
+        hass, async_get_clientsession(hass), str(directory), max_bytes=max_bytes
+    )
+
+
+async def test_media_downloaded_once(hass: HomeAssistant, aioclient_mock, tmp_path):
+    aioclient_mock.get(OATI_URL, content=b"titmouse")
+    cache = _make_cache(hass, tmp_path)
+
+    first, second = await asyncio.gather(
+        cache.async_get("OATI", OATI_URL), cache.async_get("OATI", OATI_URL)
+    )
+    assert first == second == CachedMedia(b"titmouse", "image/jpeg")
+    assert await cache.async_get("OATI", OATI_URL) == first
+    assert aioclient_mock.call_count == 1
+
+    # A new cache (after a restart) finds the file on disk
+    restarted = _make_cache(hass, tmp_path)
+    assert await restarted.async_get("OATI", OATI_URL) == first
+    assert aioclient_mock.call_count == 1
+
+
+async def test_least_recently_used_evicted(
+    hass: HomeAssistant, aioclient_mock, tmp_path
+):
+    aioclient_mock.get(OATI_URL, content=b"1234")
+    aioclient_mock.get(CALT_URL, content=b"5678")
+    aioclient_mock.get(WREN_URL, content=b"9012")
+    cache = _make_cache(hass, tmp_path, max_bytes=10)
+
+    await cache.async_prefetch([("OATI", OATI_URL), ("CALT", CALT_URL)])
+    await cache.async_get("OATI", OATI_URL)
+    await cache.async_get("WREN", WREN_URL)
+
+    assert aioclient_mock.call_count == 3
+    assert len(os.listdir(tmp_path)) == 2
+    assert (await cache.async_get("OATI", OATI_URL)).content == b"1234"
+    assert aioclient_mock.call_count == 3
+    # CALT was used least recently and has to be downloaded again
+    await cache.async_get("CALT", CALT_URL)
+    assert aioclient_mock.call_count == 4
+
+
+async def test_failed_download_not_cached(
+    hass: HomeAssistant, aioclient_mock, tmp_path
+):
+    aioclient_mock.get(OATI_URL, status=404)
+    cache = _make_cache(hass, tmp_path)
+
+    assert await cache.async_get("OATI", OATI_URL) is None
+    assert os.listdir(tmp_path) == []
+
+
+async def test_media_view_serves_signed_urls(
+    hass: HomeAssistant,
+    hass_client,
+    hass_client_no_auth,
+    aioclient_mock,
+    tmp_path,
+    freezer,
+):
+    aioclient_mock.get(OATI_URL, content=b"titmouse")
+    assert await async_setup_component(hass, "http", {})
+    cache = _make_cache(hass, tmp_path)
+    hass.http.register_view(TerraMediaView(cache))
+    client = await hass_client_no_auth()
+
+    url = cache.async_local_url("OATI", OATI_URL)
+    path = url.split("?")[0]
+    assert path.startswith("/api/terra_listens/media/oati_")
+    resp = await client.get(url)
+    assert resp.status == 200
+    assert resp.content_type == "image/jpeg"
+    assert await resp.read() == b"titmouse"
+    # The signature is reused, so entity pictures do not change on every poll
+    assert cache.async_local_url("OATI", OATI_URL) == url
+    assert cache.async_local_url("OATI", "") is None
+
+    # Without a signature or a login nothing is served
+    assert (await client.get(path)).status == 401
+    # Only files handed out or already cached are served
+    client = await hass_client()
+    assert (await client.get(path)).status == 200
+    assert (await client.get(f"{path}x")).status == 404
+    restarted = _make_cache(hass, tmp_path)
+    assert (await restarted.async_get_local(path.rsplit("/", 1)[1])).content == (
+        b"titmouse"
+    )
+    assert aioclient_mock.call_count == 1
+
+    # Signed again once half the validity is over
+    freezer.tick(timedelta(days=4))
+    assert cache.async_local_url("OATI", OATI_URL) != url
+
+
+def _view(alpha_code: str | None, image_url: str | None) -> StationView:
+    view = MagicMock(spec=StationView)
+    view.last_bird_alpha_code = alpha_code
+    view.last_bird_image_url = image_url
+    view.expired = frozenset()
+    view.attributes = {}
+    return view
+
+
+async def test_image_entity_serves_cached_image(hass: HomeAssistant):
+    coordinator = MagicMock()
+    coordinator.hass = hass
+    coordinator.station_id = "DEV1"
+    coordinator.view = _view("OATI", OATI_URL)
+    media = coordinator.account.media
+    media.async_get = AsyncMock(return_value=CachedMedia(b"titmouse", "image/jpeg"))
+    image = TerraLastBirdImage(coordinator)
+    updated = image.image_last_updated
+    assert updated is not None
+
+    assert await image.async_image() == b"titmouse"
+    assert await image.async_image() == b"titmouse"
+    assert image.content_type == "image/jpeg"
+    media.async_get.assert_awaited_once_with("OATI", OATI_URL)
+
+    coordinator.view = _view("WREN", WREN_URL)
+    image.async_write_ha_state = MagicMock()
+    image._handle_coordinator_update()
+    media.async_get.return_value = CachedMedia(b"wrentit", "image/png")
+    assert await image.async_image() == b"wrentit"
+    assert image.content_type == "image/png"
+    assert image.image_last_updated >= updated
+    image.async_write_ha_state.assert_called_once()
+
+    coordinator.view = _view(None, None)
+    image._handle_coordinator_update()
+    assert await image.async_image() is None
@@ -1,18 +1,19 @@
 """Tests for Terra Listens sensor and binary sensor entities."""
 
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
 import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
 
 from terra_sdk.models import BirdDetection, Station, StationStats
 
+from custom_components.terra_listens.binary_sensor import TerraStreamingBinarySensor
 from custom_components.terra_listens.coordinator import TerraStationData
-from custom_components.terra_listens.sensor import (
-    _calls_today,
-    _last_bird,
-    _last_bird_attrs,
-    _species_today,
-    _top_bird,
-    _yard_list_total,
-)
+from custom_components.terra_listens.media import TerraMediaCache
+from custom_components.terra_listens.sensor import SENSOR_DESCRIPTIONS, TerraSensor
+from custom_components.terra_listens.views import build_station_view
 
 MOCK_STATION = Station(
     station_id="DEV1",
@@ -48,9 +49,7 @@ MOCK_BIRD = BirdDetection(
 )
 
 
-def _make_station_data(
-    stats=MOCK_STATS, birds=None, yard_count=30
-) -> TerraStationData:
+def _make_station_data(stats=MOCK_STATS, birds=None, yard_count=30) -> TerraStationData:
     return TerraStationData(
         station=MOCK_STATION,
         stats=stats,
@@ -61,55 +60,154 @@ def _make_station_data(
 
 def test_species_today():
     data = _make_station_data()
-    assert _species_today(data) == 8
+    assert build_station_view(data).species_today == 8
 
 
 def test_species_today_no_stats():
     data = _make_station_data(stats=None)
-    assert _species_today(data) is None
+    assert build_station_view(data).species_today is None
 
 
 def test_calls_today():
     data = _make_station_data()
-    assert _calls_today(data) == 120
+    assert build_station_view(data).calls_today == 120
 
 
 def test_top_bird():
     data = _make_station_data()
-    assert _top_bird(data) == "Acorn Woodpecker"
+    assert build_station_view(data).top_bird == "Acorn Woodpecker"
 
 
 def test_last_bird():
     data = _make_station_data()
-    assert _last_bird(data) == "California Towhee"
+    assert build_station_view(data).last_bird == "California Towhee"
 
 
 def test_last_bird_no_detections():
     data = _make_station_data(birds=[])
-    assert _last_bird(data) is None
+    assert build_station_view(data).last_bird is None
 
 
-def test_last_bird_attrs():
+async def test_last_bird_attrs(hass: HomeAssistant):
+    assert await async_setup_component(hass, "http", {})
     data = _make_station_data()
-    attrs = _last_bird_attrs(data)
+    media = TerraMediaCache(hass, MagicMock(), "media")
+    attrs = build_station_view(data, media=media).last_bird_attributes
     assert attrs["scientific_name"] == "Melozone crissalis"
     assert attrs["alpha_code"] == "CALT"
     assert attrs["confidence"] == 0.78
     assert attrs["image_url"] == "https://example.com/CALT.jpg"
     assert attrs["audio_url"] == "https://example.com/audio.flac"
-    assert "entity_picture" in attrs
+    # The picture is served from the media cache, not fetched from Terra
+    assert attrs["entity_picture"] == media.async_local_url(
+        "CALT", "https://example.com/CALT.jpg"
+    )
+    assert attrs["entity_picture"].startswith("/api/terra_listens/media/calt_")
+    assert "authSig=" in attrs["entity_picture"]
+    assert "entity_picture" not in build_station_view(data).last_bird_attributes
 
 
 def test_last_bird_attrs_empty():
     data = _make_station_data(birds=[])
-    assert _last_bird_attrs(data) == {}
+    assert build_station_view(data).last_bird_attributes == {}
 
 
 def test_yard_list_total():
     data = _make_station_data(yard_count=47)
-    assert _yard_list_total(data) == 47
+    assert build_station_view(data).yard_list_total == 47
 
 
 def test_yard_list_total_zero():
     data = _make_station_data(yard_count=0)
-    assert _yard_list_total(data) == 0
+    assert build_station_view(data).yard_list_total == 0
+
+
+def _make_view(**kwargs):
+    return build_station_view(_make_station_data(**kwargs))
+
+
+def _make_coordinator(station_data: TerraStationData) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.view = build_station_view(station_data)
+    coordinator.station_id = "DEV1"
+    return coordinator
+
+
+def test_sensor_skips_unchanged_state_writes():
+    coordinator = _make_coordinator(_make_station_data())
+    description = next(d for d in SENSOR_DESCRIPTIONS if d.key == "last_bird")
+    sensor = TerraSensor(coordinator, description)
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor._handle_coordinator_update()
+        coordinator.view = _make_view()
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 1
+
+        coordinator.view = _make_view(stats=None)
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 1
+
+        new_bird = MOCK_BIRD.model_copy(update={"common_name": "Wrentit"})
+        coordinator.view = _make_view(birds=[new_bird])
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 2
+
+
+def test_binary_sensor_skips_unchanged_state_writes():
+    coordinator = _make_coordinator(_make_station_data())
+    sensor = TerraStreamingBinarySensor(coordinator)
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 1
+
+        coordinator.last_update_success = False
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 2
+
+
+def test_view_is_immutable():
+    view = _make_view()
+    with pytest.raises(AttributeError):
+        view.last_bird = "Wrentit"
+    with pytest.raises(TypeError):
+        view.last_bird_attributes["alpha_code"] = "WREN"
+
+
+def test_stale_flag_in_attributes():
+    coordinator = _make_coordinator(_make_station_data())
+    coordinator.view = build_station_view(_make_station_data(), restored=True)
+    description = next(d for d in SENSOR_DESCRIPTIONS if d.key == "last_bird")
+    sensor = TerraSensor(coordinator, description)
+    assert sensor.extra_state_attributes["stale"] is True
+    assert sensor.extra_state_attributes["alpha_code"] == "CALT"
+
+    coordinator.view = _make_view()
+    assert "stale" not in sensor.extra_state_attributes
+
+
+def test_stale_slice_flagged_and_expired_unavailable():
+    updated = datetime(2026, 2, 8, 7, 0, tzinfo=UTC)
+    station_data = _make_station_data()
+    station_data.updated = {"stats": updated}
+    station_data.stale = frozenset({"stats"})
+    coordinator = _make_coordinator(station_data)
+    stats_description = next(d for d in SENSOR_DESCRIPTIONS if d.key == "species_today")
+    bird_description = next(d for d in SENSOR_DESCRIPTIONS if d.key == "last_bird")
+    stats_sensor = TerraSensor(coordinator, stats_description)
+    bird_sensor = TerraSensor(coordinator, bird_description)
+
+    assert stats_sensor.available
+    assert stats_sensor.native_value == 8
+    assert stats_sensor.extra_state_attributes == {
+        "stale": True,
+        "last_updated": "2026-02-08T07:00:00+00:00",
+    }
+    assert "stale" not in bird_sensor.extra_state_attributes
+
+    station_data.expired = frozenset({"stats"})
+    coordinator.view = build_station_view(station_data)
+    assert not stats_sensor.available
+    assert bird_sensor.available
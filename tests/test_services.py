@@ -0,0 +1,148 @@
+"""Tests for the Terra Listens services."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import voluptuous as vol
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from terra_sdk.models import Station
+
+from custom_components.terra_listens.const import (
+    DOMAIN,
+    SERVICE_BACKFILL,
+    SERVICE_REFRESH,
+)
+from custom_components.terra_listens.coordinator import (
+    TerraAccountCoordinator,
+    TerraStationCoordinator,
+)
+from custom_components.terra_listens.services import async_setup_services
+
+STATION_IDS = ("DEVICE123", "DEVICE456")
+
+
+@pytest.fixture
+async def account(hass: HomeAssistant) -> TerraAccountCoordinator:
+    """Set up an account with two stations and the services."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    account = TerraAccountCoordinator(hass, entry, MagicMock())
+    account.refresh_requests.async_request = AsyncMock()
+    account.backfill.async_start = MagicMock()
+    for station_id in STATION_IDS:
+        station = account.stations[station_id] = TerraStationCoordinator(
+            hass,
+            account,
+            Station(
+                station_id=station_id,
+                alias=station_id,
+                last_heard="2026-02-08 01:00:00",
+                streaming="1",
+                lat="37.93",
+                lon="-120.27",
+            ),
+        )
+        station.refresh_requests.async_request = AsyncMock()
+    hass.data[DOMAIN] = {entry.entry_id: account}
+    async_setup_services(hass)
+    return account
+
+
+def _requested(account: TerraAccountCoordinator) -> dict[str, list[set[str]]]:
+    """Return the endpoints each station was asked to refresh."""
+    return {
+        station_id: [
+            call.args[0] for call in station.refresh_requests.async_request.mock_calls
+        ]
+        for station_id, station in account.stations.items()
+    }
+
+
+async def test_refresh_default_endpoints(
+    hass: HomeAssistant, account: TerraAccountCoordinator
+):
+    """Test that a refresh without arguments fetches stats and birds everywhere."""
+    await hass.services.async_call(DOMAIN, SERVICE_REFRESH, {}, blocking=True)
+
+    assert _requested(account) == {
+        station_id: [{"stats", "latest_birds"}] for station_id in STATION_IDS
+    }
+    account.refresh_requests.async_request.assert_not_called()
+
+
+async def test_refresh_selected_endpoints(
+    hass: HomeAssistant, account: TerraAccountCoordinator
+):
+    """Test that the station and endpoint selection is passed on."""
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REFRESH,
+        {"station_id": "DEVICE456", "endpoints": ["yard_list", "devices"]},
+        blocking=True,
+    )
+    assert _requested(account) == {"DEVICE123": [], "DEVICE456": [{"yard_list"}]}
+    account.refresh_requests.async_request.assert_called_once_with({"devices"})
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_REFRESH, {"endpoints": "devices"}, blocking=True
+    )
+    assert _requested(account) == {"DEVICE123": [], "DEVICE456": [{"yard_list"}]}
+    assert account.refresh_requests.async_request.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"endpoints": ["history"]},
+        {"endpoints": ["stats", "devices", "media"]},
+        {"station_id": "DEVICE123", "unknown": True},
+    ],
+)
+async def test_refresh_schema(
+    hass: HomeAssistant, account: TerraAccountCoordinator, data: dict
+):
+    """Test that invalid service data is rejected before anything is fetched."""
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(DOMAIN, SERVICE_REFRESH, data, blocking=True)
+    assert _requested(account) == {station_id: [] for station_id in STATION_IDS}
+    account.refresh_requests.async_request.assert_not_called()
+
+
+@pytest.mark.parametrize("service", [SERVICE_REFRESH, SERVICE_BACKFILL])
+async def test_unknown_station(
+    hass: HomeAssistant, account: TerraAccountCoordinator, service: str
+):
+    """Test that naming a station that is not set up is a validation error."""
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            service,
+            {"station_id": ["DEVICE123", "MISSING"]},
+            blocking=True,
+        )
+    assert err.value.translation_key == "unknown_station"
+    assert err.value.translation_placeholders == {"station_id": "MISSING"}
+    assert _requested(account) == {station_id: [] for station_id in STATION_IDS}
+    account.backfill.async_start.assert_not_called()
+
+
+async def test_backfill(hass: HomeAssistant, account: TerraAccountCoordinator):
+    """Test that a backfill is started for the selected stations."""
+    await hass.services.async_call(
+        DOMAIN, SERVICE_BACKFILL, {"station_id": "DEVICE123"}, blocking=True
+    )
+    account.backfill.async_start.assert_called_once_with(account.stations["DEVICE123"])
+
+    account.backfill.async_start.reset_mock()
+    await hass.services.async_call(DOMAIN, SERVICE_BACKFILL, {}, blocking=True)
+    assert [
+        call.args[0].station_id for call in account.backfill.async_start.mock_calls
+    ] == list(STATION_IDS)
+
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_BACKFILL, {"station_id": {"id": 1}}, blocking=True
+        )
@@ -0,0 +1,205 @@
+"""Tests for the Terra Listens species table and species sensors."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from terra_sdk.models import BirdDetection, Station, StationStats, YardListEntry
+
+from custom_components.terra_listens.const import DOMAIN
+from custom_components.terra_listens.coordinator import (
+    TerraAccountCoordinator,
+    TerraStationCoordinator,
+    signal_species_added,
+)
+from custom_components.terra_listens.history import async_remove_history
+from custom_components.terra_listens.sensor import TerraSpeciesSensor
+from custom_components.terra_listens.species import SpeciesTable
+
+MOCK_STATION = Station(
+    station_id="DEVICE123",
+    alias="Oxbow",
+    last_heard="2026-02-08 01:00:00",
+    streaming="1",
+    lat="37.93",
+    lon="-120.27",
+)
+
+MOCK_STATS = StationStats(
+    uniqueSpecies="2",
+    callCount="5",
+    topBird="Oak Titmouse",
+    topBirdCount="3",
+    topTime="08:00",
+    topTimeCount="2",
+)
+
+MOCK_YARD_LIST = [
+    YardListEntry(
+        commonName="Oak Titmouse",
+        speciesCode="OATI",
+        sighting_count="3",
+        first_seen_after_cutoff="2025-06-01",
+        Image_url="https://example.com/OATI.jpg",
+        epoch=1748736000,
+    ),
+    YardListEntry(
+        commonName="Wrentit",
+        speciesCode="WREN",
+        sighting_count="2",
+        first_seen_after_cutoff="2025-06-02",
+        Image_url="",
+        epoch=1748822400,
+    ),
+]
+
+
+def _bird(n: int, alpha_code: str = "OATI", name: str = "Oak Titmouse"):
+    return BirdDetection(
+        id=f"det{n}",
+        commonName=name,
+        scientificName="",
+        alphacode=alpha_code,
+        speciesConfidence="0.9",
+        stamp="2026-02-08 07:30:00",
+        epoch=str(1770534600 + n),
+        audioURL="",
+        Image_url="",
+        notPredicted="0",
+        complete="1",
+        anthro="0",
+    )
+
+
+def test_table_reports_only_changed_species():
+    table = SpeciesTable()
+    last_seen = {"Oak Titmouse": 1770534000}
+    assert table.replace(MOCK_YARD_LIST, last_seen) == {"OATI", "WREN"}
+    assert table.get("OATI").sightings == 3
+    assert table.get("OATI").last_seen == datetime(2026, 2, 8, 7, 0, tzinfo=UTC)
+    assert table.get("WREN").last_seen is None
+
+    assert table.add_detections([_bird(1)]) == {"OATI"}
+    assert table.get("OATI").sightings == 4
+    assert table.get("WREN").sightings == 2
+
+    # A species first seen now is added
+    assert table.add_detections([_bird(2, "CALT", "California Towhee")]) == {"CALT"}
+    assert len(table) == 3
+
+    # The next yard list download corrects the counts; last-seen times are kept
+    assert table.replace(MOCK_YARD_LIST, {}) == {"OATI", "CALT"}
+    assert table.get("OATI").sightings == 3
+    assert table.get("OATI").last_seen == datetime(2026, 2, 8, 7, 10, 1, tzinfo=UTC)
+    assert "CALT" not in table
+    assert table.replace(MOCK_YARD_LIST, {}) == set()
+
+
+def test_detection_updates_yard_list_species():
+    """Test that detections are matched to yard-list species by common name."""
+    table = SpeciesTable()
+    yard_list = [
+        entry.model_copy(update={"species_code": entry.species_code.lower()})
+        for entry in MOCK_YARD_LIST
+    ]
+    assert table.replace(yard_list, {"Oak Titmouse": 1770534000}) == {"oati", "wren"}
+    assert table.get("oati").last_seen == datetime(2026, 2, 8, 7, 0, tzinfo=UTC)
+
+    assert table.add_detections([_bird(1), _bird(2, "WREN", "Wrentit")]) == {
+        "oati",
+        "wren",
+    }
+    assert table.get("oati").sightings == 4
+    assert table.get("oati").last_seen == datetime(2026, 2, 8, 7, 10, 1, tzinfo=UTC)
+    assert table.get("wren").sightings == 3
+    assert len(table) == 2
+
+
+async def test_only_detected_species_are_updated(hass: HomeAssistant, freezer):
+    """Test that a poll only notifies the sensors of the species it detected."""
+    freezer.move_to(datetime(2026, 2, 8, 8, 0, tzinfo=UTC))
+    client = MagicMock()
+    client.get_stats = AsyncMock(return_value=MOCK_STATS)
+    client.get_latest_birds = AsyncMock(return_value=[_bird(1)])
+    client.get_yard_list = AsyncMock(return_value=MOCK_YARD_LIST)
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={"species_sensors": True})
+    entry.add_to_hass(hass)
+    account = TerraAccountCoordinator(hass, entry, client)
+    coordinator = TerraStationCoordinator(hass, account, MOCK_STATION)
+    added: list[tuple[TerraStationCoordinator, list[str]]] = []
+    async_dispatcher_connect(
+        hass,
+        signal_species_added(entry.entry_id),
+        callback(lambda station, codes: added.append((station, codes))),
+    )
+
+    # Yard list images would be prefetched from the network
+    with (
+        patch("custom_components.terra_listens.coordinator.time") as mock_time,
+        patch.object(account.media, "async_prefetch", AsyncMock()),
+    ):
+        mock_time.monotonic.return_value = 1000.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        assert added == [(coordinator, ["OATI", "WREN"])]
+        # The last-seen time comes from the detection history
+        assert coordinator.species.get("OATI").last_seen == datetime(
+            2026, 2, 8, 7, 10, 1, tzinfo=UTC
+        )
+
+        titmouse, wrentit = MagicMock(), MagicMock()
+        coordinator.async_add_species_listener("OATI", titmouse)
+        remove_wrentit = coordinator.async_add_species_listener("WREN", wrentit)
+
+        client.get_latest_birds.return_value = [_bird(2), _bird(1)]
+        mock_time.monotonic.return_value = 1061.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+        assert titmouse.call_count == 1
+        assert wrentit.call_count == 0
+        assert coordinator.species.get("OATI").sightings == 4
+
+        # A new species is announced instead
+        remove_wrentit()
+        client.get_latest_birds.return_value = [
+            _bird(3, "CALT", "California Towhee"),
+            _bird(2),
+        ]
+        mock_time.monotonic.return_value = 1122.0
+        coordinator.async_set_updated_data(await coordinator._async_update_data())
+    assert added[-1] == (coordinator, ["CALT"])
+    assert titmouse.call_count == 1
+
+    await account.history.async_close()
+    await async_remove_history(hass, entry.entry_id)
+
+
+async def test_species_sensor_follows_availability(hass: HomeAssistant):
+    """Test that coordinator updates only write state if availability changed."""
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={"species_sensors": True})
+    entry.add_to_hass(hass)
+    account = TerraAccountCoordinator(hass, entry, MagicMock())
+    coordinator = TerraStationCoordinator(hass, account, MOCK_STATION)
+    coordinator.species = SpeciesTable()
+    coordinator.species.replace(MOCK_YARD_LIST, {})
+    sensor = TerraSpeciesSensor(coordinator, "OATI")
+
+    with patch(
+        "homeassistant.helpers.entity.Entity.async_write_ha_state"
+    ) as mock_write:
+        sensor.async_write_ha_state()
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 1
+        assert sensor.available
+
+        coordinator.last_update_success = False
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 2
+        assert not sensor.available
+
+        coordinator.last_update_success = True
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 3
+        assert sensor.native_value == 3
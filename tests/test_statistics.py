@@ -0,0 +1,193 @@
+"""Tests for the Terra Listens long-term statistics import."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from terra_sdk.exceptions import TerraError
+from terra_sdk.models import BirdDetection, GraphStatsEntry, Station
+
+from custom_components.terra_listens.const import DOMAIN
+from custom_components.terra_listens.coordinator import TerraAccountCoordinator
+from custom_components.terra_listens.history import async_remove_history
+
+MOCK_STATION = Station(
+    station_id="DEVICE-123",
+    alias="Oxbow",
+    last_heard="2026-02-08 01:00:00",
+    streaming="1",
+    lat="37.93",
+    lon="-120.27",
+)
+
+NOW = datetime(2026, 2, 8, 12, 30, tzinfo=UTC)
+
+
+def _bird(detection_id: str, when: datetime) -> BirdDetection:
+    return BirdDetection(
+        id=detection_id,
+        commonName="Oak Titmouse",
+        scientificName="Baeolophus inornatus",
+        alphacode="OATI",
+        speciesConfidence="0.92",
+        stamp=when.isoformat(),
+        epoch=str(int(when.timestamp())),
+        audioURL="",
+        Image_url="",
+        notPredicted="0",
+        complete="1",
+        anthro="0",
+    )
+
+
+def _make_account(hass: HomeAssistant, client) -> TerraAccountCoordinator:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    account = TerraAccountCoordinator(hass, entry, client)
+    account.stations[MOCK_STATION.id] = MagicMock(station=MOCK_STATION)
+    hass.config.components.add("recorder")
+    return account
+
+
+async def test_import_backfills_then_adds_completed_hours(hass: HomeAssistant, freezer):
+    """Test the backfill from the call graph followed by hourly imports."""
+    freezer.move_to(NOW)
+    client = MagicMock()
+    client.get_graph_stats = AsyncMock(
+        return_value=[
+            GraphStatsEntry(ts=f"2026-02-08T09:{minute:02}:00+00:00", totalCalls="2")
+            for minute in range(0, 60, 5)
+        ]
+    )
+    account = _make_account(hass, client)
+    hour = datetime(2026, 2, 8, tzinfo=UTC)
+    await account.history.async_add(
+        MOCK_STATION.id,
+        [
+            _bird("a", hour.replace(hour=10, minute=10)),
+            _bird("b", hour.replace(hour=11, minute=40)),
+            _bird("c", hour.replace(hour=11, minute=50)),
+            # Not imported until the hour is over
+            _bird("d", hour.replace(hour=12, minute=10)),
+        ],
+    )
+
+    with patch(
+        "homeassistant.components.recorder.statistics.async_add_external_statistics"
+    ) as mock_add:
+        await account.statistics.async_import()
+        metadata, statistics = mock_add.call_args.args[1:]
+        assert metadata["statistic_id"] == "terra_listens:device_123_calls"
+        assert metadata["has_sum"]
+        assert [(s["start"].hour, s["state"], s["sum"]) for s in statistics] == [
+            (9, 24, 24),
+            (10, 1, 25),
+            (11, 2, 27),
+        ]
+
+        # Nothing new is complete yet
+        mock_add.reset_mock()
+        await account.statistics.async_import()
+        mock_add.assert_not_called()
+
+        freezer.tick(timedelta(hours=2))
+        await account.statistics.async_import()
+        statistics = mock_add.call_args.args[2]
+        assert [(s["start"].hour, s["state"], s["sum"]) for s in statistics] == [
+            (12, 1, 28),
+            (13, 0, 28),
+        ]
+    assert client.get_graph_stats.call_count == 1
+
+    await account.history.async_close()
+    await async_remove_history(hass, account.config_entry.entry_id)
+
+
+async def test_import_without_backfill(hass: HomeAssistant, freezer):
+    """Test that a failed backfill starts the statistic at the local history."""
+    freezer.move_to(NOW)
+    client = MagicMock()
+    client.get_graph_stats = AsyncMock(side_effect=TerraError("graph down"))
+    account = _make_account(hass, client)
+
+    with patch(
+        "homeassistant.components.recorder.statistics.async_add_external_statistics"
+    ) as mock_add:
+        await account.statistics.async_import()
+    statistics = mock_add.call_args.args[2]
+    assert [(s["start"].hour, s["state"], s["sum"]) for s in statistics] == [(11, 0, 0)]
+
+    await account.history.async_close()
+    await async_remove_history(hass, account.config_entry.entry_id)
+
+
+async def test_late_detections_reimport_hours(hass: HomeAssistant, freezer):
+    """Test that detections stored for imported hours are counted again."""
+    freezer.move_to(NOW)
+    client = MagicMock()
+    client.get_graph_stats = AsyncMock(return_value=[])
+    account = _make_account(hass, client)
+    hour = datetime(2026, 2, 8, tzinfo=UTC)
+    history = account.history
+    await history.async_add(MOCK_STATION.id, [_bird("a", hour.replace(hour=10))])
+    recorder = MagicMock()
+
+    with (
+        patch(
+            "homeassistant.components.recorder.statistics."
+            "async_add_external_statistics"
+        ) as mock_add,
+        patch("homeassistant.components.recorder.get_instance", return_value=recorder),
+    ):
+        await account.statistics.async_import()
+        statistics = mock_add.call_args.args[2]
+        assert [(s["start"].hour, s["state"], s["sum"]) for s in statistics] == [
+            (10, 1, 1),
+            (11, 0, 1),
+        ]
+
+        # Fetched after the hour was imported, e.g. by the first poll after a
+        # restart; the recorder holds the rows imported before
+        await history.async_add(
+            MOCK_STATION.id,
+            [
+                _bird("b", hour.replace(hour=11, minute=20)),
+                _bird("c", hour.replace(hour=11, minute=30)),
+            ],
+        )
+        recorder.async_add_executor_job = AsyncMock(
+            return_value={
+                "terra_listens:device_123_calls": [
+                    {
+                        "start": s["start"].timestamp(),
+                        "state": s["state"],
+                        "sum": s["sum"],
+                    }
+                    for s in statistics
+                ]
+            }
+        )
+        freezer.tick(timedelta(hours=1))
+        await account.statistics.async_import()
+        statistics = mock_add.call_args.args[2]
+        assert [(s["start"].hour, s["state"], s["sum"]) for s in statistics] == [
+            (11, 2, 3),
+            (12, 0, 3),
+        ]
+        start = recorder.async_add_executor_job.call_args.args[2]
+        assert start == hour.replace(hour=10)
+
+        # Without new detections the import only moves forward
+        recorder.async_add_executor_job.reset_mock()
+        freezer.tick(timedelta(hours=1))
+        await account.statistics.async_import()
+        statistics = mock_add.call_args.args[2]
+        assert [(s["start"].hour, s["state"], s["sum"]) for s in statistics] == [
+            (13, 0, 3)
+        ]
+    recorder.async_add_executor_job.assert_not_called()
+
+    await history.async_close()
+    await async_remove_history(hass, account.config_entry.entry_id)
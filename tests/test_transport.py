@@ -0,0 +1,45 @@
+"""Tests for the shared Terra Listens transport."""
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.terra_listens.const import DATA_TRANSPORT, DOMAIN
+from custom_components.terra_listens.transport import (
+    TokenBucket,
+    async_get_transport,
+)
+
+
+async def test_transport_shared_between_entries(hass: HomeAssistant):
+    transport = async_get_transport(hass)
+
+    assert async_get_transport(hass) is transport
+    assert hass.data[DOMAIN][DATA_TRANSPORT] is transport
+
+
+async def test_token_bucket_limits_rate():
+    clock = [0.0]
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        clock[0] += delay
+
+    with (
+        patch(
+            "custom_components.terra_listens.transport.time.monotonic",
+            side_effect=lambda: clock[0],
+        ),
+        patch(
+            "custom_components.terra_listens.transport.asyncio.sleep",
+            side_effect=fake_sleep,
+        ),
+    ):
+        bucket = TokenBucket(rate=2.0, burst=3)
+        for _ in range(5):
+            await bucket.acquire()
+
+    # Three requests fit in the burst, the next two wait half a second each
+    assert sleeps == [0.5, 0.5]
+    assert clock[0] == 1.0
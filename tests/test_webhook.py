@@ -0,0 +1,151 @@
+"""Tests for the Terra Listens push webhook."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from terra_sdk.models import BirdDetection, Station, StationStats
+
+from custom_components.terra_listens.const import DOMAIN, EVENT_DETECTION
+from custom_components.terra_listens.coordinator import (
+    TerraAccountCoordinator,
+    TerraStationCoordinator,
+)
+from custom_components.terra_listens.history import async_remove_history
+from custom_components.terra_listens.webhook import async_setup_webhook
+
+WEBHOOK_ID = "terra-push"
+WEBHOOK_URL = f"/api/webhook/{WEBHOOK_ID}"
+
+MOCK_STATION = Station(
+    station_id="DEVICE123",
+    alias="Oxbow",
+    last_heard="2026-02-08 01:00:00",
+    streaming="1",
+    lat="37.93",
+    lon="-120.27",
+)
+
+
+def _raw_bird(n: int) -> dict[str, str]:
+    """Return a detection in the API's record format."""
+    return {
+        "id": f"det{n}",
+        "commonName": "Oak Titmouse",
+        "scientificName": "Baeolophus inornatus",
+        "alphacode": "OATI",
+        "speciesConfidence": "0.9",
+        "stamp": "2026-02-08 07:30:00",
+        "epoch": str(1770534600 + n),
+        "audioURL": "",
+        "Image_url": "",
+        "notPredicted": "0",
+        "complete": "1",
+        "anthro": "0",
+    }
+
+
+async def _setup(hass: HomeAssistant):
+    client = MagicMock()
+    client.get_stats = AsyncMock(
+        return_value=StationStats(
+            uniqueSpecies="1",
+            callCount="1",
+            topBird="Oak Titmouse",
+            topBirdCount="1",
+            topTime="08:00",
+            topTimeCount="1",
+        )
+    )
+    client.get_latest_birds = AsyncMock(
+        return_value=[BirdDetection.model_validate(_raw_bird(1))]
+    )
+    client.get_yard_list = AsyncMock(return_value=[])
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_WEBHOOK_ID: WEBHOOK_ID})
+    entry.add_to_hass(hass)
+    account = TerraAccountCoordinator(hass, entry, client)
+    station = account.stations[MOCK_STATION.id] = TerraStationCoordinator(
+        hass, account, MOCK_STATION
+    )
+    remove = await async_setup_webhook(hass, entry, account)
+    assert remove is not None
+    return account, station, remove
+
+
+async def test_push_applies_detections(hass: HomeAssistant, hass_client_no_auth):
+    """Test that a valid push is applied, and rejected pushes are not."""
+    events = async_capture_events(hass, EVENT_DETECTION)
+    account, station, remove = await _setup(hass)
+    client = await hass_client_no_auth()
+    with patch.object(account.media, "async_prefetch", AsyncMock()):
+        station.async_set_updated_data(await station._async_update_data())
+
+    resp = await client.post(
+        WEBHOOK_URL,
+        json={
+            "station_id": MOCK_STATION.id,
+            "detections": [_raw_bird(2), _raw_bird(1)],
+            "station": {**MOCK_STATION.model_dump(by_alias=True), "streaming": "0"},
+        },
+    )
+    assert resp.status == 200
+    await hass.async_block_till_done()
+    assert [b.id for b in station.data.latest_birds] == ["det2", "det1"]
+    assert [e.data["detection_id"] for e in events] == ["det2"]
+    assert not station.data.station.streaming
+
+    for payload in (
+        {"detections": [_raw_bird(3)]},
+        {"station_id": MOCK_STATION.id, "detections": [{"id": "det3"}]},
+        {
+            "station_id": MOCK_STATION.id,
+            "station": {**MOCK_STATION.model_dump(by_alias=True), "station_id": "X"},
+        },
+    ):
+        assert (await client.post(WEBHOOK_URL, json=payload)).status == 400
+    assert (await client.post(WEBHOOK_URL, data="not json")).status == 400
+    resp = await client.post(WEBHOOK_URL, json={"station_id": "OTHER"})
+    assert resp.status == 404
+    assert len(events) == 1
+
+    remove()
+    await account.history.async_close()
+    await async_remove_history(hass, account.config_entry.entry_id)
+
+
+async def test_push_before_first_poll_dropped(hass: HomeAssistant, hass_client_no_auth):
+    """Test that a push before the first poll is acknowledged but dropped."""
+    events = async_capture_events(hass, EVENT_DETECTION)
+    account, station, remove = await _setup(hass)
+    client = await hass_client_no_auth()
+
+    resp = await client.post(
+        WEBHOOK_URL,
+        json={"station_id": MOCK_STATION.id, "detections": [_raw_bird(2)]},
+    )
+    assert resp.status == 200
+    await hass.async_block_till_done()
+    assert station.data is None
+    assert events == []
+
+    remove()
+    await account.history.async_close()
+    await async_remove_history(hass, account.config_entry.entry_id)
+
+
+async def test_push_without_webhook_integration(hass: HomeAssistant, caplog):
+    """Test that push reports an error if the webhook integration fails."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_WEBHOOK_ID: WEBHOOK_ID})
+    entry.add_to_hass(hass)
+    account = TerraAccountCoordinator(hass, entry, MagicMock())
+    with patch(
+        "custom_components.terra_listens.webhook.async_setup_component",
+        return_value=False,
+    ):
+        assert await async_setup_webhook(hass, entry, account) is None
+    assert "webhook integration could not be set up" in caplog.text